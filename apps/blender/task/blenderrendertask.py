@@ -6,7 +6,7 @@ import random
 import time
 from collections import OrderedDict
 from copy import copy
-from typing import Optional, Type
+from typing import List, Optional, Type
 
 import apps.blender.resources.blenderloganalyser as log_analyser
 from apps.blender.blenderenvironment import BlenderEnvironment, \
@@ -149,12 +149,13 @@ class RenderingTaskTypeInfo(CoreTaskTypeInfo):
     @classmethod
     def get_task_border(cls, extra_data: dict, definition, subtasks_count,
                         as_path=False):
-        """ Return list of pixels that should be marked as a border of
-         a given extra_data
+        """ Return the border of a given extra_data
         :param RenderingTaskDefinition definition: task definition
         :param int subtasks_count: total number of subtasks used in this task
         :param int as_path: return pixels that form a border path
-        :return list: list of pixels that belong to a subtask border
+        :return list: corners of the border path if as_path is set,
+                      otherwise (x, y, width, height) rectangles covering
+                      the border pixels
         """
         start_task = extra_data['start_task']
         frames = len(definition.options.frames)
@@ -183,30 +184,26 @@ class RenderingTaskTypeInfo(CoreTaskTypeInfo):
     @classmethod
     def __get_border(cls, start, parts, res_x, res_y):
         """
-        Return list of pixels that should be marked as a border of subtasks
-        with numbers between start and end.
+        Return rectangles that cover the border of subtasks with numbers
+        between start and end.
         :param int start: number of first subtask
         :param int parts: number of parts for single frame
         :param int res_x: image resolution width
         :param int res_y: image resolution height
-        :return list: list of pixels that belong to a subtask border
+        :return list: list of (x, y, width, height) rectangles; pixels
+                      inside them belong to a subtask border
         """
-        border = []
         if res_x == 0 or res_y == 0:
-            return border
-        offsets = generate_expected_offsets(parts, res_x, res_y)
+            return []
+        offsets = _expected_offsets(parts, res_x, res_y)
         scale_factor = offsets[parts + 1] / res_y
         x = int(math.floor(res_x * scale_factor))
 
         upper = offsets[start]
         lower = offsets[start + 1]
-        for i in range(upper, lower):
-            border.append((0, i))
-            border.append((x, i))
-        for i in range(0, x):
-            border.append((i, upper))
-            border.append((i, lower))
-        return border
+        height = lower - upper
+        return [(0, upper, 1, height), (x, upper, 1, height),
+                (0, upper, x, 1), (0, lower, x, 1)]
 
     @classmethod
     def __get_border_path(cls, start, parts, res_x, res_y):
@@ -222,7 +219,7 @@ class RenderingTaskTypeInfo(CoreTaskTypeInfo):
         if res_x == 0 or res_y == 0:
             return []
 
-        offsets = generate_expected_offsets(parts, res_x, res_y)
+        offsets = _expected_offsets(parts, res_x, res_y)
         scale_factor = offsets[parts + 1] / res_y
 
         x = int(math.floor(res_x * scale_factor))
@@ -449,6 +446,27 @@ class BlenderRenderTask(FrameRenderingTask):
             self.preview_updater.restart()
             self._update_task_preview()
 
+    def journal_paths(self, subtask_id: str) -> List[tuple]:
+        paths = super().journal_paths(subtask_id)
+        subtask = self.subtasks_given.get(subtask_id)
+        if not subtask:
+            return paths
+        if self.use_frames:
+            part = self._count_part(subtask['start_task'], subtask['parts'])
+            updaters = [
+                (('preview_updaters', self.frames.index(frame)), part)
+                for frame in subtask['frames']
+            ]
+        else:
+            updaters = [(('preview_updater',), subtask['start_task'])]
+        for updater, chunk in updaters:
+            paths += [
+                updater + ('chunks', chunk),
+                updater + ('perfect_match_area_y',),
+                updater + ('perfectly_placed_subtasks',),
+            ]
+        return paths
+
     ###################
     # CoreTask methods#
     ###################
@@ -640,9 +658,17 @@ class CustomCollector(RenderingTaskCollector):
 
 
 def generate_expected_offsets(parts, res_x, res_y):
-    logger.debug('generate_expected_offsets(%r, %r, %r)', parts, res_x, res_y)
     # returns expected offsets for preview; the highest value is preview's
     # height
+    return dict(_expected_offsets(parts, res_x, res_y))
+
+
+# Borders of every subtask of a task are requested at once, each of them
+# needing the offsets table of the whole task. Callers must not modify
+# the returned dict.
+@functools.lru_cache(32)
+def _expected_offsets(parts, res_x, res_y):
+    logger.debug('generate_expected_offsets(%r, %r, %r)', parts, res_x, res_y)
     scale_factor = BlenderTaskTypeInfo.scale_factor(res_x, res_y)
     expected_offsets = {}
     previous_end = 0
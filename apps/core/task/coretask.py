@@ -98,6 +98,8 @@ class CoreTask(Task):
 
     ENVIRONMENT_CLASS: 'Type[Environment]'
 
+    JOURNAL_SUBTASK_ATTRS = ('subtasks_given', 'stdout', 'stderr', 'results')
+
     handle_key_error = HandleKeyError(log_key_error)
 
     ################
@@ -199,6 +201,17 @@ class CoreTask(Task):
     def is_docker_task(self):
         return bool(self.docker_images)
 
+    def journal_paths(self, subtask_id: str) -> List[tuple]:
+        paths = [
+            ('last_task',),
+            ('num_tasks_received',),
+            ('num_failed_subtasks',),
+        ]
+        subtask = self.subtasks_given.get(subtask_id)
+        if subtask and subtask.get('node_id'):
+            paths.append(('counting_nodes', subtask['node_id']))
+        return paths
+
     def initialize(self, dir_manager: DirManager) -> None:
         dir_manager.clear_temporary(self.header.task_id)
         self.tmp_dir = dir_manager.get_task_temporary_dir(self.header.task_id,
@@ -250,6 +250,36 @@ class FrameRenderingTask(RenderingTask):
     def subtask_status_updated(self, subtask_id: str) -> None:
         self._update_subtask_frame_status(subtask_id)
 
+    def journal_paths(self, subtask_id: str) -> List[tuple]:
+        paths = super().journal_paths(subtask_id)
+        paths.append(('last_preview_path',))
+        subtask = self.subtasks_given.get(subtask_id)
+        if not subtask:
+            return paths
+        if not self.use_frames:
+            paths += [
+                ('preview_file_path',),
+                ('preview_task_file_path',),
+                ('collected_file_names', subtask['start_task']),
+            ]
+        parts = subtask['parts']
+        part = self._count_part(subtask['start_task'], parts)
+        for frame in subtask['frames']:
+            frame_key = str(frame)
+            paths += [
+                ('frames_state', frame_key),
+                ('frames_subtasks', frame_key, part - 1),
+            ]
+            if self.use_frames:
+                index = self.frames.index(frame)
+                paths += [
+                    ('frames_given', frame_key, part if parts > 1 else 0),
+                    ('preview_file_path', index),
+                    ('preview_task_file_path', index),
+                    ('collected_file_names', frame),
+                ]
+        return paths
+
     #########################
     # Specific task methods #
     #########################
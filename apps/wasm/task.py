@@ -1,3 +1,5 @@
+import contextlib
+import hashlib
 import os
 from copy import deepcopy
 from pathlib import Path, PurePath
@@ -47,6 +49,7 @@ from .vbr import (
 )
 
 NANOSECOND = 1e-9
+RESULT_DIGEST_BLOCK_SIZE = 2 ** 20
 
 logger = logging.getLogger("apps.wasm")
 
@@ -75,7 +78,8 @@ class VbrSubtask:
         self.redundancy_factor = redundancy_factor
         self.subtasks: Dict[str, SubtaskInstance] = {}
         self.verifier = BucketVerifier(
-            redundancy_factor, WasmTask.cmp_results, referee_count=1)
+            redundancy_factor, WasmTask.cmp_results, referee_count=1,
+            key_fn=WasmTask.result_digest)
 
     def contains(self, s_id) -> bool:
         return s_id in self.subtasks
@@ -108,6 +112,12 @@ class VbrSubtask:
     def get_instances(self) -> List[str]:
         return list(self.subtasks.keys())
 
+    def needs_actors(self) -> bool:
+        return self.verifier.more_actors_needed
+
+    def get_actor_ids(self) -> List[str]:
+        return [actor.uuid for actor in self.verifier.actors]
+
     def add_result(self, s_id: str, task_result: Optional[TaskResult]):
         result_files = task_result.files if task_result else None
         self.verifier.add_result(
@@ -235,6 +245,9 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
     JOB_ENTRYPOINT = 'python3 /golem/scripts/job.py'
     REDUNDANCY_FACTOR = 1
     CALLBACKS: Dict[str, Callable] = {}
+    # `subtasks`, `_vbrsubtasks_by_id` and `_open_vbrsubtasks` share the
+    # VbrSubtask objects, which per-subtask journal records would split
+    JOURNAL_SUBTASK_ATTRS = ()
 
     def __init__(self, task_definition: WasmTaskDefinition,
                  root_path: Optional[str] = None, owner: Node = None) -> None:
@@ -245,6 +258,7 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
         self.task_definition: WasmTaskDefinition = task_definition
         self.options: WasmTaskOptions = task_definition.options
         self.subtasks: List[VbrSubtask] = []
+        self._init_index()
 
         for s_name, s_params in self.options.get_subtask_iterator():
             s_params = {
@@ -253,45 +267,122 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
             }
             subtask = VbrSubtask(self.create_subtask_id,
                                  s_name, s_params, self.REDUNDANCY_FACTOR)
-            self.subtasks.append(subtask)
+            self._add_vbrsubtask(subtask)
 
         self.nodes_blacklist: Set[str] = set()
         self._load_requestor_perf()
 
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if '_vbrsubtasks_by_id' not in state:
+            # Pickled before the index was introduced
+            subtasks, self.subtasks = self.subtasks, []
+            self._init_index()
+            for subtask in subtasks:
+                self._add_vbrsubtask(subtask)
+
+    def _init_index(self) -> None:
+        # Subtask instance id -> VbrSubtask
+        self._vbrsubtasks_by_id: Dict[str, VbrSubtask] = {}
+        # VbrSubtasks waiting for more actors, in the order they opened
+        self._open_vbrsubtasks: Dict[VbrSubtask, None] = {}
+        # Node id -> number of open VbrSubtasks the node is an actor of
+        self._node_open_count: Dict[str, int] = {}
+        self._total_tasks = 0
+        self._active_tasks = 0
+
+    @staticmethod
+    def _index_state(subtask: VbrSubtask) -> Tuple[bool, List[str], int, int]:
+        count = subtask.get_subtask_count()
+        return (
+            subtask.needs_actors(),
+            subtask.get_actor_ids(),
+            count,
+            0 if subtask.is_finished() else count,
+        )
+
+    @contextlib.contextmanager
+    def _reindexing(self, subtask: VbrSubtask):
+        """Update the index with the changes made to `subtask`
+        within the context"""
+        was_open, old_actors, old_total, old_active = \
+            self._index_state(subtask)
+        try:
+            yield
+        finally:
+            is_open, actors, total, active = self._index_state(subtask)
+            self._total_tasks += total - old_total
+            self._active_tasks += active - old_active
+
+            if was_open:
+                for node_id in old_actors:
+                    self._node_open_count[node_id] -= 1
+                    if not self._node_open_count[node_id]:
+                        del self._node_open_count[node_id]
+            if is_open:
+                for node_id in actors:
+                    self._node_open_count[node_id] = \
+                        self._node_open_count.get(node_id, 0) + 1
+                # Keep the position of a subtask that stays open
+                self._open_vbrsubtasks.setdefault(subtask, None)
+            else:
+                self._open_vbrsubtasks.pop(subtask, None)
+
+    def _add_vbrsubtask(self, subtask: VbrSubtask) -> None:
+        self.subtasks.append(subtask)
+        is_open, actors, total, active = self._index_state(subtask)
+        self._total_tasks += total
+        self._active_tasks += active
+        for s_id in subtask.get_instances():
+            self._vbrsubtasks_by_id[s_id] = subtask
+        if is_open:
+            for node_id in actors:
+                self._node_open_count[node_id] = \
+                    self._node_open_count.get(node_id, 0) + 1
+            self._open_vbrsubtasks[subtask] = None
+
     def query_extra_data(
             self, perf_index: float,
             node_id: Optional[str] = None,
             node_name: Optional[str] = None) -> Task.ExtraData:
-        for s in self.subtasks:
-            if s.is_finished():
+        # The node is an actor of at most `_node_open_count[node_id]`
+        # open subtasks, so the loop ends after that many iterations + 1
+        for s in self._open_vbrsubtasks:
+            if not s.is_allowed_node(node_id):
                 continue
-            next_subtask = s.new_instance(node_id)
-            if next_subtask:
-                s_id, s_params = next_subtask
-                self.subtasks_given[s_id] = dict(
-                    status=SubtaskStatus.starting, node_id=node_id)
-                ctd = self._new_compute_task_def(s_id, s_params, perf_index)
-
-                return Task.ExtraData(ctd=ctd)
+            with self._reindexing(s):
+                s_id, s_params = s.new_instance(node_id)
+            self._vbrsubtasks_by_id[s_id] = s
+            self.subtasks_given[s_id] = dict(
+                status=SubtaskStatus.starting, node_id=node_id)
+            ctd = self._new_compute_task_def(s_id, s_params, perf_index)
+
+            return Task.ExtraData(ctd=ctd)
         raise RuntimeError()
 
     def _find_vbrsubtask_by_id(self, subtask_id) -> VbrSubtask:
-        for subtask in self.subtasks:
-            if subtask.contains(subtask_id):
-                return subtask
-        raise KeyError()
+        return self._vbrsubtasks_by_id[subtask_id]
 
     @staticmethod
     def cmp_results(result_list_a: List[Any],
                     result_list_b: List[Any]) -> bool:
         logger.debug("Comparing: %s and %s", result_list_a, result_list_b)
-        for r1, r2 in zip(result_list_a, result_list_b):
-            with open(r1, 'rb') as f1, open(r2, 'rb') as f2:
-                b1 = f1.read()
-                b2 = f2.read()
-                if b1 != b2:
-                    return False
-        return True
+        return WasmTask.result_digest(result_list_a) == \
+            WasmTask.result_digest(result_list_b)
+
+    @staticmethod
+    def result_digest(result_files: List[str]) -> Tuple[bytes, ...]:
+        """SHA-256 digests of the result files, in order. Files are read
+        in blocks, so memory usage doesn't depend on the result size."""
+        digests = []
+        for result_file in result_files:
+            sha = hashlib.sha256()
+            with open(result_file, 'rb') as f:
+                for block in iter(
+                        lambda f=f: f.read(RESULT_DIGEST_BLOCK_SIZE), b''):
+                    sha.update(block)
+            digests.append(sha.digest())
+        return tuple(digests)
 
     def _resolve_subtasks_statuses(self, subtask: VbrSubtask):
         verdicts = subtask.get_verdicts()
@@ -325,7 +416,7 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
         else:
             new_subtask = VbrSubtask(self.create_subtask_id, subtask.name,
                                      subtask.params, subtask.redundancy_factor)
-            self.subtasks.append(new_subtask)
+            self._add_vbrsubtask(new_subtask)
 
     def computation_finished(
             self, subtask_id: str, task_result: TaskResult,
@@ -341,7 +432,8 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
         task_result.files = self.results[subtask_id]
 
         subtask = self._find_vbrsubtask_by_id(subtask_id)
-        subtask.add_result(subtask_id, task_result)
+        with self._reindexing(subtask):
+            subtask.add_result(subtask_id, task_result)
 
         if subtask.is_finished():
             self._resolve_subtasks_statuses(subtask)
@@ -443,9 +535,10 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
             logger.info("Node %s has been blacklisted for this task", node_id)
             return AcceptClientVerdict.REJECTED
 
-        for s in self.subtasks:
-            if s.is_allowed_node(node_id):
-                return AcceptClientVerdict.ACCEPTED
+        # Some subtask needs more actors and the node isn't one of them yet
+        if len(self._open_vbrsubtasks) > \
+                self._node_open_count.get(node_id, 0):
+            return AcceptClientVerdict.ACCEPTED
 
         # No subtask has yielded next actor meaning that there is no work
         # to be done at the moment
@@ -463,14 +556,16 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
         return not self.finished_computation()
 
     def finished_computation(self):
-        finished = all([subtask.is_finished() for subtask in self.subtasks])
+        # Every unfinished subtask counts at least one active task
+        finished = self._active_tasks == 0
         logger.debug("Finished computation: %d", finished)
         return finished
 
     def computation_failed(self, subtask_id: str, ban_node: bool = True):
         subtask = self._find_vbrsubtask_by_id(subtask_id)
         try:
-            subtask.add_result(subtask_id, None)
+            with self._reindexing(subtask):
+                subtask.add_result(subtask_id, None)
         except ValueError:
             # Handle a case of duplicate call from __remove_old_tasks
             pass
@@ -482,13 +577,10 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
         return self.finished_computation()
 
     def get_total_tasks(self):
-        return sum([s.get_subtask_count() for s in self.subtasks])
+        return self._total_tasks
 
     def get_active_tasks(self):
-        return sum(
-            [0 if s.is_finished() else s.get_subtask_count()
-             for s in self.subtasks]
-        )
+        return self._active_tasks
 
     def get_tasks_left(self):
         return self.get_active_tasks()
@@ -544,11 +636,10 @@ class WasmTask(CoreTask):  # pylint: disable=too-many-public-methods
             subtask_id,
             new_state: Optional[SubtaskStatus] = None,
     ):
-        for vbr_subtask in self.subtasks:
-            try:
+        vbr_subtask = self._vbrsubtasks_by_id.get(subtask_id)
+        if vbr_subtask is not None:
+            with self._reindexing(vbr_subtask):
                 vbr_subtask.restart_subtask(subtask_id)
-            except KeyError:
-                pass
         self.subtasks_given[subtask_id]['status'] = SubtaskStatus.restarted
 
 
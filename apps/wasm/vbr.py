@@ -1,6 +1,7 @@
+import operator
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Callable, Any, List, Tuple, Optional, Dict
+from typing import Callable, Any, Hashable, List, Tuple, Optional, Dict
 
 
 class Actor:
@@ -129,15 +130,22 @@ class Bucket:
 
 # pylint:disable=too-many-instance-attributes
 class BucketVerifier(VerificationByRedundancy):
+    """When `key_fn` is given, it is called once for every added result
+    and results are put into buckets by equality of their keys (e.g.
+    digests), instead of comparing them with `comparator`."""
+
     def __init__(self,
                  redundancy_factor: int,
                  comparator: Callable[[Any, Any], bool],
-                 referee_count: int) -> None:
+                 referee_count: int,
+                 key_fn: Optional[Callable[[Any], Hashable]] = None) -> None:
         super().__init__(redundancy_factor, comparator)
+        self.key_fn = key_fn
         self.actors: List[Actor] = []
         self.results: Dict[Actor, Any] = {}
         self.more_actors_needed = True
         self.buckets: List[Bucket] = []
+        self.buckets_by_key: Dict[Hashable, Bucket] = {}
         self.verdicts: Optional[List[Tuple[Actor, Any, VerificationResult]]]\
             = None
         self.normal_actor_count = redundancy_factor + 1
@@ -145,6 +153,13 @@ class BucketVerifier(VerificationByRedundancy):
         self.majority = (self.normal_actor_count + self.referee_count) // 2 + 1
         self.max_actor_cnt = self.normal_actor_count + self.referee_count
 
+    def __setstate__(self, state):
+        # Pickled before results could be bucketed by key, the results
+        # added so far are in buckets compared with `comparator`
+        state.setdefault('key_fn', None)
+        state.setdefault('buckets_by_key', {})
+        self.__dict__.update(state)
+
     def validate_actor(self, actor):
         if actor in self.actors:
             raise NotAllowedError
@@ -175,7 +190,9 @@ class BucketVerifier(VerificationByRedundancy):
         self.results[actor] = result
 
         # None represents no result, hence is not counted
-        if result is not None:
+        if result is not None and self.key_fn is not None:
+            self._add_to_keyed_bucket(self.key_fn(result), actor)
+        elif result is not None:
             found = False
             for bucket in self.buckets:
                 if bucket.try_add(key=result, value=actor):
@@ -189,6 +206,15 @@ class BucketVerifier(VerificationByRedundancy):
         # this will set self.more_actors_needed
         self.compute_verdicts()
 
+    def _add_to_keyed_bucket(self, key: Hashable, actor: Actor) -> None:
+        bucket = self.buckets_by_key.get(key)
+        if bucket is not None:
+            bucket.values.append(actor)
+            return
+        bucket = Bucket(operator.eq, key=key, value=actor)
+        self.buckets.append(bucket)
+        self.buckets_by_key[key] = bucket
+
     def get_verdicts(self) -> Optional[List[Tuple[Actor, Any,
                                                   VerificationResult]]]:
         return self.verdicts
@@ -50,6 +50,10 @@ NETWORK_CHECK_INTERVAL = 10.0
 MASK_UPDATE_INTERVAL = 30.0
 MAX_SENDING_DELAY = 360
 OFFER_POOLING_INTERVAL = 15.0
+# RPC events (see golem.rpc.session.CoalescingPublisher)
+LEGACY_EVENT_TOPICS = 0
+TASK_EVENTS_BATCH_WINDOW = 0.5
+SUBTASK_EVENTS_BATCH_WINDOW = 0.5
 # How frequently task archive should be saved to disk (in seconds)
 TASKARCHIVE_MAINTENANCE_INTERVAL = 30
 # Filename for task archive disk file
@@ -174,6 +178,8 @@ class AppConfig:
             mask_update_interval=MASK_UPDATE_INTERVAL,
             max_results_sending_delay=MAX_SENDING_DELAY,
             offer_pooling_interval=OFFER_POOLING_INTERVAL,
+            task_events_batch_window=TASK_EVENTS_BATCH_WINDOW,
+            subtask_events_batch_window=SUBTASK_EVENTS_BATCH_WINDOW,
             # timeouts
             p2p_session_timeout=P2P_SESSION_TIMEOUT,
             task_session_timeout=TASK_SESSION_TIMEOUT,
@@ -185,6 +191,7 @@ class AppConfig:
             clean_tasks_older_than_seconds=CLEAN_TASKS_OLDER_THAN_SECONDS,
             cleaning_enabled=CLEANING_ENABLED,
             debug_third_party=DEBUG_THIRD_PARTY,
+            legacy_event_topics=LEGACY_EVENT_TOPICS,
             # network masking
             net_masking_enabled=NET_MASKING_ENABLED,
             initial_mask_size_factor=INITIAL_MASK_SIZE_FACTOR,
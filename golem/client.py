@@ -37,6 +37,7 @@ from golem.appconfig import TASKARCHIVE_MAINTENANCE_INTERVAL, AppConfig
 from golem.apps.default import APPS
 from golem.clientconfigdescriptor import ConfigApprover, ClientConfigDescriptor
 from golem.core import variables
+from golem.core.cache import MemCacheMixin
 from golem.core.common import (
     get_timestamp_utc,
     node_info_str,
@@ -75,20 +76,30 @@ from golem.network.upnp.mapper import PortMapperManager
 from golem.ranking.ranking import Ranking
 from golem.report import Component, Stage, StatusPublisher, report_calls
 from golem.resource.base.resourceserver import BaseResourceServer
-from golem.resource.dirmanager import DirManager, DirectoryType
+from golem.resource.dirmanager import (
+    CLEAR_DIR_WORKERS,
+    DirManager,
+    DirectoryType,
+)
 from golem.resource.hyperdrive.resourcesmanager import HyperdriveResourceManager
 from golem.rpc import utils as rpc_utils
 from golem.rpc.mapping.rpceventnames import Task, Network, Environment, UI
+from golem.rpc.session import CoalescingPublisher
 from golem.task import taskpreset, taskstate
 from golem.task.helpers import calculate_subtask_payment
 from golem.task.taskarchiver import TaskArchiver
 from golem.task.taskserver import TaskServer
 from golem.task.tasktester import TaskTester
+from golem.tools import memoryhelper
 from golem.tools.os_info import OSInfo
 from golem.tools.talkback import enable_sentry_logger
 
 logger = logging.getLogger(__name__)
 
+# Dicts of completed tasks are cached for this long; this picks up
+# changes which don't trigger task state notifications, e.g. payments
+TASK_DICT_CACHE_TTL = 60  # s
+
 
 if TYPE_CHECKING:
     # pylint: disable=unused-import
@@ -191,6 +202,7 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
                 self,
                 int(self.config_desc.network_check_interval)),
             TaskArchiverService(self.task_archiver),
+            NodesKeeperService(),
             MessageHistoryService(),
             DoWorkService(self),
             DailyJobsService(self),
@@ -221,7 +233,9 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         self.daemon_manager = None
 
         self.rpc_publisher = None
+        self._event_coalescer: Optional[CoalescingPublisher] = None
         self.task_test_result: Optional[Dict[str, Any]] = None
+        self._task_dicts = MemCacheMixin()
 
         self.resource_server = None
         self.resource_port = 0
@@ -257,6 +271,20 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
 
     def set_rpc_publisher(self, rpc_publisher):
         self.rpc_publisher = rpc_publisher
+        self._event_coalescer = CoalescingPublisher(rpc_publisher) \
+            if rpc_publisher else None
+        self._configure_event_coalescer()
+
+    def _configure_event_coalescer(self):
+        if not self._event_coalescer:
+            return
+        self._event_coalescer.windows = {
+            Task.evt_task_status: self.config_desc.task_events_batch_window,
+            Task.evt_subtask_status:
+                self.config_desc.subtask_events_batch_window,
+        }
+        self._event_coalescer.legacy_topics = \
+            bool(self.config_desc.legacy_event_topics)
 
     def get_wamp_rpc_mapping(self):
         from apps.rendering.task import framerenderingtask
@@ -331,15 +359,19 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
             # main twisteds reactor thread
             return
 
+        task_id = kwargs['task_id']
+        self._task_dicts.cache_invalidate(task_id)
         if op is not None and op.subtask_related():
-            self._publish(Task.evt_subtask_status, kwargs['task_id'],
-                          kwargs['subtask_id'], op.value)
+            subtask_id = kwargs['subtask_id']
+            self._publish_coalesced(Task.evt_subtask_status,
+                                    (task_id, subtask_id),
+                                    task_id, subtask_id, op.value)
         else:
             op_class_name: str = op.__class__.__name__ \
                 if op is not None else None
             op_value: int = op.value if op is not None else None
-            self._publish(Task.evt_task_status, kwargs['task_id'],
-                          op_class_name, op_value)
+            self._publish_coalesced(Task.evt_task_status, (task_id, None),
+                                    task_id, op_class_name, op_value)
 
     def taskserver_listener(
             self,
@@ -384,6 +416,8 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
     @report_calls(Component.client, 'stop', stage=Stage.post)
     def stop(self):
         logger.debug('Stopping client services ...')
+        if self._event_coalescer:
+            self._event_coalescer.flush()
         self.stop_network()
 
         for service in self._services:
@@ -708,6 +742,7 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         dispatcher.send(signal='golem.monitor', event='shutdown')
 
         if self.db:
+            model.db_executor.stop()
             self.db.close()
 
     def resource_collected(self, res_id):
@@ -768,6 +803,7 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         logger.debug('Deleting task "%r" ...', task_id)
         self.task_server.remove_task_header(task_id)
         self.remove_task(task_id)
+        self._task_dicts.cache_invalidate(task_id)
         rtm = self.task_server.requested_task_manager
         is_active = False
         if rtm.task_exists(task_id):
@@ -900,6 +936,21 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
 
     @rpc_utils.expose('comp.task')
     def get_task(self, task_id: str) -> Optional[dict]:
+        lastmod = self._task_dicts.cache_lastmod(task_id)
+        if lastmod is not None \
+                and time.time() - lastmod <= TASK_DICT_CACHE_TTL:
+            return copy(self._task_dicts.cache_get(task_id))
+
+        task_dict = self._build_task_dict(task_id)
+        # Progress and timing of the other tasks change
+        # without sending any notifications
+        if task_dict and taskstate.TaskStatus(task_dict['status']) \
+                .is_completed():
+            self._task_dicts.cache_set(task_id, task_dict)
+            return copy(task_dict)
+        return task_dict
+
+    def _build_task_dict(self, task_id: str) -> Optional[dict]:
         assert isinstance(self.task_server, TaskServer)
 
         task_dict = self.task_server.task_manager.get_task_dict(task_id)
@@ -1010,11 +1061,20 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         return task_dict
 
     @rpc_utils.expose('comp.tasks')
-    def get_tasks(
+    def get_tasks(  # pylint: disable=too-many-arguments
             self,
             task_id: Optional[str] = None,
             return_created_tasks_only: bool = False,
+            offset: int = 0,
+            limit: Optional[int] = None,
+            statuses: Optional[List[str]] = None,
     ) -> Union[Optional[dict], Iterable[dict]]:
+        """ Returns tasks ordered by their start time
+
+        :param offset: number of tasks to skip
+        :param limit: maximum number of tasks to return, all if None
+        :param statuses: return only the tasks with one of these statuses
+        """
         if not self.task_server:
             return []
 
@@ -1028,14 +1088,16 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         task_keys.update(tm.tasks.keys())
         task_keys.update(rtm.get_requested_task_ids())
 
-        tasks = (self.get_task(task_id) for task_id in sorted(task_keys))
-        filter_fn = None
-
+        tasks = filter(None, map(self.get_task, sorted(task_keys)))
         if return_created_tasks_only:
-            filter_fn = self._filter_task_created_status
+            tasks = filter(self._filter_task_created_status, tasks)
+        if statuses is not None:
+            status_set = set(statuses)
+            tasks = (task for task in tasks if task['status'] in status_set)
 
-        filtered_tasks = list(filter(filter_fn, tasks))
-        return sorted(filtered_tasks, key=lambda task: task['time_started'])
+        ordered = sorted(tasks, key=lambda task: task['time_started'])
+        end = None if limit is None else offset + limit
+        return ordered[offset:end]
 
     @staticmethod
     def _filter_task_created_status(task: Dict) -> bool:
@@ -1240,6 +1302,7 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
                                            run_benchmarks=run_benchmarks)
 
         self.enable_talkback(bool(self.config_desc.enable_talkback))
+        self._configure_event_coalescer()
         self.app_config.change_config(self.config_desc)
 
         dispatcher.send(
@@ -1302,14 +1365,19 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         raise Exception("Unknown dir type: {}".format(dir_type))
 
     def remove_distributed_files(self, older_than_seconds: int = 0):
-        dir_manager = DirManager(self.datadir)
-        dir_manager.clear_dir(self.get_distributed_files_dir(),
-                              older_than_seconds)
+        self._clear_dir(self.get_distributed_files_dir(), older_than_seconds)
 
     def remove_received_files(self, older_than_seconds: int = 0):
+        self._clear_dir(self.get_received_files_dir(), older_than_seconds)
+
+    def _clear_dir(self, path: str, older_than_seconds: int) -> None:
         dir_manager = DirManager(self.datadir)
-        dir_manager.clear_dir(
-            self.get_received_files_dir(), older_than_seconds)
+        cleared = dir_manager.clear_dir(
+            path, older_than_seconds, workers=CLEAR_DIR_WORKERS)
+        logger.info(
+            'Directory cleared. path=%r, files=%d, dirs=%d, size=%s',
+            path, cleared.files, cleared.dirs,
+            memoryhelper.dir_size_to_display(cleared.bytes))
 
     def remove_task(self, task_id):
         self.p2pservice.remove_task(task_id)
@@ -1411,6 +1479,10 @@ class Client:  # noqa pylint: disable=too-many-instance-attributes,too-many-publ
         if self.rpc_publisher:
             self.rpc_publisher.publish(event_name, *args, **kwargs)
 
+    def _publish_coalesced(self, event_name, key, *args):
+        if self._event_coalescer:
+            self._event_coalescer.publish_coalesced(event_name, key, *args)
+
     def lock_config(self, on=True):
         self._publish(UI.evt_lock_config, on)
 
@@ -1640,6 +1712,18 @@ class TaskArchiverService(LoopingCallService):
         self._task_archiver.do_maintenance()
 
 
+class NodesKeeperService(LoopingCallService):
+    def __init__(self) -> None:
+        super().__init__(interval_seconds=nodeskeeper.FLUSH_INTERVAL)
+
+    def stop(self):
+        super().stop()
+        nodeskeeper.flush()
+
+    def _run(self):
+        nodeskeeper.flush()
+
+
 class ResourceCleanerService(LoopingCallService):
     def __init__(self,
                  client: Client,
@@ -40,6 +40,8 @@ class ClientConfigDescriptor(object):
         self.clean_tasks_older_than_seconds = 0
         self.cleaning_enabled = 0
         self.offer_pooling_interval = 0.0
+        self.task_events_batch_window = 0.0
+        self.subtask_events_batch_window = 0.0
 
         self.node_snapshot_interval = 0.0
         self.network_check_interval = 0.0
@@ -60,6 +62,7 @@ class ClientConfigDescriptor(object):
         self.accept_tasks = 1
         self.debug_third_party = 0
         self.in_shutdown = 0
+        self.legacy_event_topics = 0
 
         self.net_masking_enabled = 0
         self.initial_mask_size_factor = 0
@@ -106,13 +109,15 @@ class ConfigApprover(object):
     to_int_opt = {
         'seed_port', 'num_cores', 'opt_peer_num', 'p2p_session_timeout',
         'task_session_timeout', 'pings_interval', 'max_results_sending_delay',
+        'legacy_event_topics',
     }
     to_big_int_opt = {
         'min_price', 'max_price',
     }
     to_float_opt = {
         'getting_peers_interval', 'getting_tasks_interval', 'computing_trust',
-        'requesting_trust'
+        'requesting_trust', 'task_events_batch_window',
+        'subtask_events_batch_window',
     }
 
     def __init__(self, config_desc):
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 class CacheEntry:
     value: object
     timestamp: float
+    stale: bool = False
 
 
 class MemCacheMixin:
@@ -34,6 +35,42 @@ class MemCacheMixin:
         entry = CacheEntry(value=value, timestamp=time.time())
         self._cache[key] = entry
 
+    def cache_get_or_update(
+            self,
+            key,
+            max_age: float,
+            update_fn: typing.Callable[[], object],
+    ) -> object:
+        """Returns value if it's not older than `max_age` seconds
+
+        Otherwise calls `update_fn`, stores and returns its result.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and not entry.stale \
+                and time.time() - entry.timestamp <= max_age:
+            return entry.value
+        value = update_fn()
+        self.cache_set(key, value)
+        return value
+
+    def cache_invalidate(self, *keys) -> None:
+        """Removes given keys or, if none are given, all the entries"""
+        if not keys:
+            self._cache.clear()
+        for key in keys:
+            self._cache.pop(key, None)
+
+    def cache_mark_stale(self, *keys) -> None:
+        """Keeps the values of given keys, but makes them due for an update"""
+        for key in keys:
+            if key in self._cache:
+                self._cache[key].stale = True
+
+    def cache_is_stale(self, key) -> bool:
+        """True if the key is missing or was marked stale since it was set"""
+        entry = self._cache.get(key)
+        return entry is None or entry.stale
+
     def cache_lastmod(self, key) -> typing.Optional[float]:
         try:
             return self._cache[key].timestamp
@@ -0,0 +1,118 @@
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Callable, Optional
+
+from twisted.internet import defer
+from twisted.python.failure import Failure
+
+logger = logging.getLogger('golem.db')
+
+DEFAULT_READERS = 4
+
+
+class DatabaseExecutor:
+    """ Runs peewee queries outside of the reactor thread.
+
+    All writes go through a single writer thread, which serialises them
+    the same way SQLite does and keeps their relative order. Reads are
+    spread over a pool of reader threads; the database uses thread local
+    connections and WAL journaling, so readers don't block the writer and
+    vice versa. A read may not see a write that is still queued; use
+    `write()` for sequences that must observe their own changes.
+
+    Until `start()` is called (and after `stop()`) functions are executed
+    synchronously in the calling thread, so `golem.model.db_executor`
+    can be used unconditionally, e.g. in tests without a running reactor.
+    """
+
+    def __init__(self, readers: int = DEFAULT_READERS) -> None:
+        self._readers = readers
+        self._writer_pool: Optional[concurrent.futures.Executor] = None
+        self._reader_pool: Optional[concurrent.futures.Executor] = None
+
+    @property
+    def running(self) -> bool:
+        return self._writer_pool is not None
+
+    def start(self) -> None:
+        if self.running:
+            return
+        logger.debug('Starting database executor. readers=%d', self._readers)
+        self._writer_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='db-writer',
+        )
+        self._reader_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._readers,
+            thread_name_prefix='db-reader',
+        )
+
+    def stop(self) -> None:
+        """ Wait for the queued queries and switch to synchronous mode """
+        if not self.running:
+            return
+        logger.debug('Stopping database executor')
+        writer_pool, self._writer_pool = self._writer_pool, None
+        reader_pool, self._reader_pool = self._reader_pool, None
+        reader_pool.shutdown(wait=True)  # type: ignore
+        writer_pool.shutdown(wait=True)  # type: ignore
+
+    def read(self, fn: Callable, *args, **kwargs) -> defer.Deferred:
+        """ Run a read-only `fn` in a reader thread """
+        return self._defer(self._reader_pool, fn, *args, **kwargs)
+
+    def write(self, fn: Callable, *args, **kwargs) -> defer.Deferred:
+        """ Run `fn` in the writer thread, after all previous writes """
+        return self._defer(self._writer_pool, fn, *args, **kwargs)
+
+    async def run_read(self, fn: Callable, *args, **kwargs) -> Any:
+        return await self._run(self._reader_pool, fn, *args, **kwargs)
+
+    async def run_write(self, fn: Callable, *args, **kwargs) -> Any:
+        return await self._run(self._writer_pool, fn, *args, **kwargs)
+
+    def _submit(self, pool: Optional[concurrent.futures.Executor],
+                fn: Callable, *args, **kwargs) \
+            -> Optional[concurrent.futures.Future]:
+        if pool is None:
+            return None
+        try:
+            return pool.submit(fn, *args, **kwargs)
+        except RuntimeError:
+            # Shut down in the meantime
+            return None
+
+    def _defer(self, pool: Optional[concurrent.futures.Executor],
+               fn: Callable, *args, **kwargs) -> defer.Deferred:
+        future = self._submit(pool, fn, *args, **kwargs)
+        if future is None:
+            return defer.maybeDeferred(fn, *args, **kwargs)
+
+        from twisted.internet import reactor
+        deferred = defer.Deferred()
+
+        def fire(done: concurrent.futures.Future) -> None:
+            exc = done.exception()
+            if exc is None:
+                deferred.callback(done.result())
+            else:
+                deferred.errback(Failure(exc, type(exc), exc.__traceback__))
+
+        future.add_done_callback(
+            lambda done: reactor.callFromThread(fire, done))
+        return deferred
+
+    async def _run(self, pool: Optional[concurrent.futures.Executor],
+                   fn: Callable, *args, **kwargs) -> Any:
+        future = self._submit(pool, fn, *args, **kwargs)
+        if future is None:
+            return fn(*args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+
+def log_failure(failure: Failure, description: str) -> None:
+    """ Errback for fire-and-forget writes """
+    logger.warning('%s failed: %s', description, failure.getErrorMessage())
+    logger.debug('%s traceback:\n%s', description, failure.getTraceback())
+
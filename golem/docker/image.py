@@ -1,5 +1,7 @@
 import logging
-from typing import Dict, Union, Tuple
+import time
+from threading import Lock
+from typing import Dict, Optional, Union, Tuple
 
 import requests.exceptions
 
@@ -9,9 +11,16 @@ from .client import local_client
 
 log = logging.getLogger(__name__)
 
+# Seconds for which the result of an availability check is reused
+AVAILABILITY_TTL = 60.0
+
 
 class DockerImage(object):
 
+    # (name, id) -> (available, monotonic time of the check)
+    _availability: Dict[Tuple[str, Optional[str]], Tuple[bool, float]] = {}
+    _availability_lock = Lock()
+
     def __init__(self, repository=None, image_id=None, tag=None):
         self.repository = repository
         self.id = image_id
@@ -42,7 +51,34 @@ class DockerImage(object):
             return DockerImage(**di)
         return di
 
-    def is_available(self):
+    @classmethod
+    def clear_availability_cache(cls) -> None:
+        """ Forget cached availability checks, e.g. after images
+        have been pulled or built """
+        with cls._availability_lock:
+            cls._availability.clear()
+
+    def is_available(self) -> bool:
+        key = (self.name, self.id)
+        with self._availability_lock:
+            cached = self._availability.get(key)
+        if cached is not None:
+            available, checked_at = cached
+            if time.monotonic() - checked_at < AVAILABILITY_TTL:
+                return available
+
+        try:
+            available = self._check_availability()
+        except requests.exceptions.ConnectionError:
+            # Don't cache, the daemon may come back any time
+            log.debug("DockerImage Can't connect", exc_info=True)
+            return False
+
+        with self._availability_lock:
+            self._availability[key] = (available, time.monotonic())
+        return available
+
+    def _check_availability(self) -> bool:
         client = local_client()
         try:
             if self.id:
@@ -61,6 +97,3 @@ class DockerImage(object):
         except ValueError:
             log.debug('DockerImage ValueError', exc_info=True)
             return False
-        except requests.exceptions.ConnectionError:
-            log.debug("DockerImage Can't connect", exc_info=True)
-            return False
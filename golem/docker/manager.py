@@ -15,6 +15,7 @@ from golem.docker.config import DockerConfigManager, APPS_DIR, IMAGES_INI, \
 from golem.docker.hypervisor.docker_for_mac import DockerForMac
 from golem.docker.hypervisor.hyperv import HyperVHypervisor
 from golem.docker.hypervisor.virtualbox import VirtualBoxHypervisor
+from golem.docker.image import DockerImage
 from golem.docker.task_thread import DockerBind
 from golem.report import report_calls, Component
 
@@ -250,6 +251,8 @@ class DockerManager(DockerConfigManager):
             finally:
                 os.chdir(cwd)
 
+        DockerImage.clear_availability_cache()
+
     def pull_images(self):
         entries = []
 
@@ -271,6 +274,8 @@ class DockerManager(DockerConfigManager):
             version = self._image_version(entry)
             self._pull_image(version)
 
+        DockerImage.clear_availability_cache()
+
     @report_calls(Component.docker, 'images.pull')
     def _pull_image(self, version):
         logger.warning('Docker: pulling image %r', version)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import logging
 import time
+from collections import defaultdict
+from typing import Dict, List
 
 from ethereum.utils import denoms
 from pydispatch import dispatcher
@@ -11,10 +13,21 @@ from golem.core.variables import PAYMENT_DEADLINE
 logger = logging.getLogger(__name__)
 
 
+# Keep the number of bound parameters below the SQLite limit
+BULK_UPDATE_CHUNK_SIZE = 500
+
+
 class IncomesKeeper:
     """Keeps information about payments received from other nodes
+
+    :param per_income_events: send a `confirmed` event for every income
+        settled by a batch transfer instead of the aggregated
+        `confirmed_batch` one
     """
 
+    def __init__(self, per_income_events: bool = False) -> None:
+        self.per_income_events = per_income_events
+
     @staticmethod
     def received_transfer(
             tx_hash: str,
@@ -35,24 +48,39 @@ class IncomesKeeper:
             gas_cost=0,
         )
 
-    @staticmethod
-    def received_batch_transfer(
+    def received_batch_transfer(  # pylint: disable=too-many-locals
+            self,
             tx_hash: str,
             sender: str,
             amount: int,
             closure_time: int,
             charged_from_deposit: bool = False,
     ) -> None:
-
-        expected = model.TaskPayment.incomes().where(
-            model.WalletOperation.sender_address == sender,
-            model.TaskPayment.accepted_ts > 0,
-            model.TaskPayment.accepted_ts <= closure_time,
-            model.WalletOperation.tx_hash.is_null(),
-            model.TaskPayment.settled_ts.is_null(),
+        # Amounts are stored as hex strings so they can't be summed in SQL;
+        # fetch only the needed columns without building model instances
+        expected = list(
+            model.TaskPayment.incomes()
+            .select(
+                model.TaskPayment.id,
+                model.WalletOperation.id,
+                model.TaskPayment.expected_amount,
+                model.WalletOperation.amount,
+            )
+            .where(
+                model.WalletOperation.sender_address == sender,
+                model.TaskPayment.accepted_ts > 0,
+                model.TaskPayment.accepted_ts <= closure_time,
+                model.WalletOperation.tx_hash.is_null(),
+                model.TaskPayment.settled_ts.is_null(),
+            )
+            .order_by(model.TaskPayment.id)
+            .tuples()
         )
 
-        expected_value = sum([e.missing_amount for e in expected])
+        expected_value = sum(
+            expected_amount - current_amount
+            for _, _, expected_amount, current_amount in expected
+        )
         if expected_value == 0:
             # Probably already handled event
             return
@@ -64,24 +92,55 @@ class IncomesKeeper:
                 amount / denoms.ether)
 
         amount_left = amount
+        # New wallet operation amount -> wallet operation ids
+        by_amount: Dict[int, List[int]] = defaultdict(list)
+        confirmed_amounts: List[int] = []
 
-        for e in expected:
-            received = min(amount_left, e.expected_amount)
-            e.wallet_operation.amount += received
+        for _, wallet_operation_id, expected_amount, current_amount \
+                in expected:
+            received = min(amount_left, expected_amount)
             amount_left -= received
-            e.wallet_operation.tx_hash = tx_hash
-            e.wallet_operation.status = model.WalletOperation.STATUS.confirmed
-            e.wallet_operation.save()
-            e.charged_from_deposit = charged_from_deposit
-            e.save()
+            new_amount = current_amount + received
+            by_amount[new_amount].append(wallet_operation_id)
+            if new_amount == expected_amount:
+                confirmed_amounts.append(new_amount)
+
+        with model.db.transaction():
+            for new_amount, ids in by_amount.items():
+                for chunk in _chunks(ids):
+                    model.WalletOperation.update(
+                        amount=new_amount,
+                        tx_hash=tx_hash,
+                        status=model.WalletOperation.STATUS.confirmed,
+                    ).where(
+                        model.WalletOperation.id.in_(chunk),
+                    ).execute()
+            for chunk in _chunks([row[0] for row in expected]):
+                model.TaskPayment.update(
+                    charged_from_deposit=charged_from_deposit,
+                ).where(
+                    model.TaskPayment.id.in_(chunk),
+                ).execute()
 
-            if e.missing_amount == 0:
+        if not confirmed_amounts:
+            return
+
+        if self.per_income_events:
+            for confirmed_amount in confirmed_amounts:
                 dispatcher.send(
                     signal='golem.income',
                     event='confirmed',
-                    node_id=e.wallet_operation.sender_address,
-                    amount=e.wallet_operation.amount,
+                    node_id=sender,
+                    amount=confirmed_amount,
                 )
+            return
+        dispatcher.send(
+            signal='golem.income',
+            event='confirmed_batch',
+            node_id=sender,
+            amount=sum(confirmed_amounts),
+            count=len(confirmed_amounts),
+        )
 
     def received_forced_payment(
             self,
@@ -193,29 +252,56 @@ class IncomesKeeper:
     def update_overdue_incomes() -> None:
         """
         Set overdue flag for all incomes that have been waiting for too long.
-        :return: Updated incomes
+        Flags are set with a single UPDATE, in the same transaction as
+        the query for the incomes the listeners are notified about.
         """
         accepted_ts_deadline = int(time.time()) - PAYMENT_DEADLINE
-
-        incomes = list(model.TaskPayment.incomes().where(
+        pending = (
+            model.WalletOperation.operation_type
+            == model.WalletOperation.TYPE.task_payment,
+            model.WalletOperation.direction
+            == model.WalletOperation.DIRECTION.incoming,
             model.WalletOperation.status !=
             model.WalletOperation.STATUS.overdue,
             model.WalletOperation.tx_hash.is_null(True),
-            model.TaskPayment.accepted_ts < accepted_ts_deadline,
-        ))
+        )
 
-        if not incomes:
-            return
+        with model.db.transaction():
+            incomes = list(
+                model.TaskPayment.select(
+                    model.TaskPayment,
+                    model.WalletOperation,
+                ).join(model.WalletOperation).where(
+                    model.TaskPayment.accepted_ts < accepted_ts_deadline,
+                    *pending,
+                )
+            )
+            if not incomes:
+                return
+
+            model.WalletOperation.update(
+                status=model.WalletOperation.STATUS.overdue,
+            ).where(
+                model.WalletOperation.id.in_(
+                    model.TaskPayment.select(
+                        model.TaskPayment.wallet_operation,
+                    ).where(
+                        model.TaskPayment.accepted_ts < accepted_ts_deadline,
+                    )
+                ),
+                *pending,
+            ).execute()
 
+        log_incomes = logger.isEnabledFor(logging.DEBUG)
         for income in incomes:
-            logger.debug(
-                "Marking payment as overdue. sender=%s, amount=%s",
-                income.wallet_operation.sender_address,
-                income.wallet_operation.amount,
-            )
             income.wallet_operation.status = \
                 model.WalletOperation.STATUS.overdue
-            income.wallet_operation.save()
+            if log_incomes:
+                logger.debug(
+                    "Marking payment as overdue. sender=%s, amount=%s",
+                    income.wallet_operation.sender_address,
+                    income.wallet_operation.amount,
+                )
             dispatcher.send(
                 signal='golem.income',
                 event='overdue_single',
@@ -227,3 +313,8 @@ class IncomesKeeper:
             event='overdue',
             incomes=incomes,
         )
+
+
+def _chunks(ids: List[int]):
+    for start in range(0, len(ids), BULK_UPDATE_CHUNK_SIZE):
+        yield ids[start:start + BULK_UPDATE_CHUNK_SIZE]
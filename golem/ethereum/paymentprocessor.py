@@ -1,12 +1,16 @@
 import datetime
+import enum
 import logging
 
 from collections import defaultdict
 from typing import (
+    Iterable,
     List,
+    Optional,
 )
 
 from ethereum.utils import denoms
+from golem_messages import datastructures as msg_datastructures
 from pydispatch import dispatcher
 from sortedcontainers import SortedListWithKey
 from twisted.internet import threads
@@ -15,6 +19,7 @@ import golem_sci
 
 from golem import model
 from golem.core import common
+from golem.core.cache import MemCacheMixin
 from golem.core.variables import PAYMENT_DEADLINE
 PAYMENT_DEADLINE_TD = datetime.timedelta(seconds=PAYMENT_DEADLINE)
 
@@ -22,6 +27,22 @@ log = logging.getLogger(__name__)
 
 # We reserve 30 minutes for the payment to go through
 PAYMENT_MAX_DELAY = PAYMENT_DEADLINE - 30 * 60
+# Chain reads younger than this (in seconds) are reused when preparing
+# a batch. TransactionSystem refreshes them off the reactor before calling
+# sendout() on each of its ticks (every LOOP_INTERVAL = 13 s), but keeps
+# them while no new block is confirmed, so they have to outlive a few ticks
+CHAIN_READS_MAX_AGE = 60
+# Keep the number of bound parameters below the SQLite limit
+BULK_UPDATE_CHUNK_SIZE = 500
+
+
+class CacheKey(msg_datastructures.StringEnum):
+    ETH = enum.auto()
+    GNT = enum.auto()
+    GNTB = enum.auto()
+    GNTDeposit = enum.auto()
+    GasPrice = enum.auto()
+    BlockGasLimit = enum.auto()
 
 
 def _make_batch_payments(
@@ -37,13 +58,42 @@ def _make_batch_payments(
     return res
 
 
+def _bulk_update_wallet_operations(
+        payments: Iterable[model.TaskPayment],
+        **fields,
+) -> None:
+    """Sets the same `fields` on wallet operations of all the `payments`
+    with a single UPDATE per chunk, inside one transaction. In-memory
+    instances are updated as well."""
+    ids = []
+    for payment in payments:
+        wallet_operation = payment.wallet_operation
+        for name, value in fields.items():
+            setattr(wallet_operation, name, value)
+        ids.append(wallet_operation.id)
+
+    with model.db.transaction():
+        for start in range(0, len(ids), BULK_UPDATE_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_UPDATE_CHUNK_SIZE]
+            model.WalletOperation.update(**fields) \
+                .where(model.WalletOperation.id.in_(chunk)) \
+                .execute()
+
+
 class PaymentProcessor:
     CLOSURE_TIME_DELAY = 2
     # Don't try to use more than 75% of block gas limit
     BLOCK_GAS_LIMIT_RATIO = 0.75
 
-    def __init__(self, sci) -> None:
+    def __init__(
+            self,
+            sci,
+            chain_cache: Optional[MemCacheMixin] = None,
+    ) -> None:
         self._sci = sci
+        # Shared with TransactionSystem which refreshes the balances
+        self._chain_cache = chain_cache if chain_cache is not None \
+            else MemCacheMixin()
         self._gntb_reserved = 0
         self._awaiting = SortedListWithKey(key=lambda p: p.created_date)
         self.load_from_db()
@@ -102,11 +152,11 @@ class PaymentProcessor:
     ) -> None:
         if not receipt.status:
             log.critical("Failed batch transfer: %s", receipt)
-            for p in payments:
-                wallet_operation = p.wallet_operation
-                wallet_operation.status = model.WalletOperation.STATUS.awaiting
-                wallet_operation.save()
-                self._awaiting.add(p)
+            _bulk_update_wallet_operations(
+                payments,
+                status=model.WalletOperation.STATUS.awaiting,
+            )
+            self._awaiting.update(payments)
             return
 
         block = self._sci.get_block_by_number(receipt.block_number)
@@ -118,11 +168,12 @@ class PaymentProcessor:
             receipt,
             fee / denoms.ether,
         )
+        _bulk_update_wallet_operations(
+            payments,
+            status=model.WalletOperation.STATUS.confirmed,
+            gas_cost=fee,
+        )
         for p in payments:
-            wallet_operation = p.wallet_operation
-            wallet_operation.status = model.WalletOperation.STATUS.confirmed
-            wallet_operation.gas_cost = fee
-            wallet_operation.save()
             self._gntb_reserved -= p.wallet_operation.amount
             self._payment_confirmed(p, block.timestamp)
 
@@ -186,14 +237,33 @@ class PaymentProcessor:
         log.info("Reserved %.3f GNTB", self._gntb_reserved / denoms.ether)
         return payment
 
+    def _cached_chain_read(self, key: CacheKey, read_fn) -> int:
+        return self._chain_cache.cache_get_or_update(  # type: ignore
+            key,
+            CHAIN_READS_MAX_AGE,
+            read_fn,
+        )
+
     def __get_next_batch(self, closure_time: datetime.datetime) -> int:
-        gntb_balance = self._sci.get_gntb_balance(self._sci.get_eth_address())
-        eth_balance = self._sci.get_eth_balance(self._sci.get_eth_address())
-        gas_price = self._sci.get_current_gas_price()
+        addr = self._sci.get_eth_address()
+        gntb_balance = self._cached_chain_read(
+            CacheKey.GNTB,
+            lambda: self._sci.get_gntb_balance(addr),
+        )
+        eth_balance = self._cached_chain_read(
+            CacheKey.ETH,
+            lambda: self._sci.get_eth_balance(addr),
+        )
+        gas_price = self._cached_chain_read(
+            CacheKey.GasPrice,
+            self._sci.get_current_gas_price,
+        )
 
         ind = 0
-        gas_limit = self._sci.get_latest_confirmed_block().gas_limit * \
-            self.BLOCK_GAS_LIMIT_RATIO
+        gas_limit = self._cached_chain_read(
+            CacheKey.BlockGasLimit,
+            lambda: self._sci.get_latest_confirmed_block().gas_limit,
+        ) * self.BLOCK_GAS_LIMIT_RATIO
         payees = set()
         p: model.TaskPayment
         for p in self._awaiting:
@@ -271,16 +341,22 @@ class PaymentProcessor:
             closure_time,
         )
         del self._awaiting[:payments_count]
-
-        for payment in payments:
-            wallet_operation = payment.wallet_operation
-            wallet_operation.status = model.WalletOperation.STATUS.sent
-            wallet_operation.tx_hash = tx_hash
-            wallet_operation.save()
-            log.debug("- {} send to {} ({:.18f} GNTB)".format(
-                payment.subtask,
-                wallet_operation.recipient_address,
-                wallet_operation.amount / denoms.ether))
+        # Balances will change once the transfer is mined, keep reporting
+        # the old ones until they're read again
+        self._chain_cache.cache_mark_stale(CacheKey.ETH, CacheKey.GNTB)
+
+        _bulk_update_wallet_operations(
+            payments,
+            status=model.WalletOperation.STATUS.sent,
+            tx_hash=tx_hash,
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            for payment in payments:
+                wallet_operation = payment.wallet_operation
+                log.debug("- {} send to {} ({:.18f} GNTB)".format(
+                    payment.subtask,
+                    wallet_operation.recipient_address,
+                    wallet_operation.amount / denoms.ether))
 
         self._sci.on_transaction_confirmed(
             tx_hash,
@@ -296,21 +372,27 @@ class PaymentProcessor:
         created_deadline = datetime.datetime.now(
             tz=datetime.timezone.utc
         ) - PAYMENT_DEADLINE_TD
-        counter = 0
+        overdue = []
         for payment in self._awaiting:
             if payment.created_date >= created_deadline:
                 # All subsequent payments won't be overdue
                 # because list is sorted.
                 break
-            wallet_operation = payment.wallet_operation
-            if wallet_operation.status is model.WalletOperation.STATUS.overdue:
+            if payment.wallet_operation.status \
+                    is model.WalletOperation.STATUS.overdue:
                 continue
-            wallet_operation.status = model.WalletOperation.STATUS.overdue
-            wallet_operation.save()
-            log.debug("Marked as overdue. payment=%r", payment)
-            counter += 1
-        if counter:
-            log.info("Marked %d payments as overdue.", counter)
+            overdue.append(payment)
+        if not overdue:
+            return
+
+        _bulk_update_wallet_operations(
+            overdue,
+            status=model.WalletOperation.STATUS.overdue,
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            for payment in overdue:
+                log.debug("Marked as overdue. payment=%r", payment)
+        log.info("Marked %d payments as overdue.", len(overdue))
 
     def sent_forced_subtask_payment(
             self,
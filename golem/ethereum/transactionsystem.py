@@ -11,6 +11,7 @@ import time
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     Generator,
@@ -24,7 +25,6 @@ from typing import (
 from ethereum.utils import denoms
 from eth_keyfile import create_keyfile_json, extract_key_from_keyfile
 from eth_utils import is_address
-from golem_messages import datastructures as msg_datastructures
 from golem_messages.utils import bytes32_to_uuid
 from golem_sci import (
     contracts,
@@ -35,13 +35,18 @@ from golem_sci import (
 )
 from golem_sci import exceptions as sci_exceptions
 from twisted.internet import defer
+from twisted.internet.threads import deferToThread
 
 from golem import model
 from golem.core.cache import MemCacheMixin
 from golem.core.deferred import call_later
 from golem.core.service import LoopingCallService
 from golem.ethereum.node import NodeProcess
-from golem.ethereum.paymentprocessor import PaymentProcessor
+from golem.ethereum.paymentprocessor import (
+    CacheKey,
+    CHAIN_READS_MAX_AGE,
+    PaymentProcessor,
+)
 from golem.ethereum.incomeskeeper import IncomesKeeper
 from golem.ethereum.paymentskeeper import PaymentsKeeper
 from golem.utils import privkeytoaddr
@@ -94,11 +99,54 @@ class FaucetRequests(enum.Enum):
     GNT = 1
 
 
-class CacheKey(msg_datastructures.StringEnum):
-    ETH = enum.auto()
-    GNT = enum.auto()
-    GNTB = enum.auto()
-    GNTDeposit = enum.auto()
+_BALANCE_NAMES = {
+    CacheKey.ETH: 'ETH',
+    CacheKey.GNT: 'GNT',
+    CacheKey.GNTB: 'GNTB',
+    CacheKey.GNTDeposit: 'deposit',
+    CacheKey.GasPrice: 'gas price',
+    CacheKey.BlockGasLimit: 'block gas limit',
+}
+
+
+@contextlib.contextmanager
+def _safe_balance_update(currency: str) -> Generator[None, None, None]:
+    # Sometimes web3 may throw but it's fine here, we'll just update the
+    # balances next time
+    try:
+        yield
+    except TypeError:
+        # TypeError("unsupported operand type(s)
+        #           for -=: 'NoneType' and 'int'",)
+        # SCI was unprepared for geth to return None
+        log.info(
+            'Failed to update %s balance: geth connection issue',
+            currency,
+        )
+        log.debug('Update balance error details', exc_info=True)
+    except sci_exceptions.MissingTrieNode:
+        log.debug(
+            'Failed to update %s balance: missing trie node',
+            currency,
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        log.warning('Failed to update %s balance: %r', currency, e)
+        log.debug('Update balance error details', exc_info=True)
+
+
+def _read_balance(currency: str, read: Callable[[], int]) -> Optional[int]:
+    """ Returns None if the balance could not be read """
+    with _safe_balance_update(currency):
+        return read()
+    return None
+
+
+def _read_balances(
+        reads: List[Tuple[str, Callable[[], int]]],
+) -> List[Optional[int]]:
+    """ Reads one after another, the SCI and its web3 client
+    aren't meant to be used from several threads at once """
+    return [_read_balance(currency, read) for currency, read in reads]
 
 
 # pylint:disable=too-many-instance-attributes,too-many-public-methods
@@ -140,6 +188,8 @@ class TransactionSystem(LoopingCallService, MemCacheMixin):
         self._gntb_withdrawn: int = 0
         # Amortized gas cost per payment used when dealing with locks
         self._eth_per_payment: int = 0
+        # Latest confirmed block the cached balances were read at
+        self._balances_block_number: Optional[int] = None
 
     @property
     def _eth_balance(self) -> int:
@@ -249,7 +299,10 @@ class TransactionSystem(LoopingCallService, MemCacheMixin):
                 self._gnt_conversion_status = \
                     (ConversionStatus.UNFINISHED, None)
 
-        self._payment_processor = PaymentProcessor(self._sci)
+        self._payment_processor = PaymentProcessor(
+            self._sci,
+            chain_cache=self,
+        )
         self._eth_per_payment = self._current_eth_per_payment()
         recipients_count = self._payment_processor.recipients_count
         if recipients_count > 0:
@@ -978,51 +1031,78 @@ class TransactionSystem(LoopingCallService, MemCacheMixin):
         self._faucet_requested = None
 
     @sci_required()
-    def _refresh_balances(self) -> None:
+    def _chain_reads(self) -> Dict[CacheKey, Callable[[], int]]:
         assert isinstance(self._sci, SmartContractsInterface)
         addr = self._sci.get_eth_address()
+        reads = {
+            CacheKey.ETH: functools.partial(self._sci.get_eth_balance, addr),
+            CacheKey.GNT: functools.partial(self._sci.get_gnt_balance, addr),
+            CacheKey.GNTB: functools.partial(self._sci.get_gntb_balance, addr),
+            # Used by PaymentProcessor.sendout()
+            CacheKey.GasPrice: self._sci.get_current_gas_price,
+            CacheKey.BlockGasLimit: self._read_block_gas_limit,
+        }
+        if self.deposit_contract_available:
+            reads[CacheKey.GNTDeposit] = functools.partial(
+                self._sci.get_deposit_value,
+                account_address=addr,
+            )
+        return reads
 
-        # Sometimes web3 may throw but it's fine here, we'll just update the
-        # balances next time
-        @contextlib.contextmanager
-        def safe_update(currency):
-            try:
-                yield
-            except TypeError:
-                # TypeError("unsupported operand type(s)
-                #           for -=: 'NoneType' and 'int'",)
-                # SCI was unprepared for geth to return None
-                log.info(
-                    'Failed to update %s balance: geth connection issue',
-                    currency,
-                )
-                log.debug('Update balance error details', exc_info=True)
-            except sci_exceptions.MissingTrieNode:
-                log.debug(
-                    'Failed to update %s balance: missing trie node',
-                    currency,
-                )
-            except Exception as e:  # pylint: disable=broad-except
-                log.warning('Failed to update %s balance: %r', currency, e)
-                log.debug('Update balance error details', exc_info=True)
-
-        with safe_update('ETH'):
-            self.cache_set(CacheKey.ETH, self._sci.get_eth_balance(addr))
-
-        with safe_update('GNT'):
-            self.cache_set(CacheKey.GNT, self._sci.get_gnt_balance(addr))
+    def _read_block_gas_limit(self) -> int:
+        assert isinstance(self._sci, SmartContractsInterface)
+        return self._sci.get_latest_confirmed_block().gas_limit
+
+    def _chain_reads_current(self, keys: Iterable[CacheKey]) -> bool:
+        """ False if any of the cached reads is stale or would expire
+        before the next tick """
+        oldest = time.time() - CHAIN_READS_MAX_AGE + self.LOOP_INTERVAL
+        return not any(
+            self.cache_is_stale(key) or self.cache_lastmod(key) < oldest
+            for key in keys
+        )
 
-        with safe_update('GNTB'):
-            self.cache_set(CacheKey.GNTB, self._sci.get_gntb_balance(addr))
+    def _refresh_balances(self) -> None:
+        for key, read in self._chain_reads().items():
+            with _safe_balance_update(_BALANCE_NAMES[key]):
+                self.cache_set(key, read())
 
-        if self.deposit_contract_available:
-            with safe_update('deposit'):
-                self.cache_set(
-                    CacheKey.GNTDeposit,
-                    self._sci.get_deposit_value(
-                        account_address=self._sci.get_eth_address(),
-                    ),
-                )
+    @sci_required()
+    @defer.inlineCallbacks
+    def _refresh_balances_async(self):
+        """ Reads the balances, gas price and block gas limit in a reactor
+        thread and updates the cache with all of them at once.
+        Nothing is read if no block was confirmed since the last complete
+        refresh and the cached reads are still good for the next tick.
+
+        :return: Deferred firing with whether the balances were refreshed
+        """
+        assert isinstance(self._sci, SmartContractsInterface)
+        reads = self._chain_reads()
+        try:
+            block_number = yield deferToThread(
+                self._sci.get_latest_confirmed_block_number,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            log.debug('Failed to read the latest block number: %r', e)
+            block_number = None
+
+        if block_number is not None \
+                and block_number == self._balances_block_number \
+                and self._chain_reads_current(reads):
+            return False
+
+        keys = list(reads)
+        values = yield deferToThread(
+            _read_balances,
+            [(_BALANCE_NAMES[key], reads[key]) for key in keys],
+        )
+        for key, value in zip(keys, values):
+            if value is not None:
+                self.cache_set(key, value)
+        complete = None not in values
+        self._balances_block_number = block_number if complete else None
+        return True
 
     @sci_required()
     def _try_convert_gnt(self) -> None:  # pylint: disable=too-many-branches
@@ -1110,12 +1190,18 @@ class TransactionSystem(LoopingCallService, MemCacheMixin):
                 gas_cost / denoms.ether,
             )
 
-    def _run(self) -> None:
+    def _run(self) -> defer.Deferred:
         if not self._payment_processor:
             raise Exception('Start was not called')
-        self._refresh_balances()
-        self._get_funds_from_faucet()
-        self._try_convert_gnt()
+        deferred = self._refresh_balances_async()
+        deferred.addCallback(self._run_after_refresh)
+        return deferred
+
+    def _run_after_refresh(self, refreshed: bool) -> None:
+        assert self._payment_processor is not None
+        if refreshed:
+            self._get_funds_from_faucet()
+            self._try_convert_gnt()
         self._payment_processor.sendout()
         self._payment_processor.update_overdue()
         self._incomes_keeper.update_overdue_incomes()
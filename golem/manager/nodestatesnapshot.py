@@ -29,6 +29,11 @@ class ComputingSubtaskStateSnapshot:
             frames: List[int] = None,
             start_task: int = None,
             total_tasks: int = None,
+            # resources reserved by the subtask and left for other ones
+            reserved_cores: int = None,
+            reserved_memory_mb: int = None,
+            free_cores: int = None,
+            free_memory_mb: int = None,
             # if there's something more in extra_data, just ignore it
             **_kwargs
     ) -> None:
@@ -42,6 +47,10 @@ class ComputingSubtaskStateSnapshot:
         self.frames = copy(frames)
         self.start_task = start_task
         self.total_tasks = total_tasks
+        self.reserved_cores = reserved_cores
+        self.reserved_memory_mb = reserved_memory_mb
+        self.free_cores = free_cores
+        self.free_memory_mb = free_memory_mb
 
 
 class LocalTaskStateSnapshot:
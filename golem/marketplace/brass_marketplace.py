@@ -41,11 +41,10 @@ class RequestorBrassMarketStrategy(RequestorPoolingMarketStrategy):
     @classmethod
     def resolve_task_offers(cls, task_id: str) -> List[Offer]:
         logger.info("Ordering providers for task: %s", task_id)
-        if task_id not in cls._pools:
+        offers = cls._pop_offers(task_id)
+        if not offers:
             return []
 
-        offers = cls._pools.pop(task_id)
-
         permutation = order_providers([
             BrassMarketOffer(  # type: ignore
                 scale_price(offer.max_price, offer.price),
@@ -1,4 +1,5 @@
 import logging
+import threading
 from typing import ClassVar, Dict, List
 
 from golem.marketplace import RequestorMarketStrategy, Offer
@@ -9,12 +10,14 @@ logger = logging.getLogger(__name__)
 class RequestorPoolingMarketStrategy(RequestorMarketStrategy):
 
     _pools: ClassVar[Dict[str, List[Offer]]] = dict()
+    # Offers are added in the reactor thread, but resolved in the database
+    # writer thread
+    _pools_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def add(cls, task_id: str, offer: Offer):
-        if task_id not in cls._pools:
-            cls._pools[task_id] = []
-        cls._pools[task_id].append(offer)
+        with cls._pools_lock:
+            cls._pools.setdefault(task_id, []).append(offer)
 
         logger.debug(
             "Offer accepted & added to pool. offer=%s",
@@ -23,4 +26,12 @@ class RequestorPoolingMarketStrategy(RequestorMarketStrategy):
 
     @classmethod
     def get_task_offer_count(cls, task_id: str) -> int:
-        return len(cls._pools[task_id]) if task_id in cls._pools else 0
+        with cls._pools_lock:
+            return len(cls._pools.get(task_id, ()))
+
+    @classmethod
+    def _pop_offers(cls, task_id: str) -> List[Offer]:
+        """ Takes the pooled offers for resolution, the ones added later
+        start a new pool """
+        with cls._pools_lock:
+            return cls._pools.pop(task_id, [])
@@ -89,11 +89,11 @@ class RequestorWasmMarketStrategy(RequestorPoolingMarketStrategy):
     @classmethod
     def resolve_task_offers(cls, task_id: str) -> List[Offer]:
         logger.info("RWMS: ordering providers for task: %s", task_id)
-        if task_id not in cls._pools:
+        offers: List[Offer] = cls._pop_offers(task_id)
+        if not offers:
             return []
 
         max_factor: float = cls._max_usage_factor
-        offers: List[Offer] = cls._pools.pop(task_id)
         to_sort: List[Tuple[Offer, float, float]] = []
 
         for offer in offers:
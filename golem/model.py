@@ -36,7 +36,7 @@ from golem.core import common
 from golem.core.common import datetime_to_timestamp, default_now
 from golem.core.simpleserializer import DictSerializable
 from golem.core.variables import MESSAGE_QUEUE_MAX_AGE
-from golem.database import GolemSqliteDatabase
+from golem.database import DatabaseExecutor, GolemSqliteDatabase
 from golem.ranking.helper.trust_const import NEUTRAL_TRUST
 from golem.ranking import ProviderEfficacy
 from golem.task import taskstate
@@ -48,6 +48,8 @@ db = GolemSqliteDatabase(None, threadlocals=True,
                              ('foreign_keys', True),
                              ('busy_timeout', 1000),
                              ('journal_mode', 'WAL')))
+# Started by the Node; runs queries synchronously until then
+db_executor = DatabaseExecutor()
 
 
 def default_dict():
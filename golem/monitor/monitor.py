@@ -1,10 +1,12 @@
 # pylint: disable=no-value-for-parameter
 import asyncio
+import collections
+import concurrent.futures
 import datetime
 import json
 import logging
 import time
-from typing import Optional, Dict
+from typing import Deque, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
@@ -17,11 +19,16 @@ from golem.task.taskrequestorstats import CurrentStats, FinishedTasksStats, \
     AggregateTaskStats
 from .model import statssnapshotmodel
 from .model.loginlogoutmodel import LoginModel, LogoutModel
+from .model.modelbase import ModelBase
 from .model.nodemetadatamodel import NodeInfoModel, NodeMetadataModel
 from .model.taskcomputersnapshotmodel import TaskComputerSnapshotModel
 
 log = logging.getLogger('golem.monitor')
 
+# Defaults for MONITOR_CONFIG entries missing from a local config
+DEFAULT_FLUSH_INTERVAL = 5.0  # seconds
+DEFAULT_QUEUE_SIZE = 100
+
 
 @golem_async.throttle(datetime.timedelta(minutes=10))
 def log_throttled(msg, d):
@@ -29,12 +36,31 @@ def log_throttled(msg, d):
 
 
 class SystemMonitor(object):
+    """ Sends monitor models to the stats endpoint.
+
+    Models are queued and sent every FLUSH_INTERVAL seconds by a single
+    worker thread, over one keep-alive HTTP session. The endpoint takes
+    one model per request, so a flush posts them one by one. When the
+    endpoint is slow, the queue holds at most QUEUE_SIZE models; the oldest
+    ones are dropped first. When it's unavailable, the rest of the flushed
+    models are dropped.
+    """
+
     def __init__(self,
                  meta_data: NodeMetadataModel,
                  monitor_config: dict) -> None:
         self.meta_data = meta_data
         self.node_info = NodeInfoModel(meta_data.cliid, meta_data.sessid)
         self.config = monitor_config
+        self._queue: Deque[ModelBase] = collections.deque(
+            maxlen=monitor_config.get('QUEUE_SIZE', DEFAULT_QUEUE_SIZE))
+        self._dropped = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='monitor',
+        )
+        self._session: Optional[requests.Session] = None
 
     @golem_async.taskify()
     async def p2p_listener(self, *_, event='default', ports=None, **__):
@@ -117,37 +143,78 @@ class SystemMonitor(object):
             signal='golem.p2p',
         )
 
-    @golem_async.run_in_thread()
-    def send(self, model, loop):
+    async def send(self, model: ModelBase) -> None:
+        """ Queue a model; it will be sent with the next flush """
+        if len(self._queue) == self._queue.maxlen:
+            self._dropped += 1
+            log.debug('Monitor queue full, dropping the oldest model. '
+                      'dropped=%d', self._dropped)
+        self._queue.append(model)
+        if self._flush_handle is None:
+            loop = golem_async.get_event_loop()
+            self._flush_handle = loop.call_later(
+                self.config.get('FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL),
+                lambda: asyncio.ensure_future(self.flush(), loop=loop),
+            )
+
+    async def flush(self) -> None:
+        """ Send all queued models now """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = list(self._queue)
+        self._queue.clear()
+        if not batch:
+            return
+        loop = golem_async.get_event_loop()
+        unsent, error = await loop.run_in_executor(
+            self._executor, self._send_batch, batch)
+        if unsent:
+            self._dropped += unsent
+            log.debug('Dropping %d monitor models. dropped=%d',
+                      unsent, self._dropped)
+        if error is not None:
+            await log_throttled(
+                'Problem sending payload to: %(url)r, because %(e)s',
+                {
+                    'url': self.config['HOST'],
+                    'e': error,
+                },
+            )
+
+    def _send_batch(self, batch: List[ModelBase]) \
+            -> Tuple[int, Optional[requests.exceptions.RequestException]]:
+        """ Returns the number of models that weren't sent and the error
+        that stopped sending them """
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers['content-type'] = 'application/json'
         url = self.config['HOST']
         request_timeout = self.config['REQUEST_TIMEOUT']
         proto_ver = self.config['PROTO_VERSION']
-        payload = json.dumps(
-            {
-                'proto_ver': proto_ver,
-                'data': model.dict_repr(),
-            },
-            indent=4,
-        )
-        log.debug('sending payload=%s', payload)
-        try:
-            result = requests.post(
-                url,
-                data=payload,
-                headers={'content-type': 'application/json'},
-                timeout=request_timeout
-            )
-            log.debug("Result %r", result)
-            if not result.status_code == 200:
-                log.debug("Monitor request error. result=%r", result)
-        except requests.exceptions.RequestException as e:
-            asyncio.ensure_future(log_throttled(
-                'Problem sending payload to: %(url)r, because %(e)s',
+
+        for i, model in enumerate(batch):
+            payload = json.dumps(
                 {
-                    'url': url,
-                    'e': e,
+                    'proto_ver': proto_ver,
+                    'data': model.dict_repr(),
                 },
-            ), loop=loop)
+                separators=(',', ':'),
+            )
+            log.debug('sending payload=%s', payload)
+            try:
+                result = self._session.post(
+                    url,
+                    data=payload,
+                    timeout=request_timeout
+                )
+                log.debug("Result %r", result)
+                if not result.status_code == 200:
+                    log.debug("Monitor request error. result=%r", result)
+            except requests.exceptions.RequestException as e:
+                # The endpoint is unavailable; don't wait for it any longer
+                return len(batch) - i, e
+        return 0, None
 
     # handlers
 
@@ -172,6 +239,8 @@ class SystemMonitor(object):
 
     async def on_logout(self):
         await self.send(LogoutModel(self.meta_data))
+        # The node is going down, don't wait for the next flush
+        await self.flush()
 
     async def on_stats_snapshot(self, known_tasks, supported_tasks, stats):
         msg = statssnapshotmodel.StatsSnapshotModel(
@@ -7,6 +7,10 @@ MONITOR_CONFIG = {
         "https://stats.golem.network/",
     ],
     'REQUEST_TIMEOUT': 10,
+    # Send queued messages every that many seconds
+    'FLUSH_INTERVAL': 5,
+    # Drop the oldest messages when more are waiting to be sent
+    'QUEUE_SIZE': 100,
 
     # Increase this number every time any change is made to the protocol
     # (e.g. message object representation changes)
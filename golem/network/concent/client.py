@@ -1,5 +1,7 @@
 import calendar
+import concurrent.futures
 import datetime
+import itertools
 import logging
 import queue
 import threading
@@ -12,7 +14,11 @@ import requests
 import golem_messages
 from golem_messages import message
 from golem_messages import datastructures as msg_datastructures
-from golem_messages.constants import MSG_DELAYS
+from golem_messages.constants import (
+    DEFAULT_MSG_LIFETIME,
+    MSG_DELAYS,
+    MSG_LIFETIMES,
+)
 
 from golem import constants as gconst
 from golem import utils
@@ -79,9 +85,13 @@ def verify_response(response: requests.Response) -> None:
 def send_to_concent(
         msg: message.base.Message,
         signing_key: bytes,
-        concent_variant: dict) -> typing.Optional[bytes]:
+        concent_variant: dict,
+        session: typing.Optional[requests.Session] = None) \
+        -> typing.Optional[bytes]:
     """Sends a message to the concent server
 
+    :param session: Keep-alive session to send the request with;
+                    a new connection is made if not given
     :return: Raw reply message, None or exception
     :rtype: Bytes|None
     """
@@ -120,7 +130,7 @@ def send_to_concent(
             concent_post_url,
             headers,
         )
-        response = requests.post(
+        response = (session or requests).post(
             concent_post_url,
             data=data,
             headers=headers,
@@ -185,6 +195,8 @@ class ConcentClientService(threading.Thread):
     MIN_GRACE_TIME = 5  # s
     MAX_GRACE_TIME = 5 * 60  # s
     GRACE_FACTOR = 2  # n times on each failure
+    SENDERS = 3  # messages sent concurrently
+    IDLE_WAIT = 1  # s
 
     def __init__(self, keys_auth: keysauth.KeysAuth, variant: dict) -> None:
         super().__init__(daemon=True)
@@ -194,9 +206,18 @@ class ConcentClientService(threading.Thread):
         self.variant: dict = variant
         self._stop_event = threading.Event()
 
-        self._queue: queue.Queue = queue.Queue()
+        # (deadline, sequence number, message)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._wakeup = threading.Event()
         self._grace_time: int = self.MIN_GRACE_TIME
 
+        self._senders = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.SENDERS,
+            thread_name_prefix='concent-sender',
+        )
+        self._sessions = threading.local()
+
         self._delayed: dict = dict()
         self.received_messages: queue.Queue = queue.Queue(maxsize=100)
 
@@ -230,14 +251,17 @@ class ConcentClientService(threading.Thread):
     def run(self) -> None:
         last_receive = 0.0
         while not self._stop_event.isSet():
+            self._wakeup.clear()
             self._loop()
             if time.time() - last_receive > variables.CONCENT_PULL_INTERVAL:
                 last_receive = time.time()
                 self.receive()
-            time.sleep(1)
+            self._wakeup.wait(timeout=self.IDLE_WAIT)
+        self._senders.shutdown(wait=True)
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wakeup.set()
         logger.info('Waiting for received messages queue to empty')
         self.received_messages.join()
         logger.info('%s stopped', self)
@@ -298,6 +322,9 @@ class ConcentClientService(threading.Thread):
             delay = None
         if delay is None:
             delay = MSG_DELAYS[msg_cls]
+        deadline = time.time() + (
+            delay + MSG_LIFETIMES.get(msg_cls, DEFAULT_MSG_LIFETIME)
+        ).total_seconds()
 
         if delay:
             self._delayed[key] = reactor.callLater(
@@ -305,9 +332,10 @@ class ConcentClientService(threading.Thread):
                 self._enqueue,
                 key,
                 msg,
+                deadline,
             )
         else:
-            self._enqueue(key, msg)
+            self._enqueue(key, msg, deadline)
 
     def cancel(self, key: typing.Hashable) -> bool:
         """
@@ -325,33 +353,64 @@ class ConcentClientService(threading.Thread):
 
     def _loop(self) -> None:
         """
-        Main service loop. Requests from the queue are sent one by one (FIFO).
-        In case of failure, service enters a grace period.
+        Main service loop. The queue is drained back-to-back, requests
+        closest to their deadline first, up to SENDERS at a time over
+        persistent HTTP sessions. In case of failure, service enters
+        a grace period.
         """
-        try:
-            msg = self._queue.get_nowait()
-        except queue.Empty:
-            return
+        while not self._stop_event.isSet():
+            batch = self._dequeue(self.SENDERS)
+            if not batch:
+                return
 
-        if not self.available:
-            logger.debug('Concent disabled. Dropping %r', msg)
-            return
+            if not self.available:
+                for msg in batch:
+                    logger.debug('Concent disabled. Dropping %r', msg)
+                continue
 
-        try:
-            res = send_to_concent(
-                msg,
-                self.keys_auth._private_key,  # pylint: disable=protected-access
-                concent_variant=self.variant,
-            )
-        except exceptions.ConcentError as e:
-            logger.info('send_to_concent error: %s', e)
-            self._grace_sleep()
-        except Exception:  # pylint: disable=broad-except
-            logger.exception('send_to_concent(%r) failed', msg)
-            self._grace_sleep()
-        else:
+            futures = [
+                (msg, self._senders.submit(self._send, msg))
+                for msg in batch
+            ]
+            failed = False
+            for msg, future in futures:
+                try:
+                    res = future.result()
+                except exceptions.ConcentError as e:
+                    logger.info('send_to_concent error: %s', e)
+                    failed = True
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception('send_to_concent(%r) failed', msg)
+                    failed = True
+                else:
+                    self.react_to_concent_message(res, response_to=msg)
+
+            if failed:
+                self._grace_sleep()
+                return
             self._grace_time = self.MIN_GRACE_TIME
-            self.react_to_concent_message(res, response_to=msg)
+
+    def _dequeue(self, limit: int) -> typing.List[message.base.Message]:
+        batch: typing.List[message.base.Message] = []
+        while len(batch) < limit:
+            try:
+                _deadline, _seq, msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(msg)
+        return batch
+
+    def _send(self, msg: message.base.Message) -> typing.Optional[bytes]:
+        """ Runs in a sender thread, each with its own HTTP session """
+        session = getattr(self._sessions, 'session', None)
+        if session is None:
+            session = self._sessions.session = requests.Session()
+        return send_to_concent(
+            msg,
+            self.keys_auth._private_key,  # pylint: disable=protected-access
+            concent_variant=self.variant,
+            session=session,
+        )
 
     def receive(self) -> None:
         if not self.available:
@@ -411,10 +470,11 @@ class ConcentClientService(threading.Thread):
         logger.debug('Concent grace time: %r', self._grace_time)
         time.sleep(self._grace_time)
 
-    def _enqueue(self, key, msg):
-        logger.debug("_enqueue(%r, %r)", key, msg)
+    def _enqueue(self, key, msg, deadline: float):
+        logger.debug("_enqueue(%r, %r, deadline=%r)", key, msg, deadline)
         self._delayed.pop(key, None)
-        self._queue.put(msg)
+        self._queue.put((deadline, next(self._sequence), msg))
+        self._wakeup.set()
 
     def income_listener(self, event, **kwargs):
         logger.debug("income listener event: %s", event)
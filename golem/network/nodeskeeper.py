@@ -1,11 +1,45 @@
+import collections
 import logging
+import threading
+from typing import Any, Dict
+
+from twisted.internet import defer
 
 from golem import decorators
 from golem import model
+from golem.database.executor import log_failure
 
 logger = logging.getLogger(__name__)
 
+# Number of recently used nodes kept in memory in front of the table
+CACHE_SIZE = 4096
+# Seconds between database writes of the nodes stored in the meantime
+FLUSH_INTERVAL = 10
+# Number of most recently modified table entries that survive a sweep
+SWEEP_KEEP = 1000
+
+_lock = threading.Lock()
+# node_id -> node, least recently used first
+_cache: 'collections.OrderedDict[str, Any]' = collections.OrderedDict()
+# node_id -> node, stored since the last flush
+_pending: Dict[str, Any] = {}
+
 def get(node_id):
+    with _lock:
+        if node_id in _cache:
+            _cache.move_to_end(node_id)
+            return _cache[node_id]
+        node = _pending.get(node_id)
+    if node is None:
+        node = _select(node_id)
+    if node is not None:
+        with _lock:
+            # Don't overwrite a node stored in the meantime
+            if node_id not in _cache:
+                _remember(node_id, node)
+    return node
+
+def _select(node_id):
     try:
         return model.CachedNode.select().where(
             model.CachedNode.node == node_id,
@@ -13,8 +47,48 @@ def get(node_id):
     except model.CachedNode.DoesNotExist:
         return None
 
+def _remember(node_id, node):
+    _cache[node_id] = node
+    _cache.move_to_end(node_id)
+    while len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+
 def store(node):
-    """Creates or refreshes node entry"""
+    """Creates or refreshes node entry. Unchanged nodes are ignored,
+    the others are written to the database by the next flush()"""
+    with _lock:
+        if _cache.get(node.key) == node:
+            _cache.move_to_end(node.key)
+            return
+        _remember(node.key, node)
+        _pending[node.key] = node
+
+def flush() -> defer.Deferred:
+    """Writes nodes stored since the last flush in the database writer
+    thread"""
+    with _lock:
+        nodes = list(_pending.values())
+        _pending.clear()
+    if not nodes:
+        return defer.succeed(None)
+    deferred = model.db_executor.write(_store_many, nodes)
+    deferred.addErrback(_requeue, nodes)
+    deferred.addErrback(log_failure, 'nodeskeeper.flush')
+    return deferred
+
+def _requeue(failure, nodes):
+    # Retry with the next flush, unless the node was stored again meanwhile
+    with _lock:
+        for node in nodes:
+            _pending.setdefault(node.key, node)
+    return failure
+
+def _store_many(nodes):
+    with model.db.transaction():
+        for node in nodes:
+            _store(node)
+
+def _store(node):
     instance, created = model.CachedNode.get_or_create(
         node=node.key,
         defaults={'node_field': node, },
@@ -30,9 +104,17 @@ def sweep():
         model.CachedNode.node,
     ).order_by(
         model.CachedNode.modified_date.desc(),
-    ).limit(1000)
+    ).limit(SWEEP_KEEP)
     count = model.CachedNode.delete().where(
         model.CachedNode.node.not_in(subq),
     ).execute()
     if count:
         logger.info('Sweeped ancient nodes from cache. count=%d', count)
+        kept = {
+            cached.node for cached in
+            model.CachedNode.select(model.CachedNode.node)
+        }
+        with _lock:
+            for node_id in list(_cache):
+                if node_id not in kept and node_id not in _pending:
+                    del _cache[node_id]
@@ -8,14 +8,22 @@ import golem_messages
 from golem_messages import exceptions as msg_exceptions
 from golem_messages import message
 import peewee
+from twisted.internet import defer
 
 from golem import decorators
 from golem import model
 from golem.core.common import default_now, short_node_id
+from golem.database.executor import log_failure
 
 
 logger = logging.getLogger(__name__)
 READ_LOCK = threading.Lock()
+# Index of nodes with queued messages, node_id -> the latest deadline.
+# Loaded from the database by the first waiting() call, then kept
+# up to date by put(), get() and sweep().
+_INDEX_LOCK = threading.Lock()
+_index: typing.Dict[str, datetime.datetime] = {}
+_index_loaded = False
 # CLasses that aren't allowed in queue
 FORBIDDEN_CLASSES = (
     message.base.Disconnect,
@@ -35,7 +43,22 @@ def put(
                  short_node_id(node_id), msg)
     deadline_utc = (default_now() + timeout) if timeout else None
     db_model = model.QueuedMessage.from_message(node_id, msg, deadline_utc)
-    db_model.save()
+    model.db_executor.write(_save, db_model).addErrback(
+        log_failure, 'msg_queue.put')
+
+
+def _save(db_model: model.QueuedMessage) -> None:
+    # Under READ_LOCK, so a get() can't find the queue empty and drop
+    # the node from the index between the save and the index update
+    with READ_LOCK:
+        db_model.save()
+        _index_add(db_model.node, db_model.deadline)
+
+
+def _index_add(node_id: str, deadline: datetime.datetime) -> None:
+    with _INDEX_LOCK:
+        if node_id not in _index or _index[node_id] < deadline:
+            _index[node_id] = deadline
 
 
 def get(node_id: str) -> typing.Iterator['message.base.Base']:
@@ -47,6 +70,8 @@ def get(node_id: str) -> typing.Iterator['message.base.Base']:
                         model.QueuedMessage.node == node_id,
                     ).order_by(model.QueuedMessage.created_date).get()
             except model.QueuedMessage.DoesNotExist:
+                with _INDEX_LOCK:
+                    _index.pop(node_id, None)
                 return
 
             try:
@@ -84,15 +109,39 @@ def get(node_id: str) -> typing.Iterator['message.base.Base']:
         yield msg
 
 
+def get_all(node_id: str) -> defer.Deferred:
+    """Pop all messages for the node in the database writer thread,
+    after any pending puts"""
+    return model.db_executor.write(lambda: list(get(node_id)))
+
+
 def waiting() -> typing.Iterator[str]:
+    """Nodes that have messages waiting in the queue"""
+    if not _index_loaded:
+        _load_index()
+    _prune_index(default_now())
+    with _INDEX_LOCK:
+        nodes = list(_index)
+    yield from nodes
+
+
+def _prune_index(now: datetime.datetime) -> None:
+    with _INDEX_LOCK:
+        for node_id, deadline in list(_index.items()):
+            if deadline <= now:
+                del _index[node_id]
+
+
+def _load_index() -> None:
+    global _index_loaded  # pylint: disable=global-statement
     query = model.QueuedMessage.select(
         model.QueuedMessage.node,
+        peewee.fn.MAX(model.QueuedMessage.deadline).alias('deadline'),
     ).where(
         model.QueuedMessage.deadline > default_now()
     ).group_by(model.QueuedMessage.node)
     try:
-        for db_row in query:
-            yield db_row.node
+        rows = [(db_row.node, db_row.deadline) for db_row in query]
     except (
             sqlite3.ProgrammingError,
             peewee.OperationalError,
@@ -102,15 +151,21 @@ def waiting() -> typing.Iterator[str]:
         # Here we're using peewee.QueryResultWrapper.iterate()
         # and have to duplicate error handling.
         logger.debug("DB Error", exc_info=True)
+        return
+    for node_id, deadline in rows:
+        _index_add(node_id, deadline)
+    _index_loaded = True
 
 
 @decorators.run_with_db()
 def sweep() -> None:
     """Sweep messages"""
+    now = default_now()
     with READ_LOCK:
         count = model.QueuedMessage.delete().where(
-            model.QueuedMessage.deadline <= default_now()
+            model.QueuedMessage.deadline <= now
         ).execute()
+    _prune_index(now)
 
     if count:
         logger.info('Sweeped messages from queue. count=%d', count)
@@ -35,7 +35,7 @@ from golem.core import virtualization
 from golem.database import Database
 from golem.docker.manager import DockerManager
 from golem.ethereum.transactionsystem import TransactionSystem
-from golem.model import DB_MODELS, db, DB_FIELDS
+from golem.model import DB_MODELS, db, DB_FIELDS, db_executor
 from golem.network.transport.tcpnetwork_helpers import SocketAddress
 from golem.report import (
     Component,
@@ -197,9 +197,12 @@ class Node(HardwarePresetsMixin):
                 self._setup_client,
                 on_start_error,
             ).addErrback(self._error('setup client'))
+            db_executor.start()
             self._reactor.run()
         except Exception:  # pylint: disable=broad-except
             logger.exception("Application error")
+        finally:
+            db_executor.stop()
 
     @rpc_utils.expose('ui.quit')
     @report_calls(Component.client, 'shutdown')
@@ -1,11 +1,17 @@
+import concurrent.futures
 import logging
 import os
 import shutil
 import time
-from typing import Iterator
+from typing import Iterator, List, Optional
+
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Number of threads removing files when clearing large directories
+CLEAR_DIR_WORKERS = 4
+
 
 # copied from docker_luxtask.py - difficult to refactor, since
 # docker_luxtask.py can't use external dependencies
@@ -53,6 +59,24 @@ def list_dir_recursive(dir: str) -> Iterator[str]:
             yield os.path.join(dirpath, name)
 
 
+@dataclass
+class ClearedFiles:
+    """ What has been removed by DirManager.clear_dir """
+    files: int = 0
+    dirs: int = 0
+    bytes: int = 0
+
+
+def _remove_file(entry: os.DirEntry) -> Optional[int]:
+    """ Remove a file or a symlink, return its size """
+    try:
+        size = entry.stat(follow_symlinks=False).st_size
+        os.remove(entry.path)
+    except FileNotFoundError:
+        return None
+    return size
+
+
 class DirManager(object):
     """ Manage working directories for application. Return paths, create them if it's needed """
     def __init__(self, root_path, tmp="tmp", res="resources", output="output", global_resource="golemres", reference_data_dir="reference_data", test="test"):
@@ -75,32 +99,76 @@ class DirManager(object):
         filename, file_extension = os.path.splitext(fullpath)
         return file_extension
 
-    def clear_dir(self, d, older_than_seconds: int = 0):
+    def clear_dir(self, d, older_than_seconds: int = 0,
+                  workers: int = 0) -> ClearedFiles:
         """ Remove everything from given directory
         :param str d: directory that should be cleared
         :param older_than_seconds: delete contents, that are older than given
                                    amount of seconds.
+        :param workers: remove files in a pool of that many threads
+        :return: number of removed files and directories, and freed bytes
         """
+        cleared = ClearedFiles()
         if not os.path.isdir(d):
-            return
-
-        current_time_seconds = time.time()
-        min_allowed_mtime = current_time_seconds - older_than_seconds
-
-        for i in os.listdir(d):
-            path = os.path.join(d, i)
-
-            if older_than_seconds > 0:
-                mtime = os.path.getmtime(path)
-                if mtime > min_allowed_mtime:
+            return cleared
+
+        min_allowed_mtime = time.time() - older_than_seconds
+
+        def is_old(entry: os.DirEntry) -> bool:
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                # Broken symlink
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+            return mtime <= min_allowed_mtime
+
+        with os.scandir(d) as it:
+            entries = [
+                entry for entry in it
+                if older_than_seconds <= 0 or is_old(entry)
+            ]
+
+        executor = None
+        if workers > 0:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix='clear-dir')
+        try:
+            self._remove_entries(entries, cleared, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return cleared
+
+    def _remove_entries(
+            self,
+            entries: List[os.DirEntry],
+            cleared: ClearedFiles,
+            executor: Optional[concurrent.futures.Executor]
+    ) -> None:
+        files = []
+        for entry in entries:
+            # Symlinks are removed, never followed
+            if entry.is_dir(follow_symlinks=False):
+                with os.scandir(entry.path) as it:
+                    self._remove_entries(list(it), cleared, executor)
+                try:
+                    os.rmdir(entry.path)
+                except OSError:
+                    # Something that is neither a file nor a directory is left
                     continue
+                cleared.dirs += 1
+            elif entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                files.append(entry)
 
-            if os.path.isfile(path):
-                os.remove(path)
-            if os.path.isdir(path):
-                self.clear_dir(path)
-                if not os.listdir(path):
-                    shutil.rmtree(path, ignore_errors=True)
+        if executor is None:
+            sizes = map(_remove_file, files)
+        else:
+            sizes = executor.map(_remove_file, files)
+        for size in sizes:
+            if size is not None:
+                cleared.files += 1
+                cleared.bytes += size
 
     def create_dir(self, full_path):
         """ Create new directory, remove old directory if it exists.
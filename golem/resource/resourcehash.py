@@ -1,13 +1,20 @@
 import os
 import hashlib
 import base64
+import shutil
+from typing import Dict, Optional, Tuple
+
+BLOCK_SIZE = 2 ** 20
 
 
 class ResourceHash:
-    def __init__(self, resource_dir):
+    def __init__(self, resource_dir, cache_digests=False):
         self.resource_dir = resource_dir
+        # path -> (size, mtime_ns, digest)
+        self._digests: Optional[Dict[str, Tuple[int, int, str]]] = \
+            {} if cache_digests else None
 
-    def split_file(self, filename, block_size=2 ** 20):
+    def split_file(self, filename, block_size=BLOCK_SIZE):
         with open(filename, "rb") as f:
             file_list = []
             while True:
@@ -24,26 +31,49 @@ class ResourceHash:
                 file_list.append(filehash)
         return file_list
 
-    def connect_files(self, file_list, res_file):
+    def connect_files(self, file_list, res_file, block_size=BLOCK_SIZE):
         with open(res_file, 'wb') as f:
             for file_hash in file_list:
                 with open(file_hash, "rb") as fh:
-                    while True:
-                        data = fh.read()
-                        if not data:
-                            break
-                        f.write(data)
+                    shutil.copyfileobj(fh, f, block_size)
 
-    def get_file_hash(self, filename):
-        with open(filename, "rb") as f:
-            data = f.read()
-            hash_ = self.__count_hash(data)
+    def get_file_hash(self, filename, block_size=BLOCK_SIZE):
+        if self._digests is None:
+            return self.__count_file_hash(filename, block_size)
+
+        path = os.path.abspath(filename)
+        stat = os.stat(path)
+        cached = self._digests.get(path)
+        if cached is not None and cached[:2] == (stat.st_size,
+                                                 stat.st_mtime_ns):
+            return cached[2]
+
+        hash_ = self.__count_file_hash(path, block_size)
+        self._digests[path] = (stat.st_size, stat.st_mtime_ns, hash_)
         return hash_
 
+    def clear_digest_cache(self):
+        if self._digests is not None:
+            self._digests.clear()
+
     def set_resource_dir(self, resource_dir):
         self.resource_dir = resource_dir
 
+    def __count_file_hash(self, filename, block_size):
+        sha = hashlib.sha1()
+        with open(filename, "rb") as f:
+            while True:
+                data = f.read(block_size)
+                if not data:
+                    break
+                sha.update(data)
+        return self.__encode(sha)
+
     def __count_hash(self, data):
         sha = hashlib.sha1()
         sha.update(data)
+        return self.__encode(sha)
+
+    @staticmethod
+    def __encode(sha):
         return base64.urlsafe_b64encode(sha.digest()).decode('utf-8')
@@ -26,6 +26,9 @@ class Reputation:
 class Task:
     evt_task_status = 'evt.comp.task.status'
     evt_subtask_status = 'evt.comp.subtask.status'
+    # Batches of the above, see golem.rpc.session.CoalescingPublisher
+    evt_task_status_batch = 'evt.comp.task.status.batch'
+    evt_subtask_status_batch = 'evt.comp.subtask.status.batch'
     evt_task_test_status = 'evt.comp.task.test.status'
 
     evt_provider_rejected = 'evt.comp.task.prov_rejected'
@@ -28,6 +28,9 @@ CLOSE_HANDSHAKE_TIMEOUT = 10.
 AUTO_PING_INTERVAL = 15.
 AUTO_PING_TIMEOUT = 12.
 BACKOFF_POLICY_FACTOR = 1.2
+# Default time window (in seconds) in which events published
+# through the CoalescingPublisher are batched
+EVENT_BATCH_WINDOW = 0.5
 
 
 class RPCAddress(object):
@@ -307,3 +310,82 @@ class Publisher:  # pylint: disable=too-few-public-methods
             logger.warning("RPC: Cannot publish '%s', session is not yet "
                            "established", event_alias)
         return None
+
+
+class CoalescingPublisher:
+    """Batches high-frequency events before handing them to a `Publisher`.
+
+    Events published with `publish_coalesced` are buffered per topic and
+    deduplicated by key, so only the latest arguments for a given key are
+    kept. A topic is buffered for `windows[topic]` seconds, or `window`
+    seconds when it's not listed there. On flush a single `<topic>.batch`
+    event is published with the list of buffered argument tuples. When
+    `legacy_topics` is set, every event is also published right away on its
+    original topic, so that its subscribers don't miss any transition.
+
+    All the other events are passed through to the wrapped publisher.
+    """
+
+    BATCH_SUFFIX = '.batch'
+
+    def __init__(  # pylint: disable=too-many-arguments
+            self,
+            publisher: Publisher,
+            window: float = EVENT_BATCH_WINDOW,
+            windows: typing.Optional[typing.Dict[str, float]] = None,
+            legacy_topics: bool = False,
+            reactor=None,
+    ) -> None:
+        if reactor is None:
+            from twisted.internet import reactor as default_reactor
+            reactor = default_reactor
+
+        self.publisher = publisher
+        self.window = window
+        self.windows = windows or {}
+        self.legacy_topics = legacy_topics
+
+        self._reactor = reactor
+        self._pending: typing.Dict[
+            str, typing.Dict[typing.Hashable, tuple]] = {}
+        self._scheduled: typing.Dict[str, typing.Any] = {}
+
+    def publish(self, event_alias, *args, **kwargs) \
+            -> typing.Optional[Deferred]:
+        return self.publisher.publish(event_alias, *args, **kwargs)
+
+    def publish_coalesced(self, event_alias, key: typing.Hashable,
+                          *args) -> None:
+        topic = str(event_alias)
+        if self.legacy_topics:
+            self.publisher.publish(topic, *args)
+        pending = self._pending.setdefault(topic, {})
+        pending.pop(key, None)
+        pending[key] = args
+        if topic not in self._scheduled:
+            self._scheduled[topic] = self._reactor.callLater(
+                self.windows.get(topic, self.window),
+                self._flush_scheduled, topic)
+
+    def _flush_scheduled(self, topic: str) -> None:
+        del self._scheduled[topic]
+        self.flush(topic)
+
+    def flush(self, event_alias=None) -> None:
+        """Publish the buffered events immediately. When `event_alias` is
+        not given, all the topics are flushed."""
+        topics = [str(event_alias)] if event_alias is not None \
+            else list(self._pending)
+        for topic in topics:
+            delayed_call = self._scheduled.pop(topic, None)
+            if delayed_call is not None and delayed_call.active():
+                delayed_call.cancel()
+
+            pending = self._pending.pop(topic, None)
+            if not pending:
+                continue
+
+            events = list(pending.values())
+            logger.debug("RPC: Publishing %d coalesced '%s' events",
+                         len(events), topic)
+            self.publisher.publish(topic + self.BATCH_SUFFIX, events)
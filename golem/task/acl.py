@@ -1,4 +1,5 @@
 import abc
+import heapq
 import logging
 import operator
 import time
@@ -6,12 +7,20 @@ import ipaddress
 from enum import Enum
 from typing import Dict, Union, Optional, Tuple, List, cast
 from sortedcontainers import SortedList
+from golem import model
 from golem.model import ACLAllowedNodes, ACLDeniedNodes, GenericKeyValue
 
 from golem.core import common
+from golem.database.executor import log_failure
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of temporary bans tracked at once. Above that the bans
+# closest to their expiry are dropped first.
+MAX_TEMPORARY_BANS = 10000
+# Seconds between sweeps of expired temporary bans
+SWEEP_INTERVAL = 60
+
 
 class AclRule(Enum):
     allow = "allow"
@@ -91,6 +100,9 @@ class _DenyAcl(Acl):
     _max_times: int
     # SortedList of floats = deadlines
     _deny_deadlines: Dict[str, Union[_Always, SortedList]]
+    # Heap of (deadline, node_id) of all temporary bans. Bans dropped in
+    # the meantime by is_allowed() or allow() leave stale entries behind.
+    _expiry: List[Tuple[float, str]]
 
     @classmethod
     def new_from_rules(cls, client, deny_coll: List[str]) -> '_DenyAcl':
@@ -120,12 +132,18 @@ class _DenyAcl(Acl):
 
         self._deny_deadlines = dict((item.node_id, self._always)
                                     for item in self._deny_list)
+        self._expiry = []
+        self._next_sweep = time.time() + SWEEP_INTERVAL
 
     def _read_list(self) -> None:
         nodes = ACLDeniedNodes.select().execute()
         self._deny_list = list(set(self._deny_list + list(nodes)))
 
     def is_allowed(self, node_id: str) -> Tuple[bool, Optional[DenyReason]]:
+        now = time.time()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
         if node_id not in self._deny_deadlines:
             return True, None
 
@@ -135,7 +153,6 @@ class _DenyAcl(Acl):
             return False, DenyReason.blacklisted
 
         assert isinstance(deadlines, SortedList)
-        now = time.time()
         while deadlines and deadlines[-1] <= now:
             del deadlines[-1]
         if not deadlines:
@@ -156,32 +173,55 @@ class _DenyAcl(Acl):
             persist
         )
         if persist:
+            if self._deny_deadlines.get(node_id) is self._always:
+                return False
             self._deny_deadlines[node_id] = self._always
-        else:
-            if node_id not in self._deny_deadlines:
-                self._deny_deadlines[node_id] = SortedList(key=operator.neg)
-            node_deadlines = self._deny_deadlines[node_id]
+            peers = self._client.p2pservice.incoming_peers or dict()
+            if node_id in peers:
+                node = peers[node_id]
+            else:
+                node = dict(node_name="Unknown")
+            model.db_executor.write(
+                self._persist_deny, node_id, node['node_name'],
+            ).addErrback(log_failure, 'acl.disallow')
+            return True
 
-            if node_deadlines is self._always:
-                return False
+        if node_id not in self._deny_deadlines:
+            self._deny_deadlines[node_id] = SortedList(key=operator.neg)
+        node_deadlines = self._deny_deadlines[node_id]
+
+        if node_deadlines is self._always:
+            return False
+
+        assert isinstance(node_deadlines, SortedList)
+        deadline = self._deadline(timeout_seconds)
+        node_deadlines.add(deadline)
+        heapq.heappush(self._expiry, (deadline, node_id))
+        if len(self._expiry) > MAX_TEMPORARY_BANS:
+            self._sweep(time.time())
+        return True
 
-            assert isinstance(node_deadlines, SortedList)
-            node_deadlines.add(self._deadline(timeout_seconds))
+    @staticmethod
+    def _persist_deny(node_id: str, node_name: str) -> None:
+        ACLDeniedNodes.get_or_create(
+            node_id=node_id,
+            defaults={'node_name': node_name},
+        )
 
-        if persist:
-            try:
-                ACLDeniedNodes.get(node_id=node_id)
-                return False
-            except ACLDeniedNodes.DoesNotExist:
-                peers = self._client.p2pservice.incoming_peers or dict()
-                if node_id in peers:
-                    node = peers[node_id]
-                else:
-                    node = dict(node_name="Unknown")
-                node_db = ACLDeniedNodes(
-                    node_id=node_id, node_name=node['node_name'])
-                node_db.save()
-        return True
+    def _sweep(self, now: float) -> None:
+        """ Drop expired temporary bans and, if there are still too many
+        of them, the ones that expire first """
+        self._next_sweep = now + SWEEP_INTERVAL
+        expiry = self._expiry
+        while expiry and (expiry[0][0] <= now
+                          or len(expiry) > MAX_TEMPORARY_BANS):
+            deadline, node_id = heapq.heappop(expiry)
+            deadlines = self._deny_deadlines.get(node_id)
+            if not isinstance(deadlines, SortedList):
+                continue
+            deadlines.discard(deadline)
+            if not deadlines:
+                del self._deny_deadlines[node_id]
 
     def allow(self, node_id: str, persist: bool = False) -> bool:
         logger.info(
@@ -189,21 +229,23 @@ class _DenyAcl(Acl):
             common.short_node_id(node_id),
             persist,
         )
-        if node_id in self._deny_deadlines:
-            del self._deny_deadlines[node_id]
+        deadlines = self._deny_deadlines.pop(node_id, None)
 
         if persist:
-            try:
-                ACLDeniedNodes.get(node_id=node_id)
-            except ACLDeniedNodes.DoesNotExist:
-                return False
-            finally:
-                ACLDeniedNodes \
-                    .delete() \
-                    .where(ACLDeniedNodes.node_id == node_id) \
-                    .execute()
+            # Queued after any pending _persist_deny() of the same node
+            model.db_executor.write(
+                self._persist_allow, node_id,
+            ).addErrback(log_failure, 'acl.allow')
+            return deadlines is self._always
         return True
 
+    @staticmethod
+    def _persist_allow(node_id: str) -> None:
+        ACLDeniedNodes \
+            .delete() \
+            .where(ACLDeniedNodes.node_id == node_id) \
+            .execute()
+
     def status(self) -> AclStatus:
         _always = self._always
         now = time.time()
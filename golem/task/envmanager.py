@@ -1,8 +1,8 @@
 import logging
 from pathlib import Path
-from typing import Dict, List, Type, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Type, Optional, TYPE_CHECKING
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from peewee import PeeweeException
 from twisted.internet.defer import inlineCallbacks, DeferredLock
 
@@ -13,16 +13,42 @@ from golem.model import Performance, EnvConfiguration
 if TYPE_CHECKING:
     # pylint:disable=unused-import, ungrouped-imports
     from twisted.internet.defer import Deferred
+    from twisted.internet.interfaces import IDelayedCall
     from golem.envs import EnvId, Environment, EnvMetadata
     from golem.task.task_api import TaskApiPayloadBuilder
 
 
 logger = logging.getLogger(__name__)
 
+# Clean up an environment after it has not been used for this many seconds
+ENV_IDLE_TIMEOUT = 300.0
+
+
+@dataclass
+class ResourceSlots:
+    cores: int = 0
+    memory_mb: int = 0
+
+    def fits_in(self, other: 'ResourceSlots') -> bool:
+        return self.cores <= other.cores and self.memory_mb <= other.memory_mb
+
+    def __add__(self, other: 'ResourceSlots') -> 'ResourceSlots':
+        return ResourceSlots(
+            self.cores + other.cores,
+            self.memory_mb + other.memory_mb)
+
+    def __sub__(self, other: 'ResourceSlots') -> 'ResourceSlots':
+        return ResourceSlots(
+            self.cores - other.cores,
+            self.memory_mb - other.memory_mb)
+
 
 class EnvironmentManager:
-    """ Manager class for all Environments. Ensures that only one environment
-        is used at a time. Lazily cleans up unused environments."""
+    """ Manager class for all Environments. Several environments can be in
+        use at the same time; each of them is prepared on first use and
+        cleaned up after being idle for `idle_timeout` seconds. Resources
+        (cores, memory) are reserved per environment out of the capacity set
+        with `set_capacity`. """
 
     @dataclass
     class EnvEntry:
@@ -30,41 +56,116 @@ class EnvironmentManager:
         metadata: 'EnvMetadata'
         payload_builder: 'Type[TaskApiPayloadBuilder]'
 
-    def __init__(self, runtime_logs_dir: Path) -> None:
+    @dataclass
+    class EnvUsage:
+        lock: DeferredLock = field(default_factory=DeferredLock)
+        in_use: bool = False
+        prepared: bool = False
+        idle_call: 'Optional[IDelayedCall]' = None
+
+    def __init__(
+            self,
+            runtime_logs_dir: Path,
+            idle_timeout: float = ENV_IDLE_TIMEOUT,
+            reactor: Optional[Any] = None,
+    ) -> None:
+        if reactor is None:
+            from twisted.internet import reactor as default_reactor
+            reactor = default_reactor
+        self._reactor = reactor
         self._runtime_logs_dir = runtime_logs_dir
+        self._idle_timeout = idle_timeout
         self._envs: 'Dict[EnvId, EnvironmentManager.EnvEntry]' = {}
         self._state = EnvStates()
         self._running_benchmark: bool = False
-        self._lock = DeferredLock()
-        self._active_env: 'Optional[Environment]' = None
+        self._usage: 'Dict[Environment, EnvironmentManager.EnvUsage]' = {}
+        self._capacity: Optional[ResourceSlots] = None
+        self._reserved: 'Dict[EnvId, ResourceSlots]' = {}
 
     @inlineCallbacks
     def _start_usage(self, env: 'Environment') -> 'Deferred':
-        yield self._lock.acquire()
-
-        if self._active_env is env:
-            return
-
-        if self._active_env is not None:
-            try:
-                yield self._active_env.clean_up()
-                self._active_env = None
-            except Exception:
-                yield self._lock.release()
-                raise
-
+        usage = self._usage.setdefault(env, EnvironmentManager.EnvUsage())
+        yield usage.lock.acquire()
         try:
-            yield env.prepare()
-            self._active_env = env
-        except Exception:
-            yield self._lock.release()
-            raise
+            if usage.idle_call is not None and usage.idle_call.active():
+                usage.idle_call.cancel()
+            usage.idle_call = None
+
+            if not usage.prepared:
+                yield env.prepare()
+                usage.prepared = True
+            usage.in_use = True
+        finally:
+            usage.lock.release()
 
     @inlineCallbacks
     def _end_usage(self, env: 'Environment') -> 'Deferred':
-        if self._active_env is not env:
+        usage = self._usage.get(env)
+        if usage is None or not usage.in_use:
             raise ValueError('end_usage called for wrong environment')
-        yield self._lock.release()
+        usage.in_use = False
+        usage.idle_call = self._reactor.callLater(
+            self._idle_timeout, self._clean_up_idle, env)
+        yield None
+
+    @inlineCallbacks
+    def _clean_up_idle(self, env: 'Environment') -> 'Deferred':
+        usage = self._usage[env]
+        usage.idle_call = None
+        yield usage.lock.acquire()
+        try:
+            if usage.in_use or not usage.prepared:
+                return
+            logger.info('Cleaning up idle environment. env=%r', env)
+            yield env.clean_up()
+            usage.prepared = False
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Failed to clean up environment. env=%r', env)
+        finally:
+            usage.lock.release()
+
+    def in_use(self) -> 'List[Environment]':
+        """ Get the environments which are currently in use. """
+        return [env for env, usage in self._usage.items() if usage.in_use]
+
+    def set_capacity(self, capacity: Optional[ResourceSlots]) -> None:
+        """ Set the resources to be shared by all environments.
+            None means no limit. """
+        self._capacity = capacity
+
+    def free_resources(self) -> Optional[ResourceSlots]:
+        """ Get the resources not reserved by any environment.
+            None means no limit. """
+        if self._capacity is None:
+            return None
+        free = self._capacity
+        for reserved in self._reserved.values():
+            free = free - reserved
+        return free
+
+    def reserved(self, env_id: 'EnvId') -> ResourceSlots:
+        """ Get the resources reserved by the given environment. """
+        return self._reserved.get(env_id, ResourceSlots())
+
+    def reserve(self, env_id: 'EnvId', slots: ResourceSlots) -> bool:
+        """ Reserve resources for the given environment. Returns False if
+            there are not enough free resources. """
+        free = self.free_resources()
+        if free is not None and not slots.fits_in(free):
+            return False
+        self._reserved[env_id] = self.reserved(env_id) + slots
+        return True
+
+    def release(self, env_id: 'EnvId', slots: ResourceSlots) -> None:
+        """ Release resources reserved by the given environment. """
+        remaining = self.reserved(env_id) - slots
+        if remaining.cores < 0 or remaining.memory_mb < 0:
+            raise ValueError(
+                f"Releasing more resources than reserved by '{env_id}'")
+        if remaining == ResourceSlots():
+            self._reserved.pop(env_id, None)
+        else:
+            self._reserved[env_id] = remaining
 
     def register_env(
             self,
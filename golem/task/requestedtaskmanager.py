@@ -30,6 +30,7 @@ from golem.model import (
     ComputingNode,
     RequestedTask,
     RequestedSubtask,
+    db_executor,
 )
 from golem.task.helpers import calculate_subtask_payment
 from golem.task.taskstate import (
@@ -386,7 +387,8 @@ class RequestedTaskManager:
         again, e.g. in case of failed verification a subtask may be marked
         as pending again. """
         logger.debug('has_pending_subtasks(task_id=%r)', task_id)
-        task = RequestedTask.get(RequestedTask.task_id == task_id)
+        task = await db_executor.run_read(
+            RequestedTask.get, RequestedTask.task_id == task_id)
         if not task.status.is_active():
             logger.debug('task not active. task_id=%r', task_id)
             return False
@@ -405,8 +407,10 @@ class RequestedTaskManager:
             computing_node
         )
         # Check is my requested task
-        task = RequestedTask.get(RequestedTask.task_id == task_id)
-        node, _ = ComputingNode.get_or_create(
+        task = await db_executor.run_read(
+            RequestedTask.get, RequestedTask.task_id == task_id)
+        node, _ = await db_executor.run_write(
+            ComputingNode.get_or_create,
             node_id=computing_node.node_id,
             defaults={'name': computing_node.name}
         )
@@ -416,7 +420,9 @@ class RequestedTaskManager:
             raise RuntimeError(f"No subtasks for self. task_id={task_id}")
 
         # Check should accept provider, raises when waiting on results or banned
-        if self._get_unfinished_subtasks_for_node(task_id, node) > 0:
+        unfinished = await db_executor.run_read(
+            self._get_unfinished_subtasks_for_node, task_id, node)
+        if unfinished > 0:
             logger.warning(
                 "Provider has unfinished subtasks, no next subtask. "
                 "task_id=%s", task_id)
@@ -440,7 +446,8 @@ class RequestedTaskManager:
                 "task_id=%r, node_id=%r", task_id, node.node_id)
             return None
 
-        subtask = RequestedSubtask.create(
+        subtask = await db_executor.run_write(
+            RequestedSubtask.create,
             task=task,
             subtask_id=subtask_id,
             status=SubtaskStatus.starting,
@@ -463,7 +470,7 @@ class RequestedTaskManager:
             op=SubtaskOp.ASSIGNED
         )
         task.status = TaskStatus.computing
-        task.save()
+        await db_executor.run_write(task.save)
 
         self._schedule_subtask_timeout(subtask, task.subtask_timeout)
 
@@ -481,7 +488,9 @@ class RequestedTaskManager:
             subtask_id: 'SubtaskId'
     ) -> VerifyResult:
         if not self._verification_queue:
-            self._verification_queue = VerificationQueue(self._verify)
+            self._verification_queue = VerificationQueue(
+                self._verify,
+                workers=os.cpu_count() or 1)
         return await self._verification_queue.put(task_id, subtask_id)
 
     async def _verify(
@@ -18,6 +18,11 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait before connecting again to a node that was unreachable,
+# doubled after every consecutive failure
+RECONNECT_BACKOFF_MIN = 10
+RECONNECT_BACKOFF_MAX = 900
+
 
 class TaskMessagesQueueMixin:
     """Message Queue functionality for TaskServer"""
@@ -31,6 +36,9 @@ class TaskMessagesQueueMixin:
         #   TaskSession - session established
         # Keys are always node_id a.k.a. key_id
         self.sessions: 'typing.Dict[str, typing.Optional[TaskSession]]' = {}
+        # node_id -> (time of the next connection attempt, current backoff)
+        self._reconnect_backoff: typing.Dict[str, typing.Tuple[float, float]] \
+            = {}
 
         for attr_name in (
                 'conn_established_for_type',
@@ -66,6 +74,7 @@ class TaskMessagesQueueMixin:
                 "Don't have any info about node. Will try later. node_id=%r",
                 node_id,
             )
+            self._back_off(node_id)
             return
         result = self._add_pending_request(  # type: ignore
             'msg_queue',
@@ -90,9 +99,27 @@ class TaskMessagesQueueMixin:
         self.remove_pending_conn(session.conn_id)
 
     def connect_to_nodes(self):
-        for node_id in msg_queue.waiting():
+        now = time.time()
+        waiting = set(msg_queue.waiting())
+        for node_id in set(self._reconnect_backoff) - waiting:
+            # No messages left for this node
+            del self._reconnect_backoff[node_id]
+        for node_id in waiting:
+            if node_id not in self.sessions \
+                    and node_id in self._reconnect_backoff \
+                    and self._reconnect_backoff[node_id][0] > now:
+                continue
             self.initiate_session(node_id)
 
+    def _back_off(self, node_id: str) -> None:
+        try:
+            _, backoff = self._reconnect_backoff[node_id]
+        except KeyError:
+            backoff = RECONNECT_BACKOFF_MIN
+        else:
+            backoff = min(backoff * 2, RECONNECT_BACKOFF_MAX)
+        self._reconnect_backoff[node_id] = (time.time() + backoff, backoff)
+
     def sweep_sessions(self):
         # Iterate over shallow copy to avoid problems with
         # dict changing size during iteration.
@@ -130,6 +157,7 @@ class TaskMessagesQueueMixin:
         session.key_id = node_id
         session.conn_id = conn_id
         self.sessions[node_id] = session
+        self._reconnect_backoff.pop(node_id, None)
         self._mark_connected(  # type: ignore
             conn_id,
             session.address,
@@ -166,3 +194,4 @@ class TaskMessagesQueueMixin:
                 del self.sessions[node_id]
         except KeyError:
             pass
+        self._back_off(node_id)
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import threading
 import logging
@@ -31,6 +32,8 @@ class TaskArchiver(object):
         self._archive_lock = threading.Lock()
         self._file_lock = threading.Lock()
         self._archive = Archive()
+        # Whether the archive changed since it was last dumped
+        self._dirty = False
         self._dump_file = None
         self._max_tasks = max_tasks
         log.debug('Starting taskarchiver in dir: %r', datadir)
@@ -66,8 +69,8 @@ class TaskArchiver(object):
         """Updates information on unsupported task reasons and
         other related task statistics by consuming tasks and support statuses
         scheduled for processing by add_task() and add_support_status()
-        functions. Optimizes internal structures and, if needed, writes the
-        entire structure to a file.
+        functions. Optimizes internal structures and, if anything changed
+        since the last dump, writes the entire structure to a file.
         """
         with self._input_lock:
             input_tasks, self._input_tasks = self._input_tasks, []
@@ -77,10 +80,12 @@ class TaskArchiver(object):
             if ntasks_to_take < len(input_tasks):
                 log.warning("Maximum number of current tasks exceeded.")
             input_tasks = input_tasks[:ntasks_to_take]
+            changed = bool(input_tasks)
             for tsk in input_tasks:
                 self._archive.tasks[tsk.uuid] = tsk
             for (uuid, status) in input_statuses:
                 if uuid in self._archive.tasks:
+                    changed = True
                     if UnsupportReason.REQUESTOR_TRUST in status.desc:
                         self._archive.tasks[uuid].requesting_trust = \
                             status.desc[UnsupportReason.REQUESTOR_TRUST]
@@ -91,8 +96,11 @@ class TaskArchiver(object):
                 if cur_time > tsk.deadline:
                     self._merge_to_interval(tsk)
                     del self._archive.tasks[tsk.uuid]
-            self._purge_old_intervals()
-            if self._dump_file:
+                    changed = True
+            if self._purge_old_intervals():
+                changed = True
+            self._dirty = self._dirty or changed
+            if self._dump_file and self._dirty:
                 request = golem_async.AsyncRequest(self._dump_archive)
                 golem_async.async_run(
                     request,
@@ -101,11 +109,33 @@ class TaskArchiver(object):
                 )
 
     def _dump_archive(self):
+        # Pickle a copy, so the archive lock is not held while serialising
         with self._archive_lock:
-            data = pickle.dumps(self._archive)
-        with self._file_lock:
-            with open(self._dump_file, 'wb') as f:
+            if not self._dirty:
+                return
+            archive = self._archive.copy()
+            self._dirty = False
+        try:
+            data = pickle.dumps(archive)
+            with self._file_lock:
+                self._write_dump(data)
+        except Exception:
+            with self._archive_lock:
+                self._dirty = True
+            raise
+
+    def _write_dump(self, data):
+        # Replace the file atomically; a crash leaves the previous dump
+        tmp_file = self._dump_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
                 f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self._dump_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     def _merge_to_interval(self, tsk):
         day = tsk.interval_start_date
@@ -118,9 +148,12 @@ class TaskArchiver(object):
         today = datetime.datetime.now(pytz.utc) \
             .replace(hour=0, minute=0, second=0, microsecond=0)
         old = today - datetime.timedelta(days=TASKARCHIVE_NUM_INTERVALS)
+        purged = False
         for interval in list(self._archive.intervals.values()):
             if interval.start_date <= old:
                 del self._archive.intervals[interval.start_date]
+                purged = True
+        return purged
 
     def get_unsupport_reasons(self, last_n_days, today=None):
         """
@@ -183,6 +216,16 @@ class Archive(object):
         self.tasks = {}
         self.intervals = {}
 
+    def copy(self):
+        """Copy that is not affected by further archive updates."""
+        archive = copy.copy(self)
+        # Task attributes are only ever reassigned, a shallow copy will do
+        archive.tasks = {uuid: copy.copy(tsk)
+                         for uuid, tsk in self.tasks.items()}
+        archive.intervals = {day: interval.copy()
+                             for day, interval in self.intervals.items()}
+        return archive
+
 
 class ArchTask(object):
     """All known tasks that have not been aggregated yet."""
@@ -208,6 +251,12 @@ class TimeInterval(object):
         self.num_requesting_trust = 0
         self.cnt_unsupport_reasons = Counter()
 
+    def copy(self):
+        interval = copy.copy(self)
+        interval.cnt_min_version = Counter(self.cnt_min_version)
+        interval.cnt_unsupport_reasons = Counter(self.cnt_unsupport_reasons)
+        return interval
+
     def merge_task(self, tsk):
         self.sum_max_price += tsk.max_price
         self.cnt_min_version[tsk.min_version] += 1
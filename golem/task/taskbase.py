@@ -1,7 +1,9 @@
 import abc
 import logging
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Type, TYPE_CHECKING
+from typing import (
+    Callable, Dict, List, Optional, Tuple, Type, TYPE_CHECKING,
+)
 
 from dataclasses import dataclass, field
 from golem_messages.datastructures import stats as dt_stats
@@ -118,6 +120,11 @@ class Task(abc.ABC):
     PROVIDER_MARKET_STRATEGY: Type[ProviderMarketStrategy]\
         = DEFAULT_PROVIDER_MARKET_STRATEGY
 
+    # Dictionaries keyed by subtask id. A journaled subtask update records
+    # only the entry of the updated subtask (see golem.task.taskjournal).
+    # Tasks which don't declare any are always persisted as full snapshots.
+    JOURNAL_SUBTASK_ATTRS: Tuple[str, ...] = ()
+
     class ExtraData(object):
         def __init__(self, ctd=None, **kwargs):
             self.ctd = ctd
@@ -145,6 +152,14 @@ class Task(abc.ABC):
     def __repr__(self):
         return '<Task: %r>' % (self.header,)
 
+    def journal_paths(self, subtask_id: str) -> List[tuple]:
+        """ Return the parts of the task, other than the entries in
+        `JOURNAL_SUBTASK_ATTRS`, which an update of the given subtask may
+        change. Each path is an attribute name followed by dictionary keys,
+        list indices or, for other objects, attribute names. """
+        # pylint:disable=unused-argument,no-self-use
+        return []
+
     @classmethod
     def calculate_subtask_budget(cls, task_definition: 'TaskDefinition'):
         """
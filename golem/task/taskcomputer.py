@@ -10,7 +10,7 @@ import time
 import uuid
 from threading import Lock
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from golem_messages.message.tasks import TaskFailure
 from golem_task_api import ProviderAppClient, constants as task_api_constants
 from golem_task_api.envs import DOCKER_CPU_ENV_ID, DOCKER_GPU_ENV_ID
@@ -28,6 +28,7 @@ from golem.envs.docker.gpu import DockerGPUConfig
 from golem.hardware import scale_memory, MemSize
 from golem.manager.nodestatesnapshot import ComputingSubtaskStateSnapshot
 from golem.resource.dirmanager import DirManager
+from golem.task.envmanager import ResourceSlots
 from golem.task.task_api import EnvironmentTaskApiService
 from golem.task.timer import ProviderTimer
 from golem.vm.vm import PythonProcVM, PythonTestVM
@@ -90,6 +91,11 @@ class TaskComputerAdapter:
             return 0
         return self._old_computer.free_cores
 
+    def admissible_subtasks(self, task_id: str) -> int:
+        if self._new_computer.has_assigned_task():
+            return 0
+        return self._old_computer.admissible_subtasks(task_id)
+
     @property
     def dir_manager(self) -> DirManager:
         # FIXME: This shouldn't be part of the public interface probably
@@ -105,7 +111,8 @@ class TaskComputerAdapter:
             self,
             ctd: 'ComputeTaskDef',
             cpu_time_limit: Optional[int] = None
-    ) -> None:
+    ) -> bool:
+        """ Returns False if the subtask was not accepted """
         assert not self._new_computer.has_assigned_task()
         assert self._old_computer.can_take_work() or \
             self._old_computer.is_disabled()
@@ -113,9 +120,8 @@ class TaskComputerAdapter:
         task_id = ctd['task_id']
         task_header = self._task_server.task_keeper.task_headers[task_id]
         if task_header.environment_prerequisites is not None:
-            self._new_computer.task_given(task_header, ctd)
-        else:
-            self._old_computer.task_given(ctd, cpu_time_limit)
+            return self._new_computer.task_given(task_header, ctd)
+        return self._old_computer.task_given(ctd, cpu_time_limit)
 
     def has_assigned_task(self) -> bool:
         return self._new_computer.has_assigned_task() \
@@ -225,9 +231,9 @@ class TaskComputerAdapter:
         else:
             raise RuntimeError('task_interrupted: No task assigned.')
 
-    def can_take_work(self) -> bool:
+    def can_take_work(self, task_id: Optional[str] = None) -> bool:
         if self._old_computer.has_assigned_task():
-            return self._old_computer.can_take_work()
+            return self._old_computer.can_take_work(task_id)
         return not self._new_computer.has_assigned_task()
 
     def check_timeout(self) -> None:
@@ -287,6 +293,7 @@ class NewTaskComputer:
         performance: float
         subtask_timeout: int
         deadline: int
+        resources: ResourceSlots
 
     def __init__(
             self,
@@ -301,6 +308,9 @@ class NewTaskComputer:
         self._computation: Optional[defer.Deferred] = None
         self._app_client: Optional[ProviderAppClient] = None
         self._start_time: Optional[float] = None
+        # Capacity of the environments. Their containers are given all the
+        # cores, so a subtask reserves all of them and its own memory.
+        self._env_resources = ResourceSlots()
 
     def has_assigned_task(self) -> bool:
         return self._assigned_task is not None
@@ -327,20 +337,48 @@ class NewTaskComputer:
             self,
             task_header: 'TaskHeader',
             compute_task_def: 'ComputeTaskDef'
-    ) -> None:
+    ) -> bool:
+        """ Returns False if the environment's resources can't be reserved
+        for the subtask """
         assert not self.has_assigned_task()
+        env_id = task_header.environment
+        resources = self._requested_resources(task_header)
+        if not self._env_manager.reserve(env_id, resources):
+            logger.warning(
+                'Not enough free resources for subtask. subtask_id=%r, '
+                'env_id=%r, requested=%r, free=%r',
+                compute_task_def['subtask_id'],
+                env_id,
+                resources,
+                self._env_manager.free_resources(),
+            )
+            return False
         self._assigned_task = self.AssignedTask(
             task_id=task_header.task_id,
             subtask_id=compute_task_def['subtask_id'],
             subtask_params=compute_task_def['extra_data'],
-            env_id=task_header.environment,
+            env_id=env_id,
             prereq_dict=task_header.environment_prerequisites,
             performance=compute_task_def['performance'],
             subtask_timeout=task_header.subtask_timeout,
-            deadline=min(task_header.deadline, compute_task_def['deadline'])
+            deadline=min(task_header.deadline, compute_task_def['deadline']),
+            resources=resources,
         )
         ProviderTimer.start()
         self.get_subtask_inputs_dir().mkdir(parents=True, exist_ok=True)
+        return True
+
+    def _requested_resources(
+            self,
+            task_header: 'TaskHeader'
+    ) -> ResourceSlots:
+        """ Resources reserved by a subtask of the given task. Memory is
+        taken from the task's estimate if it declares one. """
+        # Estimated memory is given in bytes; round up to whole MiB
+        memory_mb = -(-int(task_header.estimated_memory or 0) // 2 ** 20)
+        return ResourceSlots(
+            cores=self._env_resources.cores,
+            memory_mb=memory_mb or self._env_resources.memory_mb)
 
     def compute(self) -> defer.Deferred:
         assigned_task = self._assigned_task
@@ -438,6 +476,8 @@ class NewTaskComputer:
                 subtask_id=assigned_task.subtask_id,
                 min_performance=assigned_task.performance,
             )
+            self._env_manager.release(
+                assigned_task.env_id, assigned_task.resources)
             self._computation = None
             self._assigned_task = None
             self._start_time = None
@@ -488,6 +528,10 @@ class NewTaskComputer:
                 to_unit=MemSize.mebi
             )
         )
+        self._env_resources = ResourceSlots(
+            cores=config_dict['cpu_count'],
+            memory_mb=config_dict['memory_mb'])
+        self._env_manager.set_capacity(self._env_resources)
 
         # FIXME: Decide how to properly configure environments
         if self._env_manager.enabled(DOCKER_CPU_ENV_ID):
@@ -506,13 +550,13 @@ class NewTaskComputer:
 
 @dataclass
 class TaskComputation:
-    """Represents single computation in TaskComputer.  There could be only one
-    non-single core computation or multiple single-core computations.
+    """Represents single computation in TaskComputer. Computations run side
+    by side as long as their reserved resources fit in the configured limits.
     """
     task_computer: 'TaskComputer'
     assigned_subtask: 'ComputeTaskDef'
     counting_thread: Optional[TaskThread] = None
-    single_core: bool = False
+    resources: ResourceSlots = field(default_factory=ResourceSlots)
     cpu_limit: Optional[int] = None
 
     @property
@@ -548,12 +592,19 @@ class TaskComputation:
         except TypeError:
             return None
 
+        free = self.task_computer.free_resources()
         task_state = ComputingSubtaskStateSnapshot(
             subtask_id=self.assigned_subtask['subtask_id'],
             progress=counting_thread.get_progress(),
             seconds_to_timeout=counting_thread.task_timeout,
             running_time_seconds=(time.time() - counting_thread.start_time),
             outfilebasename=out_file_basename,
+            reserved_cores=self.resources.cores,
+            reserved_memory_mb=self.resources.memory_mb,
+            free_cores=free.cores,
+            free_memory_mb=(
+                free.memory_mb if self.task_computer.max_memory_mb is not None
+                else None),
             **counting_thread.extra_data,
         )
         return task_state
@@ -709,7 +760,16 @@ class TaskComputation:
 
 class TaskComputer:  # pylint: disable=too-many-instance-attributes
     """ TaskComputer is responsible for task computations that take
-    place in Golem application. Tasks are started in separate threads. """
+    place in Golem application. Tasks are started in separate threads.
+
+    Subtasks are admitted while the cores and memory they reserve fit in
+    `max_num_cores` and `max_memory_mb`, the others are refused. Task
+    headers don't declare a core count and the containers of multi-core
+    environments are given all the configured cores, so a subtask of
+    a single-core environment reserves one core and any other subtask
+    reserves all of them. The memory reserved is the task's estimated
+    memory, subtasks of tasks that need more than `max_memory_mb` are
+    refused even on an idle computer. """
 
     lock = Lock()
     dir_lock = Lock()
@@ -736,30 +796,99 @@ class TaskComputer:  # pylint: disable=too-many-instance-attributes
 
         self.support_direct_computation = False
         self.max_num_cores: int = 1
+        # None means that memory is not accounted for
+        self.max_memory_mb: Optional[int] = None
         self.finished_cb = finished_cb
 
-    def _is_single_core_task(self, task_id: str) -> bool:
+    def requested_resources(self, task_id: str) -> ResourceSlots:
+        """ Resources reserved by a single subtask of the given task """
         task_header = self.task_server.task_keeper.task_headers.get(task_id)
         if task_header is None:
+            return ResourceSlots(cores=self.max_num_cores)
+        if self.task_server.is_task_single_core(task_header):
+            cores = 1
+        else:
+            cores = self.max_num_cores
+        # Estimated memory is given in bytes; round up to whole MiB
+        memory_mb = -(-int(task_header.estimated_memory or 0) // 2 ** 20)
+        return ResourceSlots(cores=cores, memory_mb=memory_mb)
+
+    def _free_resources(self) -> ResourceSlots:
+        reserved = ResourceSlots()
+        for computation in self.assigned_subtasks:
+            reserved = reserved + computation.resources
+        capacity = ResourceSlots(
+            cores=self.max_num_cores,
+            memory_mb=self.max_memory_mb or 0)
+        return capacity - reserved
+
+    def free_resources(self) -> ResourceSlots:
+        with self.lock:
+            return self._free_resources()
+
+    def _within_limits(self, request: ResourceSlots) -> bool:
+        """ Whether the request could fit on an idle computer """
+        if request.cores > self.max_num_cores:
+            return False
+        return self.max_memory_mb is None \
+            or request.memory_mb <= self.max_memory_mb
+
+    def _fits(self, request: ResourceSlots) -> bool:
+        if self.is_disabled() or not self._within_limits(request):
             return False
-        return self.task_server.is_task_single_core(task_header)
+        if not self.assigned_subtasks:
+            return True
+        free = self._free_resources()
+        if self.max_memory_mb is None:
+            return request.cores <= free.cores
+        return request.fits_in(free)
+
+    def admissible_subtasks(self, task_id: str) -> int:
+        """ Number of subtasks of the given task that can be admitted now """
+        with self.lock:
+            request = self.requested_resources(task_id)
+            if not self._fits(ResourceSlots(cores=1)) \
+                    or not self._within_limits(request):
+                return 0
+            if not self.assigned_subtasks:
+                free = ResourceSlots(
+                    cores=self.max_num_cores,
+                    memory_mb=self.max_memory_mb or 0)
+            else:
+                free = self._free_resources()
+            count = free.cores // max(request.cores, 1)
+            if self.max_memory_mb is not None and request.memory_mb > 0:
+                count = min(count, free.memory_mb // request.memory_mb)
+            return max(count, 0)
 
     def task_given(
             self,
             ctd: 'ComputeTaskDef',
             cpu_time_limit: Optional[int] = None
-    ) -> None:
+    ) -> bool:
+        """ Returns False if the subtask doesn't fit in the free resources """
         task_id = ctd.get('task_id')
-        single_core = self._is_single_core_task(task_id)
-        if not self.assigned_subtasks:
-            ProviderTimer.start()
+        resources = self.requested_resources(task_id)
 
-        self.assigned_subtasks.append(
-            TaskComputation(
-                task_computer=self,
-                assigned_subtask=ctd,
-                single_core=single_core,
-                cpu_limit=cpu_time_limit))
+        with self.lock:
+            if not self._fits(resources):
+                logger.warning(
+                    "Subtask exceeds the free resources. subtask_id=%r, "
+                    "requested=%r, free=%r", ctd.get('subtask_id'),
+                    resources, self._free_resources())
+                return False
+            if not self.assigned_subtasks:
+                ProviderTimer.start()
+            self.assigned_subtasks.append(
+                TaskComputation(
+                    task_computer=self,
+                    assigned_subtask=ctd,
+                    resources=resources,
+                    cpu_limit=cpu_time_limit))
+            logger.debug(
+                "Subtask admitted. subtask_id=%r, reserved=%r, free=%r",
+                ctd.get('subtask_id'), resources, self._free_resources())
+        return True
 
     def has_assigned_task(self) -> bool:
         logger.debug(
@@ -810,14 +939,13 @@ class TaskComputer:  # pylint: disable=too-many-instance-attributes
         with self.lock:
             return any([c for c in self.assigned_subtasks if c.computing])
 
-    def can_take_work(self) -> bool:
+    def can_take_work(self, task_id: Optional[str] = None) -> bool:
+        """ Whether a subtask of the given task (or a single-core subtask,
+        if no task is given) can be admitted now """
         with self.lock:
-            if any([
-                    computation for computation in self.assigned_subtasks
-                    if not computation.single_core
-            ]):
-                return False
-            return len(self.assigned_subtasks) < self.max_num_cores
+            if task_id is None:
+                return self._fits(ResourceSlots(cores=1))
+            return self._fits(self.requested_resources(task_id))
 
     def is_disabled(self):
         return self.max_num_cores < 1
@@ -825,13 +953,7 @@ class TaskComputer:  # pylint: disable=too-many-instance-attributes
     @property
     def free_cores(self) -> int:
         with self.lock:
-            if any([
-                    computation for computation in self.assigned_subtasks
-                    if not computation.single_core
-            ]):
-                return 0
-            n = len(self.assigned_subtasks)
-            return self.max_num_cores - n if n < self.max_num_cores else 0
+            return max(self._free_resources().cores, 0)
 
     def get_environment(self):
         task_header_keeper = self.task_server.task_keeper
@@ -860,6 +982,10 @@ class TaskComputer:  # pylint: disable=too-many-instance-attributes
         dm.build_config(config_desc)
         work_dirs = [Path(self.dir_manager.root_path)]
         self.max_num_cores = config_desc.num_cores
+        self.max_memory_mb = int(scale_memory(
+            config_desc.max_memory_size,
+            unit=MemSize.kibi,
+            to_unit=MemSize.mebi)) or None
 
         if dm.hypervisor and self.use_docker_manager:  # noqa pylint: disable=no-member
             deferred = defer.Deferred()
@@ -924,17 +1050,13 @@ class TaskComputer:  # pylint: disable=too-many-instance-attributes
         :param candidate_tasks:
         :return:
         """
-        if not self.assigned_subtasks:
-            return candidate_tasks
-        tasks = candidate_tasks
-        for c in self.assigned_subtasks:
-            if not c.single_core:
-                return set()
-            tasks = tasks - {c.assigned_task_id}
-        return {
-            task_id for task_id in candidate_tasks
-            if self._is_single_core_task(task_id)
-        }
+        with self.lock:
+            if not self.assigned_subtasks:
+                return candidate_tasks
+            return {
+                task_id for task_id in candidate_tasks
+                if self._fits(self.requested_resources(task_id))
+            }
 
     def quit(self):
         for computation in self.assigned_subtasks:
@@ -0,0 +1,249 @@
+import functools
+import logging
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint:disable=unused-import
+    from golem.task.taskbase import Task
+    from golem.task.taskstate import TaskState
+
+logger = logging.getLogger(__name__)
+
+# Write a full snapshot after this many journaled subtask updates...
+SNAPSHOT_EVERY = 500
+# ... or when the last snapshot is older than this many seconds
+SNAPSHOT_INTERVAL = 300.0
+
+_REMOVED = '__removed__'
+
+
+class TaskJournal:
+    """ Persists requested tasks as periodic full snapshots plus
+    an append-only journal of per-subtask deltas.
+
+    A snapshot is the pickled `(task, state, generation)` tuple, written
+    to a temporary file and renamed over `<task_id>.pickle`. Every subtask
+    update in between appends a single record to `<task_id>.journal`.
+    The journal starts with the generation of the snapshot it applies to,
+    so a journal left over from a crash between the rename and the journal
+    truncation is recognised as stale and ignored on restore.
+
+    A delta record contains the `SubtaskState` of the updated subtask,
+    the remaining (scalar) fields of the `TaskState`, the entries of the
+    updated subtask in the dictionaries listed by the task's
+    `JOURNAL_SUBTASK_ATTRS` and the entries returned by its
+    `journal_paths()`, so its size doesn't depend on the number of
+    subtasks. Each record is pickled as a single object. Tasks which
+    don't list any per-subtask dictionaries are persisted as full
+    snapshots only.
+    """
+
+    def __init__(self, journal_dir: Path,
+                 snapshot_every: int = SNAPSHOT_EVERY,
+                 snapshot_interval: float = SNAPSHOT_INTERVAL) -> None:
+        self.journal_dir = journal_dir
+        self.snapshot_every = snapshot_every
+        self.snapshot_interval = snapshot_interval
+        self._generation: Dict[str, int] = {}
+        self._pending: Dict[str, int] = {}
+        self._last_snapshot: Dict[str, float] = {}
+
+    def snapshot_path(self, task_id: str) -> Path:
+        return self.journal_dir / ('%s.pickle' % (task_id,))
+
+    def journal_path(self, task_id: str) -> Path:
+        return self.journal_dir / ('%s.journal' % (task_id,))
+
+    def needs_snapshot(self, task_id: str, task: 'Task') -> bool:
+        if not task.JOURNAL_SUBTASK_ATTRS:
+            return True
+        if task_id not in self._generation:
+            return True
+        if self._pending.get(task_id, 0) >= self.snapshot_every:
+            return True
+        elapsed = time.monotonic() - self._last_snapshot.get(task_id, 0.0)
+        return elapsed >= self.snapshot_interval
+
+    def write_snapshot(self, task_id: str,
+                       task: 'Task', state: 'TaskState') -> None:
+        generation = self._generation.get(task_id, 0) + 1
+        filepath = self.snapshot_path(task_id)
+        tmp_path = filepath.with_suffix('.tmp')
+        try:
+            with tmp_path.open('wb') as f:
+                pickle.dump((task, state, generation), f, protocol=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(str(tmp_path), str(filepath))
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        self._generation[task_id] = generation
+        # Don't journal against the new snapshot until its journal is reset
+        self._pending[task_id] = self.snapshot_every
+        with self.journal_path(task_id).open('wb') as f:
+            pickle.dump(generation, f, protocol=2)
+
+        self._pending[task_id] = 0
+        self._last_snapshot[task_id] = time.monotonic()
+
+    def append_delta(self, task_id: str, subtask_id: str,
+                     task: 'Task', state: 'TaskState') -> None:
+        # Pickle before opening the journal, a failure mustn't leave
+        # a partial record behind
+        data = pickle.dumps(_build_delta(subtask_id, task, state), protocol=2)
+        with self.journal_path(task_id).open('ab') as f:
+            f.write(data)
+        self._pending[task_id] = self._pending.get(task_id, 0) + 1
+
+    def load(self, task_id: str) -> Tuple['Task', 'TaskState']:
+        """ Load the snapshot of a task and replay its journal.
+        Raises if the snapshot itself cannot be read. """
+        with self.snapshot_path(task_id).open('rb') as f:
+            data = pickle.load(f)
+
+        # Snapshots written before the journal was introduced
+        # are plain (task, state) pairs
+        if len(data) == 2:
+            task, state = data
+            generation = 0
+        else:
+            task, state, generation = data
+
+        replayed = self._replay(task_id, generation, task, state)
+        if replayed is None:
+            # No usable journal; the next update will write a snapshot
+            return task, state
+
+        logger.debug('Replayed %d journal records. task_id=%s',
+                     replayed, task_id)
+        self._generation[task_id] = generation
+        self._pending[task_id] = replayed
+        self._last_snapshot[task_id] = time.monotonic()
+        return task, state
+
+    def _replay(self, task_id: str, generation: int,
+                task: 'Task', state: 'TaskState') -> Optional[int]:
+        journal_path = self.journal_path(task_id)
+        if not journal_path.exists():
+            return None
+
+        replayed = 0
+        with journal_path.open('rb') as f:
+            try:
+                journal_generation = pickle.load(f)
+            except Exception:  # pylint: disable=broad-except
+                return None
+            if journal_generation != generation:
+                logger.debug('Ignoring stale journal. task_id=%s', task_id)
+                return None
+
+            while True:
+                try:
+                    record = pickle.load(f)
+                except EOFError:
+                    break
+                except Exception:  # pylint: disable=broad-except
+                    # A partially written record left by a crash
+                    logger.warning('Truncated journal. task_id=%s', task_id)
+                    break
+                try:
+                    _apply_delta(record, task, state)
+                except Exception:  # pylint: disable=broad-except
+                    logger.warning('Cannot replay journal record. '
+                                   'task_id=%s', task_id, exc_info=True)
+                    break
+                replayed += 1
+        return replayed
+
+    def remove(self, task_id: str) -> None:
+        self._generation.pop(task_id, None)
+        self._pending.pop(task_id, None)
+        self._last_snapshot.pop(task_id, None)
+        try:
+            self.journal_path(task_id).unlink()
+        except (FileNotFoundError, OSError):
+            pass
+
+
+def _build_delta(subtask_id: str,
+                 task: 'Task', state: 'TaskState') -> Dict[str, Any]:
+    return {
+        'subtask_id': subtask_id,
+        'subtask_state': state.subtask_states.get(subtask_id),
+        'state': {
+            key: value for key, value in state.__dict__.items()
+            if key != 'subtask_states'
+        },
+        'keyed': {
+            key: getattr(task, key).get(subtask_id, _REMOVED)
+            for key in task.JOURNAL_SUBTASK_ATTRS
+        },
+        'entries': [
+            (path, _get_entry(task, path))
+            for path in task.journal_paths(subtask_id)
+        ],
+    }
+
+
+def _step(obj: Any, key: Any) -> Any:
+    if isinstance(obj, (dict, list)):
+        return obj[key]
+    return getattr(obj, key)
+
+
+def _get_entry(task: 'Task', path: tuple) -> Any:
+    try:
+        return functools.reduce(_step, path, task)
+    except (AttributeError, KeyError, IndexError):
+        return _REMOVED
+
+
+def _set_entry(task: 'Task', path: tuple, value: Any) -> None:
+    *parent_path, key = path
+    removed = isinstance(value, str) and value == _REMOVED
+    try:
+        parent = functools.reduce(_step, parent_path, task)
+    except (AttributeError, KeyError, IndexError):
+        if removed:
+            return
+        raise
+    if isinstance(parent, dict):
+        if removed:
+            parent.pop(key, None)
+        else:
+            parent[key] = value
+    elif isinstance(parent, list):
+        if not removed:
+            parent[key] = value
+    elif removed:
+        if hasattr(parent, key):
+            delattr(parent, key)
+    else:
+        setattr(parent, key, value)
+
+
+def _apply_delta(record: Dict[str, Any],
+                 task: 'Task', state: 'TaskState') -> None:
+    subtask_id = record['subtask_id']
+    subtask_state: Optional[Any] = record['subtask_state']
+    if subtask_state is None:
+        state.subtask_states.pop(subtask_id, None)
+    else:
+        state.subtask_states[subtask_id] = subtask_state
+    # Bypass TaskState.__setattr__ to keep the recorded update time
+    state.__dict__.update(record['state'])
+
+    for path, value in record['entries']:
+        _set_entry(task, path, value)
+    for key, value in record['keyed'].items():
+        container = getattr(task, key)
+        if isinstance(value, str) and value == _REMOVED:
+            container.pop(subtask_id, None)
+        else:
+            container[subtask_id] = value
@@ -353,6 +353,8 @@ class TaskHeaderKeeper:
         self.removed_tasks: typing.Dict[str, float] = {}
         # task ids by owner
         self.tasks_by_owner: typing.Dict[str, typing.Set[str]] = {}
+        # id of the task with the newest header by owner
+        self.newest_task_by_owner: typing.Dict[str, str] = {}
         # Keep track which tasks were checked when
         self.last_checking: typing.Dict[str, datetime.datetime] = {}
 
@@ -528,6 +530,7 @@ class TaskHeaderKeeper:
             self.last_checking[task_id] = datetime.datetime.now()
 
             self._get_tasks_by_owner_set(header.task_owner.key).add(task_id)
+            self._update_newest_task(header)
 
             yield self.update_supported_set(header)
 
@@ -572,20 +575,33 @@ class TaskHeaderKeeper:
 
         return self.tasks_by_owner[owner_key_id]
 
-    def find_newest_node(self, node_id) -> typing.Optional[dt_p2p.Node]:
-        node: typing.Optional[dt_p2p.Node] = None
-        timestamp: int = 0
-        task_ids = self._get_tasks_by_owner_set(owner_key_id=node_id)
-        for task_id in task_ids:
+    def _update_newest_task(self, header: dt_tasks.TaskHeader) -> None:
+        owner_key_id = header.task_owner.key
+        newest_id = self.newest_task_by_owner.get(owner_key_id)
+        if newest_id is not None and newest_id != header.task_id \
+                and self.task_headers[newest_id].timestamp > header.timestamp:
+            return
+        self.newest_task_by_owner[owner_key_id] = header.task_id
+
+    def _find_newest_task(self, owner_key_id: str) -> None:
+        newest: typing.Optional[dt_tasks.TaskHeader] = None
+        for task_id in self.tasks_by_owner.get(owner_key_id, ()):
             try:
                 task_header: dt_tasks.TaskHeader = self.task_headers[task_id]
             except KeyError:
                 continue
-            if task_header.timestamp < timestamp:
-                continue
-            node = task_header.task_owner
-            timestamp = task_header.timestamp
-        return node
+            if newest is None or task_header.timestamp >= newest.timestamp:
+                newest = task_header
+        if newest is None:
+            self.newest_task_by_owner.pop(owner_key_id, None)
+        else:
+            self.newest_task_by_owner[owner_key_id] = newest.task_id
+
+    def find_newest_node(self, node_id) -> typing.Optional[dt_p2p.Node]:
+        task_id = self.newest_task_by_owner.get(node_id)
+        if task_id is None:
+            return None
+        return self.task_headers[task_id].task_owner
 
     def check_max_tasks_per_owner(self, owner_key_id):
         owner_task_set = self._get_tasks_by_owner_set(owner_key_id)
@@ -623,6 +639,7 @@ class TaskHeaderKeeper:
                            "task_id=%s", task_id)
             return False
 
+        owner_key_id = None
         try:
             owner_key_id = self.task_headers[task_id].task_owner.key
             self.tasks_by_owner[owner_key_id].discard(task_id)
@@ -651,6 +668,10 @@ class TaskHeaderKeeper:
                 "Unknown container type {}".format(type(container)),
             )
 
+        if owner_key_id is not None \
+                and self.newest_task_by_owner.get(owner_key_id) == task_id:
+            self._find_newest_task(owner_key_id)
+
         self.removed_tasks[task_id] = time.time()
         return True
 
@@ -3,7 +3,6 @@
 import copy
 import logging
 import os
-import pickle
 import shutil
 import time
 import uuid
@@ -51,6 +50,7 @@ from golem.task.taskbase import TaskEventListener, Task, \
     TaskPurpose, AcceptClientVerdict, TaskResult
 from golem.task.helpers import calculate_subtask_payment
 from golem.task.taskkeeper import CompTaskKeeper
+from golem.task.taskjournal import TaskJournal
 from golem.task.taskrequestorstats import RequestorTaskStatsManager
 from golem.task.taskstate import TaskState, TaskStatus, SubtaskStatus, \
     SubtaskState, Operation, TaskOp, SubtaskOp, OtherOp
@@ -134,6 +134,7 @@ class TaskManager(TaskEventListener):
         self.tasks_dir = tasks_dir / "tmanager"
         if not self.tasks_dir.is_dir():
             self.tasks_dir.mkdir(parents=True)
+        self.task_journal = TaskJournal(self.tasks_dir)
         self.root_path = root_path
         self.dir_manager = DirManager(self.get_task_manager_root())
 
@@ -288,16 +289,31 @@ class TaskManager(TaskEventListener):
         logger.info("Task started. task_id=%r", task_id)
 
     def _dump_filepath(self, task_id):
-        return self.tasks_dir / ('%s.pickle' % (task_id,))
+        return self.task_journal.snapshot_path(task_id)
 
-    def dump_task(self, task_id: str) -> None:
+    def dump_task(self, task_id: str,
+                  subtask_id: Optional[str] = None) -> None:
+        """ Persist the task. Updates of a single subtask are appended
+        to the task's journal, a full snapshot is written periodically
+        and whenever the update concerns the whole task. """
         logger.debug('DUMP TASK %r', task_id)
         filepath = self._dump_filepath(task_id)
         try:
-            data = self.tasks[task_id], self.tasks_states[task_id]
+            task = self.tasks[task_id]
+            state = self.tasks_states[task_id]
+            if subtask_id is not None \
+                    and not self.task_journal.needs_snapshot(task_id, task):
+                try:
+                    self.task_journal.append_delta(
+                        task_id, subtask_id, task, state)
+                    logger.debug('TASK %s JOURNALED subtask_id=%s',
+                                 task_id, subtask_id)
+                    return
+                except Exception:  # pylint: disable=broad-except
+                    logger.debug('Journal append failed, writing snapshot. '
+                                 'task_id=%s', task_id, exc_info=True)
             logger.debug('DUMPING TASK %r', filepath)
-            with filepath.open('wb') as f:
-                pickle.dump(data, f, protocol=2)
+            self.task_journal.write_snapshot(task_id, task, state)
             logger.debug('TASK %s DUMPED in %r', task_id, filepath)
         except Exception:  # pylint: disable=broad-except
             logger.exception(
@@ -305,12 +321,11 @@ class TaskManager(TaskEventListener):
                 task_id, self.tasks.get(task_id, '<not found>'),
                 self.tasks_states.get(task_id, '<not found>'),
             )
-            if filepath.exists():
-                filepath.unlink()
             raise
 
     def remove_dump(self, task_id: str):
         filepath = self._dump_filepath(task_id)
+        self.task_journal.remove(task_id)
         try:
             filepath.unlink()
             logger.debug('TASK DUMP with id %s REMOVED from %r',
@@ -362,28 +377,27 @@ class TaskManager(TaskEventListener):
             logger.debug('RESTORE TASKS %r', path)
 
             task_id = None
-            with path.open('rb') as f:
-                try:
-                    task: Task
-                    state: TaskState
-                    task, state = pickle.load(f)
-                except Exception:  # pylint: disable=broad-except
-                    logger.exception('Problem restoring task from: %s', path)
-                    # On Windows, attempting to remove a file that is in use
-                    # causes an exception to be raised, therefore
-                    # we'll remove broken files later
-                    broken_paths.add(path)
-                else:
-                    task.register_listener(self)
-
-                    task_id = task.header.task_id
-                    self.tasks[task_id] = task
-                    self.tasks_states[task_id] = state
-
-                    for sub in state.subtask_states.values():
-                        self.subtask2task_mapping[sub.subtask_id] = task_id
-
-                    logger.debug('TASK %s RESTORED from %r', task_id, path)
+            try:
+                task: Task
+                state: TaskState
+                task, state = self.task_journal.load(path.stem)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Problem restoring task from: %s', path)
+                # On Windows, attempting to remove a file that is in use
+                # causes an exception to be raised, therefore
+                # we'll remove broken files later
+                broken_paths.add(path)
+            else:
+                task.register_listener(self)
+
+                task_id = task.header.task_id
+                self.tasks[task_id] = task
+                self.tasks_states[task_id] = state
+
+                for sub in state.subtask_states.values():
+                    self.subtask2task_mapping[sub.subtask_id] = task_id
+
+                logger.debug('TASK %s RESTORED from %r', task_id, path)
 
             if task_id is not None:
                 self.notice_task_updated(task_id, op=TaskOp.RESTORED,
@@ -391,6 +405,7 @@ class TaskManager(TaskEventListener):
 
         for path in broken_paths:
             path.unlink()
+            self.task_journal.remove(path.stem)
 
     def got_wants_to_compute(self,
                              task_id: str):
@@ -1274,7 +1289,7 @@ class TaskManager(TaskEventListener):
         )
 
         if persist:
-            self.dump_task(task_id)
+            self.dump_task(task_id, subtask_id)
 
         task_state = self.tasks_states.get(task_id)
         dispatcher.send(
@@ -96,7 +96,7 @@ class ProviderStatsManager:
         if event == 'created':
             self.keeper.increase_stat('provider_income_completed_sum',
                                       int(kwargs['amount']))
-        elif event == 'confirmed':
+        elif event in ('confirmed', 'confirmed_batch'):
             self.keeper.increase_stat('provider_income_paid_sum',
                                       int(kwargs['amount']))
 
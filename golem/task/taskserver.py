@@ -442,7 +442,8 @@ class TaskServer(
                 benchmark_score = benchmark_result.performance
                 benchmark_cpu_usage = benchmark_result.cpu_usage
                 if env.is_single_core():
-                    num_subtasks = self.task_computer.free_cores
+                    num_subtasks = self.task_computer.admissible_subtasks(
+                        theader.task_id)
                     if num_subtasks == 0:
                         return None
             else:  # NewEnv
@@ -544,7 +545,7 @@ class TaskServer(
         if not self.task_manager.comp_task_keeper.receive_subtask(msg):
             return False
 
-        if not self.task_computer.can_take_work():
+        if not self.task_computer.can_take_work(msg.task_id):
             logger.error("Trying to assign a task, when it's already assigned")
             return False
 
@@ -557,7 +558,9 @@ class TaskServer(
             cpu_time_limit = task_helpers.calculate_max_usage(
                 task_header.subtask_budget, msg.want_to_compute_task.price)
 
-        self.task_computer.task_given(msg.compute_task_def, cpu_time_limit)
+        if not self.task_computer.task_given(
+                msg.compute_task_def, cpu_time_limit):
+            return False
 
         resource_downloaded = functools.partial(
             self._resource_downloaded,
@@ -989,6 +992,9 @@ class TaskServer(
     def income_listener(self, event='default', node_id=None, **kwargs):
         if event == 'confirmed':
             self._increase_trust_payment(node_id, kwargs['amount'])
+        elif event == 'confirmed_batch':
+            self._increase_trust_payment(
+                node_id, kwargs['amount'], kwargs['count'])
         elif event == 'overdue_single':
             self._decrease_trust_payment(node_id)
 
@@ -1045,8 +1051,9 @@ class TaskServer(
         if not self.requested_task_manager.has_unfinished_tasks():
             self.client.update_setting('accept_tasks', True, False)
 
-    def _increase_trust_payment(self, node_id: str, amount: int):
-        Trust.PAYMENT.increase(node_id, self.max_trust)
+    def _increase_trust_payment(self, node_id: str, amount: int,
+                                count: int = 1):
+        Trust.PAYMENT.increase(node_id, self.max_trust * count)
         update_requestor_paid_sum(node_id, amount)
 
     def _decrease_trust_payment(self, node_id: str):
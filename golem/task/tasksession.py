@@ -27,7 +27,7 @@ from golem.core.deferred import deferred_from_future
 from golem.docker.environment import DockerEnvironment
 from golem.docker.image import DockerImage
 from golem.marketplace import Offer, ProviderPerformance
-from golem.model import Actor
+from golem.model import Actor, db_executor
 from golem.network import history
 from golem.network import nodeskeeper
 from golem.network.concent import helpers as concent_helpers
@@ -259,8 +259,17 @@ class TaskSession(BasicSafeSession, ResourceHandshakeSessionMixin):
             logger.debug('skipping queue, not verified. key_id=%r', self.key_id)
             return
         logger.debug('sending messages for key. %r', self.key_id)
-        for msg in msg_queue.get(self.key_id):
-            self.send(msg)
+
+        def send_all(msgs):
+            for msg in msgs:
+                self.send(msg)
+
+        msg_queue.get_all(self.key_id).addCallbacks(
+            send_all,
+            lambda failure: logger.warning(
+                'Cannot read message queue. key_id=%r, error=%s',
+                self.key_id, failure.getErrorMessage()),
+        )
 
     #########################
     # Reactions to messages #
@@ -383,13 +392,20 @@ class TaskSession(BasicSafeSession, ResourceHandshakeSessionMixin):
             functools.partial(self._offer_chosen, True, msg=msg)
         )
 
-        def resolution(market_strategy, task_id):
-            for offer in market_strategy.resolve_task_offers(task_id):
+        def call_offers(offers):
+            for offer in offers:
                 try:
                     offer.callback()
                 except Exception as e:
                     logger.error(e)
 
+        def resolution(market_strategy, task_id):
+            # Resolving may look up and create usage factors in the database
+            db_executor.write(
+                market_strategy.resolve_task_offers,
+                task_id,
+            ).addCallbacks(call_offers, logger.error)
+
         market_strategy.add(msg.task_id, offer)
         logger.debug("Offer accepted & added to pool. offer=%s", offer)
 
@@ -623,7 +639,7 @@ class TaskSession(BasicSafeSession, ResourceHandshakeSessionMixin):
 
         reasons = message.tasks.CannotComputeTask.REASON
 
-        if not self.task_computer.can_take_work():
+        if not self.task_computer.can_take_work(ctd['task_id']):
             _cannot_compute(reasons.OfferCancelled)
             self.task_server.requested_tasks.discard(ctd["task_id"])
             return
@@ -1,5 +1,7 @@
+import heapq
+import itertools
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Tuple
+from typing import Callable, Collection, List, Optional, Set, Tuple
 
 from peewee import IntegrityError
 
@@ -23,7 +25,10 @@ class QueueBackend(ABC):
     @abstractmethod
     def get(
             self,
+            exclude_tasks: Collection[TaskId] = (),
     ) -> Optional[Tuple[TaskId, SubtaskId]]:
+        """ Pop the prioritized item with the lowest priority value,
+            skipping items of `exclude_tasks` """
         raise NotImplementedError
 
     @abstractmethod
@@ -55,11 +60,17 @@ class DatabaseQueueBackend(QueueBackend):
 
     def get(
             self,
+            exclude_tasks: Collection[TaskId] = (),
     ) -> Optional[Tuple[TaskId, SubtaskId]]:
+        conditions = [QueuedVerification.priority.is_null(False)]
+        if exclude_tasks:
+            conditions.append(
+                QueuedVerification.task_id.not_in(list(exclude_tasks)))
+
         with db.transaction():
             try:
                 queued = QueuedVerification.select() \
-                    .where(QueuedVerification.priority.is_null(False)) \
+                    .where(*conditions) \
                     .order_by(+QueuedVerification.priority) \
                     .limit(1) \
                     .execute()
@@ -82,4 +93,109 @@ class DatabaseQueueBackend(QueueBackend):
 
             for result in results:
                 result.priority = priority_fn()
-                result.save()
\ No newline at end of file
+                result.save()
+
+
+class HeapQueueBackend(QueueBackend):
+    """ Keeps the queue in memory, ordered by a heap. The QueuedVerification
+        table is only a write-ahead record used to restore the queue
+        after a restart. """
+
+    def __init__(self) -> None:
+        # (priority, insertion order, task_id, subtask_id)
+        self._heap: List[Tuple[int, int, TaskId, SubtaskId]] = []
+        # Items with priority set to None, in the enqueuing order
+        self._not_prioritized: List[Tuple[TaskId, SubtaskId]] = []
+        self._keys: Set[Tuple[TaskId, SubtaskId]] = set()
+        self._counter = itertools.count()
+        self._restore()
+
+    def _restore(self) -> None:
+        queued = QueuedVerification.select(
+            QueuedVerification.task_id,
+            QueuedVerification.subtask_id,
+            QueuedVerification.priority,
+        ).order_by(+QueuedVerification.created_date).tuples()
+
+        for task_id, subtask_id, priority in queued:
+            self._add(task_id, subtask_id, priority)
+
+    def _add(
+            self,
+            task_id: TaskId,
+            subtask_id: SubtaskId,
+            priority: Optional[int],
+    ) -> None:
+        self._keys.add((task_id, subtask_id))
+        if priority is None:
+            self._not_prioritized.append((task_id, subtask_id))
+        else:
+            heapq.heappush(
+                self._heap,
+                (priority, next(self._counter), task_id, subtask_id))
+
+    def put(
+            self,
+            task_id: TaskId,
+            subtask_id: SubtaskId,
+            priority: Optional[int],
+    ) -> bool:
+        if (task_id, subtask_id) in self._keys:
+            return False
+        try:
+            QueuedVerification.create(
+                task_id=task_id,
+                subtask_id=subtask_id,
+                priority=priority)
+        except IntegrityError:
+            return False
+        self._add(task_id, subtask_id, priority)
+        return True
+
+    def get(
+            self,
+            exclude_tasks: Collection[TaskId] = (),
+    ) -> Optional[Tuple[TaskId, SubtaskId]]:
+        skipped = []
+        found = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if entry[2] in exclude_tasks:
+                skipped.append(entry)
+                continue
+            found = entry
+            break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        if found is None:
+            return None
+
+        _, _, task_id, subtask_id = found
+        self._keys.discard((task_id, subtask_id))
+        QueuedVerification.delete().where(
+            QueuedVerification.task_id == task_id,
+            QueuedVerification.subtask_id == subtask_id,
+        ).execute()
+        return task_id, subtask_id
+
+    def update_not_prioritized(
+            self,
+            priority_fn: PriorityFn,
+    ) -> None:
+        if not self._not_prioritized:
+            return
+
+        items, self._not_prioritized = self._not_prioritized, []
+        prioritized = [(priority_fn(), item) for item in items]
+
+        with db.transaction():
+            for priority, (task_id, subtask_id) in prioritized:
+                QueuedVerification.update(priority=priority).where(
+                    QueuedVerification.task_id == task_id,
+                    QueuedVerification.subtask_id == subtask_id,
+                ).execute()
+
+        for priority, (task_id, subtask_id) in prioritized:
+            heapq.heappush(
+                self._heap,
+                (priority, next(self._counter), task_id, subtask_id))
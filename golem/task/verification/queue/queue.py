@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections import Counter
 from concurrent import futures
 from typing import Dict, Callable, Optional, Coroutine, Any, Tuple
 
@@ -8,7 +9,7 @@ from golem_task_api.enums import VerifyResult
 from golem.core.common import get_timestamp_utc
 from golem.task import SubtaskId, TaskId
 from golem.task.verification.queue.backend import QueueBackend, \
-    DatabaseQueueBackend
+    HeapQueueBackend
 
 logger = logging.getLogger(__name__)
 
@@ -30,26 +31,38 @@ class VerificationQueue:
         are assigned a valid priority to re-schedule their processing.
 
         These prevent never ending loops caused by re-enqueuing.
+
+        Up to `workers` items are verified at the same time, at most
+        `max_per_task` of them (when set) belonging to a single task.
     """
 
     DEFAULT_TIMEOUT: float = 1800.
+    DEFAULT_WORKERS: int = 1
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
             self,
             verify_fn: VerifyFn,
             verify_timeout: float = DEFAULT_TIMEOUT,
             backend: Optional[QueueBackend] = None,
+            workers: int = DEFAULT_WORKERS,
+            max_per_task: Optional[int] = None,
     ) -> None:
         # Provided verification function
         self._verify_fn = verify_fn
         # Verification call timeout
         self._verify_timeout = verify_timeout
-        # Pending verification lock
-        self._verify_lock = asyncio.Lock()
+        # Maximum number of concurrent verifications
+        self._workers = max(workers, 1)
+        # Maximum number of concurrent verifications of a single task
+        self._max_per_task = max_per_task
         # Queue to store requested verifications in
-        self._queue = backend or DatabaseQueueBackend()
+        self._queue = backend or HeapQueueBackend()
         # In-memory store for pending calls
         self._pending: Dict[Tuple[TaskId, SubtaskId], asyncio.Future] = dict()
+        # Verifications in progress
+        self._active: Dict[Tuple[TaskId, SubtaskId], asyncio.Future] = dict()
+        # Number of verifications in progress per task
+        self._active_per_task: Counter = Counter()
         # Tells whether the queue processing is running
         self._processing = False
         # Tells whether queue processing was paused by the user
@@ -57,9 +70,10 @@ class VerificationQueue:
 
     async def pause(self):
         """ Pause processing the queue.
-            Wait for the pending verification to finish """
-        async with self._verify_lock:
-            self._paused = True
+            Wait for the pending verifications to finish """
+        self._paused = True
+        if self._active:
+            await asyncio.wait(list(self._active.values()))
 
     async def resume(self):
         """ Resume processing the queue """
@@ -85,9 +99,11 @@ class VerificationQueue:
         return self._pending[(task_id, subtask_id)]
 
     async def process(self):
-        """ Process queued items one-by-one, ordered by their priority.
+        """ Process queued items ordered by their priority.
             Skip items with priority equal to None """
         if self._processing:
+            # Fill the free worker slots, if any
+            self._start_workers()
             return
         try:
             self._processing = True
@@ -96,19 +112,49 @@ class VerificationQueue:
             self._processing = False
 
     async def _process(self):
-        if self._paused:
-            return
+        while True:
+            self._start_workers()
+            if not self._active:
+                return
+            await asyncio.wait(
+                list(self._active.values()),
+                return_when=asyncio.FIRST_COMPLETED)
 
-        async with self._verify_lock:
-            queued = self._queue.get()
+    def _start_workers(self) -> None:
+        while not self._paused and len(self._active) < self._workers:
+            queued = self._queue.get(exclude_tasks=self._saturated_tasks())
             if not queued:
                 return
+            self._active_per_task[queued[0]] += 1
+            self._active[queued] = asyncio.ensure_future(self._work(*queued))
 
-            task_id, subtask_id = queued
-            await self._verify(task_id, subtask_id)
-            self._queue.update_not_prioritized(_next_priority)
+    def _saturated_tasks(self) -> Tuple[TaskId, ...]:
+        if self._max_per_task is None:
+            return ()
+        return tuple(
+            task_id for task_id, count in self._active_per_task.items()
+            if count >= self._max_per_task)
 
-        await self._process()
+    async def _work(
+            self,
+            task_id: TaskId,
+            subtask_id: SubtaskId,
+    ) -> None:
+        try:
+            await self._verify(task_id, subtask_id)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception(
+                "Verification error: task_id=%s, subtask_id=%s",
+                task_id, subtask_id)
+            future = self._pending.pop((task_id, subtask_id), None)
+            if future:
+                future.set_exception(exc)
+        finally:
+            del self._active[(task_id, subtask_id)]
+            self._active_per_task[task_id] -= 1
+            if not self._active_per_task[task_id]:
+                del self._active_per_task[task_id]
+        self._queue.update_not_prioritized(_next_priority)
 
     async def _verify(
             self,
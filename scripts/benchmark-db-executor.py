@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""Measure event loop lag while many simulated providers concurrently
+request subtasks from RequestedTaskManager, with database queries run
+on the loop thread (default) or through the database executor
+(--executor)."""
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Keep reference to avoid garbage collection of db
+_db = None
+
+LAG_PROBE_INTERVAL = 0.01
+
+
+class FakeAppClient:
+    def __init__(self, latency):
+        self.latency = latency
+
+    async def has_pending_subtasks(self, _task_id):
+        await asyncio.sleep(self.latency)
+        return True
+
+    async def next_subtask(self, **_kwargs):
+        await asyncio.sleep(self.latency)
+
+        class Result:
+            params = {'frames': [1]}
+            resources = []
+        return Result()
+
+
+def init_db(datadir):
+    from golem.database import database
+    from golem.model import DB_MODELS, db, DB_FIELDS
+    global _db  # pylint: disable=global-statement
+    _db = database.Database(
+        db,
+        fields=DB_FIELDS,
+        models=DB_MODELS,
+        db_dir=datadir,
+    )
+
+
+def create_task():
+    from golem.core.common import default_now
+    from golem.model import RequestedTask
+    from golem.task.taskstate import TaskStatus
+    return RequestedTask.create(
+        task_id=str(uuid.uuid4()),
+        app_id='benchmark',
+        status=TaskStatus.computing,
+        task_timeout=3600,
+        subtask_timeout=600,
+        start_time=default_now(),
+        max_price_per_hour=1,
+        max_subtasks=10 ** 6,
+        output_directory='/tmp',
+    )
+
+
+async def probe_lag(lags, done):
+    loop = asyncio.get_event_loop()
+    while not done.is_set():
+        start = loop.time()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        lags.append(loop.time() - start - LAG_PROBE_INTERVAL)
+
+
+async def provider(rtm, task_id, requests):
+    from golem.model import RequestedSubtask, db_executor
+    from golem.task.requestedtaskmanager import ComputingNodeDefinition
+    from golem.task.taskstate import SubtaskStatus
+    node = ComputingNodeDefinition(node_id=uuid.uuid4().hex, name='provider')
+    for _ in range(requests):
+        await rtm.get_next_subtask(task_id, node)
+        # Pretend the subtask was computed so the provider gets another one
+        await db_executor.run_write(
+            RequestedSubtask.update(status=SubtaskStatus.finished).where(
+                RequestedSubtask.task_id == task_id).execute)
+
+
+async def run(rtm, task_id, providers, requests):
+    lags = []
+    done = asyncio.Event()
+    probe = asyncio.ensure_future(probe_lag(lags, done))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        provider(rtm, task_id, requests) for _ in range(providers)
+    ))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe
+    return elapsed, lags
+
+
+def main(datadir, providers, requests, latency, use_executor):
+    from golem.model import db_executor
+    from golem.task.requestedtaskmanager import RequestedTaskManager
+    init_db(datadir)
+    task = create_task()
+
+    rtm = RequestedTaskManager(
+        env_manager=None,
+        app_manager=None,
+        public_key=b'requestor',
+        root_path=Path(datadir),
+    )
+    app_client = FakeAppClient(latency)
+
+    async def get_app_client(_app_id):
+        return app_client
+    rtm._get_app_client = get_app_client  # pylint: disable=protected-access
+
+    if use_executor:
+        db_executor.start()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        elapsed, lags = loop.run_until_complete(
+            run(rtm, task.task_id, providers, requests))
+    finally:
+        db_executor.stop()
+        loop.close()
+
+    lags.sort()
+    print(f'{providers} providers x {requests} requests: {elapsed:.2f} s')
+    print(f'loop lag: mean {statistics.mean(lags) * 1000:.1f} ms, '
+          f'p99 {lags[int(len(lags) * 0.99)] * 1000:.1f} ms, '
+          f'max {lags[-1] * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-d', dest='datadir', default=None)
+    parser.add_argument('--providers', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.01,
+                        help='Artificial latency of each app call [s]')
+    parser.add_argument('--executor', action='store_true')
+    args = parser.parse_args()
+    main(args.datadir or tempfile.mkdtemp(), args.providers, args.requests,
+         args.latency, args.executor)
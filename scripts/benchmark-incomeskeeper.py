@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Benchmark IncomesKeeper.received_batch_transfer settling many expected
+incomes from a single sender with one batch transfer."""
+import tempfile
+import time
+import uuid
+
+from pydispatch import dispatcher
+
+# Keep reference to avoid garbage collection of db
+_db = None
+
+
+def init_db(datadir):
+    from golem.database import database
+    from golem.model import DB_MODELS, db, DB_FIELDS
+    global _db  # pylint: disable=global-statement
+    _db = database.Database(
+        db,
+        fields=DB_FIELDS,
+        models=DB_MODELS,
+        db_dir=datadir,
+    )
+
+
+def main(datadir, incomes, per_income_events):
+    from golem.ethereum.incomeskeeper import IncomesKeeper
+    init_db(datadir)
+    keeper = IncomesKeeper(per_income_events=per_income_events)
+    payer_address = '0x' + 40 * '9'
+    value = 10 ** 18
+
+    start = time.perf_counter()
+    for i in range(incomes):
+        keeper.expect(
+            sender_node='0xadbeef' + 'deadbeef' * 15,
+            my_address='0x' + 40 * '1',
+            task_id=str(uuid.uuid4()),
+            subtask_id=str(uuid.uuid4()),
+            payer_address=payer_address,
+            value=value,
+            accepted_ts=1 + i,
+        )
+    print(f'expect {incomes} incomes: {time.perf_counter() - start:.2f} s')
+
+    events = []
+
+    def listener(event, **_kwargs):
+        events.append(event)
+
+    dispatcher.connect(listener, signal='golem.income', weak=False)
+
+    start = time.perf_counter()
+    keeper.received_batch_transfer(
+        tx_hash='0x' + 64 * 'a',
+        sender=payer_address,
+        amount=value * incomes,
+        closure_time=incomes,
+    )
+    print(f'received batch transfer: {time.perf_counter() - start:.2f} s, '
+          f'{len(events)} events')
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-d', dest='datadir', default=None)
+    parser.add_argument('--incomes', type=int, default=5000)
+    parser.add_argument('--per-income-events', action='store_true')
+    args = parser.parse_args()
+    main(args.datadir or tempfile.mkdtemp(), args.incomes,
+         args.per_income_events)
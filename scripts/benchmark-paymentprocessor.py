@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""Benchmark PaymentProcessor against a fake SCI with many awaiting
+payments: time of batch sendout, batch confirmation and the number
+of chain reads made while retrying sendout.
+
+Sendout is retried once per TransactionSystem.LOOP_INTERVAL of simulated
+time. Before each retry the chain reads are refreshed off the reactor the
+way TransactionSystem does it, i.e. only when a new block was confirmed
+or they would expire before the next tick. Only the reads made by sendout
+itself block the reactor."""
+import collections
+import tempfile
+import time
+import uuid
+from unittest import mock
+
+from ethereum.utils import denoms
+
+# Keep reference to avoid garbage collection of db
+_db = None
+
+
+class FakeSCI:
+    GAS_PER_PAYMENT = 300
+    GAS_BATCH_PAYMENT_BASE = 30
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = collections.Counter()
+        self.gntb_balance = 10 ** 9 * denoms.ether
+
+    def _call(self, name, result):
+        self.calls[name] += 1
+        time.sleep(self.latency)
+        return result
+
+    def get_eth_address(self):
+        return '0x' + 40 * '1'
+
+    def get_gntb_balance(self, _address):
+        return self._call('get_gntb_balance', self.gntb_balance)
+
+    def get_eth_balance(self, _address):
+        return self._call('get_eth_balance', denoms.ether)
+
+    def get_current_gas_price(self):
+        return self._call('get_current_gas_price', 10 ** 9)
+
+    def get_latest_confirmed_block(self):
+        class Block:
+            gas_limit = 10 ** 12
+        return self._call('get_latest_confirmed_block', Block())
+
+    def batch_transfer(self, _payments, _closure_time):
+        return self._call('batch_transfer', '0x' + 64 * 'a')
+
+    def on_transaction_confirmed(self, tx_hash, cb):
+        self.calls['on_transaction_confirmed'] += 1
+
+    def get_block_by_number(self, _number):
+        class Block:
+            timestamp = time.time()
+        return self._call('get_block_by_number', Block())
+
+    def get_transaction_gas_price(self, _tx_hash):
+        return self._call('get_transaction_gas_price', 10 ** 9)
+
+
+def init_db(datadir):
+    from golem.database import database
+    from golem.model import DB_MODELS, db, DB_FIELDS
+    global _db  # pylint: disable=global-statement
+    _db = database.Database(
+        db,
+        fields=DB_FIELDS,
+        models=DB_MODELS,
+        db_dir=datadir,
+    )
+
+
+class Clock:
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+
+def refresh(cache, sci, clock, block_time, refreshed_block):
+    """Refresh the chain reads like TransactionSystem._run() does"""
+    from golem.ethereum.paymentprocessor import CacheKey, CHAIN_READS_MAX_AGE
+    from golem.ethereum.transactionsystem import TransactionSystem
+    addr = sci.get_eth_address()
+    reads = {
+        CacheKey.ETH: lambda: sci.get_eth_balance(addr),
+        CacheKey.GNTB: lambda: sci.get_gntb_balance(addr),
+        CacheKey.GasPrice: sci.get_current_gas_price,
+        CacheKey.BlockGasLimit:
+            lambda: sci.get_latest_confirmed_block().gas_limit,
+    }
+    block = int(clock.now // block_time)
+    oldest = clock.now - CHAIN_READS_MAX_AGE \
+        + TransactionSystem.LOOP_INTERVAL
+    if block == refreshed_block and all(
+            cache.cache_lastmod(key) >= oldest for key in reads):
+        return refreshed_block
+    for key, read in reads.items():
+        cache.cache_set(key, read())
+    return block
+
+
+def main(datadir, payments, retries, latency, block_time):
+    # pylint: disable=too-many-locals
+    from golem.core.cache import MemCacheMixin
+    from golem.ethereum.paymentprocessor import PaymentProcessor
+    from golem.ethereum.transactionsystem import TransactionSystem
+    init_db(datadir)
+    sci = FakeSCI(latency)
+    chain_cache = MemCacheMixin()
+    pp = PaymentProcessor(sci, chain_cache)
+    pp.CLOSURE_TIME_DELAY = 0
+
+    start = time.perf_counter()
+    for i in range(payments):
+        pp.add(
+            node_id='0xadbeef' + 'deadbeef' * 15,
+            task_id=str(uuid.uuid4()),
+            subtask_id=str(uuid.uuid4()),
+            eth_addr='0x' + ('%040x' % (i % 100)),
+            value=1,
+        )
+    print(f'add {payments} payments: {time.perf_counter() - start:.2f} s')
+
+    # Retry with insufficient funds, as happens on every tick
+    sci.gntb_balance = 0
+    clock = Clock()
+    block = None
+    refresh_calls = 0
+    elapsed = 0.0
+    with mock.patch('golem.core.cache.time', clock):
+        for _ in range(retries):
+            clock.now += TransactionSystem.LOOP_INTERVAL
+            calls = sum(sci.calls.values())
+            block = refresh(chain_cache, sci, clock, block_time, block)
+            refresh_calls += sum(sci.calls.values()) - calls
+            start = time.perf_counter()
+            pp.sendout(0)
+            elapsed += time.perf_counter() - start
+    print(f'{retries} unsuccessful sendouts: {elapsed:.2f} s, '
+          f'{sum(sci.calls.values()) - refresh_calls} SCI calls on the '
+          f'reactor, {refresh_calls} in refreshes')
+
+    sci.gntb_balance = 10 ** 9 * denoms.ether
+    chain_cache.cache_invalidate()
+    awaiting = list(pp._awaiting)  # pylint: disable=protected-access
+    start = time.perf_counter()
+    pp.sendout(0)
+    print(f'sendout: {time.perf_counter() - start:.2f} s')
+
+    class Receipt:
+        status = 1
+        block_number = 1
+        tx_hash = '0x' + 64 * 'a'
+        gas_used = 10 ** 6
+
+    start = time.perf_counter()
+    pp._on_batch_confirmed(awaiting, Receipt())  # noqa pylint: disable=protected-access
+    print(f'batch confirmed: {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-d', dest='datadir', default=None)
+    parser.add_argument('--payments', type=int, default=10000)
+    parser.add_argument('--retries', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='Artificial latency of each SCI call [s]')
+    parser.add_argument('--block-time', type=float, default=15,
+                        help='Simulated time between blocks [s]')
+    args = parser.parse_args()
+    main(args.datadir or tempfile.mkdtemp(), args.payments, args.retries,
+         args.latency, args.block_time)
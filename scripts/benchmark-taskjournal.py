@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Measure the per-update persistence cost of a requested Blender task:
+a full snapshot (the previous behaviour of TaskManager.dump_task)
+versus a single journaled subtask delta."""
+import contextlib
+import logging
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from golem_messages.factories.datastructures import p2p as dt_p2p_factory
+
+from apps.blender.task.blenderrendertask import (
+    BlenderRendererOptions,
+    BlenderRenderTask,
+)
+from apps.rendering.task.renderingtaskstate import RenderingTaskDefinition
+from golem.resource.dirmanager import DirManager
+from golem.task.taskjournal import TaskJournal
+from golem.task.taskstate import SubtaskState, SubtaskStatus, TaskState
+
+NODE_ID = 'deadbeef' * 16
+# Images aren't rendered, the bookkeeping of the task is kept
+RENDERING = (
+    'apps.blender.task.blenderrendertask.CustomCollector',
+    'apps.rendering.task.framerenderingtask.OpenCVImgRepr',
+    'apps.rendering.task.framerenderingtask.RenderingTaskCollector',
+    'apps.rendering.task.renderingtask.OpenCVImgRepr',
+    'apps.blender.task.blenderrendertask.BlenderRenderTask'
+    '._update_task_preview',
+    'apps.blender.task.blenderrendertask.BlenderRenderTask'
+    '._update_frame_task_preview',
+)
+
+
+def create_task(root, num_subtasks, num_frames):
+    definition = RenderingTaskDefinition()
+    definition.options = BlenderRendererOptions()
+    definition.options.use_frames = num_frames > 0
+    definition.options.frames = list(range(1, max(num_frames, 1) + 1))
+    definition.main_scene_file = str(root / 'scene.blend')
+    definition.output_file = str(root / 'output.png')
+    definition.output_format = 'PNG'
+    definition.resolution = [1920, 1080]
+    definition.subtasks_count = num_subtasks
+    definition.task_id = 'task-%d-%d' % (num_subtasks, num_frames)
+    task = BlenderRenderTask(
+        owner=dt_p2p_factory.Node(),
+        task_definition=definition,
+        root_path=str(root),
+    )
+    task.initialize(DirManager(str(root)))
+    return task
+
+
+def give(task, state):
+    ctd = task.query_extra_data(1000, NODE_ID, 'node').ctd
+    subtask_id = ctd['subtask_id']
+    state.subtask_states[subtask_id] = SubtaskState(
+        subtask_id=subtask_id,
+        node_id=NODE_ID,
+        deadline=int(time.time()) + 600,
+        price=10,
+    )
+    return subtask_id
+
+
+def finish(task, state, subtask_id, root):
+    state.subtask_states[subtask_id].status = SubtaskStatus.finished
+    task.accept_results(subtask_id, [str(root / ('%s.png' % subtask_id))])
+
+
+def main(sizes, frames, updates):
+    logging.disable(logging.CRITICAL)
+    for num_subtasks in sizes:
+        root = Path(tempfile.mkdtemp())
+        journal = TaskJournal(root)
+        state = TaskState()
+        with contextlib.ExitStack() as stack:
+            for target in RENDERING:
+                stack.enter_context(mock.patch(target))
+            img = stack.enter_context(mock.patch(
+                'apps.blender.task.blenderrendertask.OpenCVImgRepr'))
+            img.from_image_file.return_value.get_height.return_value = 1
+            task = create_task(root, num_subtasks, frames)
+            task_id = task.header.task_id
+            for _ in range(num_subtasks - 2 * updates):
+                finish(task, state, give(task, state), root)
+            journal.write_snapshot(task_id, task, state)
+
+            snapshot = 0.0
+            for _ in range(updates):
+                subtask_id = give(task, state)
+                finish(task, state, subtask_id, root)
+                start = time.perf_counter()
+                journal.write_snapshot(task_id, task, state)
+                snapshot += time.perf_counter() - start
+            snapshot_size = journal.snapshot_path(task_id).stat().st_size
+
+            delta = 0.0
+            journal_size = journal.journal_path(task_id).stat().st_size
+            for _ in range(updates):
+                subtask_id = give(task, state)
+                finish(task, state, subtask_id, root)
+                start = time.perf_counter()
+                journal.append_delta(task_id, subtask_id, task, state)
+                delta += time.perf_counter() - start
+            delta_size = (journal.journal_path(task_id).stat().st_size
+                          - journal_size) / updates
+
+        print(f'{num_subtasks:>6} subtasks: '
+              f'snapshot {snapshot / updates * 1000:.3f} ms '
+              f'({snapshot_size} B), '
+              f'delta {delta / updates * 1000:.3f} ms '
+              f'({delta_size:.0f} B) per update')
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 20000])
+    parser.add_argument('--frames', type=int, default=100,
+                        help='Number of frames, 0 renders a single image')
+    parser.add_argument('--updates', type=int, default=100)
+    args = parser.parse_args()
+    main(args.sizes, args.frames, args.updates)
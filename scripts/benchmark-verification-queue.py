@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Compare dequeue throughput of the verification queue backends with
+many queued results, some of them waiting for data (no priority)."""
+import itertools
+import tempfile
+import time
+
+# Keep reference to avoid garbage collection of db
+_db = None
+
+
+def init_db(datadir):
+    from golem.database import database
+    from golem.model import DB_MODELS, db, DB_FIELDS
+    global _db  # pylint: disable=global-statement
+    _db = database.Database(
+        db,
+        fields=DB_FIELDS,
+        models=DB_MODELS,
+        db_dir=datadir,
+    )
+
+
+def benchmark(backend_cls, items, not_prioritized):
+    from golem.model import QueuedVerification
+    QueuedVerification.delete().execute()
+    counter = itertools.count()
+    backend = backend_cls()
+
+    start = time.perf_counter()
+    for i in range(items):
+        priority = None if i < not_prioritized else next(counter)
+        backend.put('task_id%d' % (i % 10,), 'subtask_id%d' % (i,), priority)
+    put_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dequeued = 0
+    while backend.get():
+        dequeued += 1
+        # As done by the VerificationQueue after every verification
+        backend.update_not_prioritized(lambda: next(counter))
+    get_time = time.perf_counter() - start
+
+    print(f'{backend_cls.__name__}: put {put_time:.2f} s, '
+          f'{dequeued} dequeued in {get_time:.2f} s '
+          f'({dequeued / get_time:.0f}/s)')
+
+
+def main(datadir, items, not_prioritized):
+    from golem.task.verification.queue.backend import (
+        DatabaseQueueBackend,
+        HeapQueueBackend,
+    )
+    init_db(datadir)
+    for backend_cls in (DatabaseQueueBackend, HeapQueueBackend):
+        benchmark(backend_cls, items, not_prioritized)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-d', dest='datadir', default=None)
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--not-prioritized', type=int, default=100)
+    args = parser.parse_args()
+    main(args.datadir or tempfile.mkdtemp(), args.items, args.not_prioritized)
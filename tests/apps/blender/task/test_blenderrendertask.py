@@ -687,6 +687,13 @@ class TestBlenderRenderTaskBuilder(TempDirFixture):
         self.assertEqual(definition.output_format, 'PNG')
 
 
+def _border_pixels(rectangles):
+    return {(x + i, y + j)
+            for x, y, width, height in rectangles
+            for i in range(width)
+            for j in range(height)}
+
+
 class TestHelpers(unittest.TestCase):
 
     @staticmethod
@@ -706,6 +713,8 @@ class TestHelpers(unittest.TestCase):
                 30,
                 as_path=as_path,
             )
+            if not as_path:
+                border = _border_pixels(border)
             assert min(border) == (0, offsets[k])
             assert max(border) == (797, offsets[k + 1] - 1)
 
@@ -717,6 +726,8 @@ class TestHelpers(unittest.TestCase):
             extra_data = {'start_task': k}
             border = BlenderTaskTypeInfo.get_task_border(extra_data, definition,
                                                          30, as_path=as_path)
+            if not as_path:
+                border = _border_pixels(border)
             i = (k - 1) % 15 + 1
             assert min(border) == (0, offsets[i])
             assert max(border) == (798, offsets[i + 1] - 1)
@@ -743,6 +754,34 @@ class TestHelpers(unittest.TestCase):
     def test_get_task_border_path(self):
         self._get_task_border(as_path=True)
 
+    def test_get_task_border_pixels(self):
+        definition = RenderingTaskDefinition()
+        definition.options = BlenderRendererOptions()
+        definition.options.use_frames = False
+
+        for res_x, res_y in [(1, 1), (17, 5), (320, 240), (800, 600),
+                             (600, 800), (1920, 1080), (4096, 2160)]:
+            definition.resolution = [res_x, res_y]
+            for parts in [1, 2, 3, 7, 30, 64]:
+                if parts > res_y:
+                    continue
+                offsets = generate_expected_offsets(parts, res_x, res_y)
+                x = int(offsets[parts + 1] / res_y * res_x)
+                for k in range(1, parts + 1):
+                    upper, lower = offsets[k], offsets[k + 1]
+                    expected = {(0, i) for i in range(upper, lower)} | \
+                        {(x, i) for i in range(upper, lower)} | \
+                        {(i, upper) for i in range(x)} | \
+                        {(i, lower) for i in range(x)}
+                    border = BlenderTaskTypeInfo.get_task_border(
+                        {'start_task': k}, definition, parts)
+                    assert _border_pixels(border) == expected
+
+    def test_generate_expected_offsets_copy(self):
+        offsets = generate_expected_offsets(10, 800, 600)
+        offsets[1] = -1
+        assert generate_expected_offsets(10, 800, 600)[1] == 0
+
 
 def _get_empty_rgb_image(width, height):
     img = numpy.zeros((height, width, 3), numpy.uint8)
@@ -1,9 +1,13 @@
+import random
+from copy import deepcopy
 from unittest import TestCase, mock
 from uuid import uuid4
 
 from ethereum.utils import denoms
 
 from golem_messages.factories.datastructures import p2p
+from golem.task.taskbase import AcceptClientVerdict, TaskResult
+from golem.task.taskstate import SubtaskStatus
 from golem.testutils import TempDirFixture
 
 from apps.wasm.task import (
@@ -185,3 +189,130 @@ class WasmTaskTestCase(TaskRestartMixin, TempDirFixture):
             all([item in subt_extra_data.items()
                  for item in expected_dict.items()])
         )
+
+
+class WasmTaskResultDigestTestCase(TempDirFixture):
+    def _result_files(self, *contents):
+        paths = []
+        for i, content in enumerate(contents):
+            path = self.new_path / ('%s_%d' % (uuid4(), i))
+            path.write_bytes(content)
+            paths.append(str(path))
+        return paths
+
+    @mock.patch('apps.wasm.task.RESULT_DIGEST_BLOCK_SIZE', 3)
+    def test_result_digest(self):
+        result_a = self._result_files(b'first output', b'second')
+        result_b = self._result_files(b'first output', b'second')
+        result_c = self._result_files(b'first output', b'changed')
+
+        self.assertEqual(
+            WasmTask.result_digest(result_a),
+            WasmTask.result_digest(result_b))
+        self.assertNotEqual(
+            WasmTask.result_digest(result_a),
+            WasmTask.result_digest(result_c))
+        self.assertTrue(WasmTask.cmp_results(result_a, result_b))
+        self.assertFalse(WasmTask.cmp_results(result_a, result_c))
+
+
+class WasmTaskIndexTestCase(TempDirFixture):
+    """The indexed lookups give the same answers as scanning all subtasks"""
+
+    NODES = ['node%d' % i for i in range(8)]
+
+    @mock.patch("golem.model.Performance.get",
+                mock.Mock(return_value=_fake_performance()))
+    def setUp(self):
+        super().setUp()
+        definition = deepcopy(TEST_TASK_DEFINITION_DICT)
+        definition['options']['subtasks'] = {
+            'subtask%d' % i: {
+                'exec_args': [],
+                'output_file_paths': ['out'],
+            } for i in range(10)
+        }
+        task_def = WasmTaskBuilder.build_full_definition(
+            WasmTaskTypeInfo(), definition,
+        )
+        task_def.task_id = str(uuid4())
+        self.task = WasmTask(
+            task_definition=task_def,
+            root_path='/', owner=p2p.Node(),
+        )
+        self.task._new_compute_task_def = \
+            lambda s_id, *_args: {'subtask_id': s_id}
+        self.task.save_results = mock.Mock()
+        self.task.REQUESTOR_MARKET_STRATEGY = mock.Mock()
+
+    def _assert_same_as_scan(self):
+        task = self.task
+        for node_id in self.NODES:
+            if node_id in task.nodes_blacklist:
+                continue
+            expected = AcceptClientVerdict.ACCEPTED \
+                if any(s.is_allowed_node(node_id) for s in task.subtasks) \
+                else AcceptClientVerdict.SHOULD_WAIT
+            self.assertEqual(
+                task.should_accept_client(node_id, 'offer_hash'), expected)
+
+        for subtask in task.subtasks:
+            for s_id in subtask.get_instances():
+                self.assertIs(task._find_vbrsubtask_by_id(s_id), subtask)
+
+        self.assertEqual(
+            task.get_total_tasks(),
+            sum(s.get_subtask_count() for s in task.subtasks))
+        self.assertEqual(
+            task.get_active_tasks(),
+            sum(0 if s.is_finished() else s.get_subtask_count()
+                for s in task.subtasks))
+        self.assertEqual(
+            task.finished_computation(),
+            all(s.is_finished() for s in task.subtasks))
+
+    def _finish(self, s_id, content):
+        path = self.new_path / ('%s.out' % (s_id,))
+        path.write_bytes(content)
+        self.task.subtasks_given[s_id]['status'] = SubtaskStatus.downloading
+        self.task.computation_finished(
+            s_id, TaskResult(files=[str(path)]), mock.Mock())
+
+    def test_random_operations(self):
+        rng = random.Random(1234)
+        started = []
+
+        for _ in range(400):
+            op = rng.choice(['assign', 'assign', 'finish', 'fail', 'restart'])
+            if op == 'assign':
+                node_id = rng.choice(self.NODES)
+                verdict = self.task.should_accept_client(node_id, 'offer_hash')
+                if verdict == AcceptClientVerdict.ACCEPTED:
+                    extra_data = self.task.query_extra_data(1.0, node_id)
+                    started.append(extra_data.ctd['subtask_id'])
+            elif started:
+                s_id = started.pop(rng.randrange(len(started)))
+                if op == 'finish':
+                    self._finish(s_id, rng.choice([b'good', b'good', b'bad']))
+                elif op == 'fail':
+                    self.task.computation_failed(s_id)
+                else:
+                    self.task.restart_subtask(s_id)
+            self._assert_same_as_scan()
+
+    def test_rebuild_index_after_unpickling_old_state(self):
+        node_id = self.NODES[0]
+        self.task.query_extra_data(1.0, node_id)
+        state = self.task.__getstate__()
+        for key in list(state):
+            if key.startswith(('_vbrsubtasks', '_open', '_node_open',
+                               '_total', '_active')):
+                del state[key]
+
+        task = WasmTask.__new__(WasmTask)
+        task.__setstate__(state)
+        self.task = task
+        self._assert_same_as_scan()
+        self.assertEqual(
+            task.should_accept_client(node_id, 'offer_hash'),
+            AcceptClientVerdict.ACCEPTED)
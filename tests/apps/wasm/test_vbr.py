@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from apps.wasm.vbr import (
@@ -377,3 +379,48 @@ def test_r1_actor_removal_raises_finished():
 
     for _, _, verdict in verdicts:
         assert verdict == VerificationResult.SUCCESS
+
+
+def test_key_fn_called_once_per_result():
+    keys = []
+
+    def key_fn(result):
+        keys.append(result)
+        return result % 10
+
+    def comparator(_x, _y):
+        raise AssertionError('comparator should not be used')
+
+    verifier = BucketVerifier(2, comparator, 0, key_fn=key_fn)
+    for actor in actors[:3]:
+        verifier.add_actor(actor)
+
+    verifier.add_result(actors[0], 11)
+    verifier.add_result(actors[1], 21)
+    verifier.add_result(actors[2], 32)
+
+    assert keys == [11, 21, 32]
+    assert len(verifier.buckets) == 2
+    verdicts = verdicts_to_dict(verifier.get_verdicts())
+    assert verdicts[actors[0]] == VerificationResult.SUCCESS
+    assert verdicts[actors[1]] == VerificationResult.SUCCESS
+    assert verdicts[actors[2]] == VerificationResult.FAIL
+
+
+def test_unpickle_without_key_fn():
+    verifier = BucketVerifier(1, SimpleComparator(), 0)
+    for actor in actors[:2]:
+        verifier.add_actor(actor)
+    verifier.add_result(actors[0], 1)
+    # Pickled before key_fn was introduced
+    del verifier.key_fn
+    del verifier.buckets_by_key
+
+    verifier = pickle.loads(pickle.dumps(verifier))
+
+    assert verifier.key_fn is None
+    assert verifier.buckets_by_key == {}
+    verifier.add_result(actors[1], 1)
+    verdicts = verdicts_to_dict(verifier.get_verdicts())
+    assert verdicts[actors[0]] == VerificationResult.SUCCESS
+    assert verdicts[actors[1]] == VerificationResult.SUCCESS
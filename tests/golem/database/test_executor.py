@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from unittest import TestCase
+
+from peewee import SQL
+
+from golem import model as m
+from golem.database import DatabaseExecutor
+from golem.testutils import DatabaseFixture
+
+
+class TestDatabaseExecutorSync(TestCase):
+
+    def setUp(self):
+        self.executor = DatabaseExecutor()
+
+    def test_write_runs_in_caller_thread_when_stopped(self):
+        result = []
+        deferred = self.executor.write(
+            lambda: threading.current_thread().name)
+        deferred.addCallback(result.append)
+        self.assertEqual(result, [threading.current_thread().name])
+
+    def test_read_failure_when_stopped(self):
+        failures = []
+        deferred = self.executor.read(lambda: 1 / 0)
+        deferred.addErrback(failures.append)
+        self.assertEqual(len(failures), 1)
+        failures[0].trap(ZeroDivisionError)
+
+    def test_run_write_when_stopped(self):
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(
+                self.executor.run_write(lambda x: x + 1, 1))
+        finally:
+            loop.close()
+        self.assertEqual(result, 2)
+
+
+class TestDatabaseExecutor(DatabaseFixture):
+
+    def setUp(self):
+        super().setUp()
+        self.executor = DatabaseExecutor(readers=2)
+        self.executor.start()
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.executor.stop()
+        self.loop.close()
+        super().tearDown()
+
+    def test_write_and_read_in_worker_threads(self):
+        async def run():
+            writer = await self.executor.run_write(
+                lambda: threading.current_thread().name)
+            reader = await self.executor.run_read(
+                lambda: threading.current_thread().name)
+            return writer, reader
+
+        writer, reader = self.loop.run_until_complete(run())
+        self.assertTrue(writer.startswith('db-writer'))
+        self.assertTrue(reader.startswith('db-reader'))
+
+    def test_writes_keep_order(self):
+        async def run():
+            await asyncio.gather(*(
+                self.executor.run_write(
+                    m.GenericKeyValue.create, key=str(i), value=str(i))
+                for i in range(10)
+            ))
+
+        self.loop.run_until_complete(run())
+        keys = [kv.key for kv in
+                m.GenericKeyValue.select().order_by(SQL('rowid'))]
+        self.assertEqual(keys, [str(i) for i in range(10)])
+
+    def test_run_write_raises(self):
+        async def run():
+            await self.executor.run_write(lambda: 1 / 0)
+
+        with self.assertRaises(ZeroDivisionError):
+            self.loop.run_until_complete(run())
@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 
 import requests
 from docker import errors
 
+from golem.docker import image
 from golem.docker.client import local_client
 from golem.docker.image import DockerImage
 from golem.tools.ci import ci_skip
@@ -34,6 +36,95 @@ class DockerTestCase(unittest.TestCase):
             raise unittest.SkipTest(
                 "Skipping tests: Cannot connect with Docker daemon")
 
+    def setUp(self):
+        super().setUp()
+        DockerImage.clear_availability_cache()
+
+
+class FakeDockerClient:
+
+    def __init__(self, images):
+        self.images = images
+        self.inspect_calls = 0
+
+    def inspect_image(self, name_or_id):
+        self.inspect_calls += 1
+        if name_or_id not in self.images:
+            raise errors.NotFound(name_or_id)
+        return self.images[name_or_id]
+
+
+class TestDockerImageAvailabilityCache(unittest.TestCase):
+
+    IMAGE_ID = 'sha256:0123'
+
+    def setUp(self):
+        DockerImage.clear_availability_cache()
+        info = {'Id': self.IMAGE_ID, 'RepoTags': ['golemfactory/base:1.4']}
+        self.client = FakeDockerClient({
+            'golemfactory/base:1.4': info,
+            self.IMAGE_ID: info,
+        })
+        patcher = mock.patch('golem.docker.image.local_client',
+                             return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(DockerImage.clear_availability_cache)
+
+    def test_cached(self):
+        for _ in range(10):
+            self.assertTrue(
+                DockerImage('golemfactory/base', tag='1.4').is_available())
+            self.assertFalse(
+                DockerImage('golemfactory/base', tag='bogus').is_available())
+        self.assertEqual(self.client.inspect_calls, 2)
+
+    def test_keyed_by_name_and_id(self):
+        self.assertTrue(DockerImage(
+            'golemfactory/base', tag='1.4').is_available())
+        self.assertTrue(DockerImage(
+            'golemfactory/base', tag='1.4',
+            image_id=self.IMAGE_ID).is_available())
+        self.assertFalse(DockerImage(
+            'golemfactory/base', tag='1.4',
+            image_id='deadface').is_available())
+        self.assertEqual(self.client.inspect_calls, 3)
+
+    def test_expired(self):
+        img = DockerImage('golemfactory/base', tag='1.4')
+        with mock.patch('golem.docker.image.time.monotonic',
+                        return_value=1000.):
+            self.assertTrue(img.is_available())
+        with mock.patch('golem.docker.image.time.monotonic',
+                        return_value=1000. + image.AVAILABILITY_TTL - 1):
+            self.assertTrue(img.is_available())
+        self.assertEqual(self.client.inspect_calls, 1)
+        with mock.patch('golem.docker.image.time.monotonic',
+                        return_value=1000. + image.AVAILABILITY_TTL):
+            self.assertTrue(img.is_available())
+        self.assertEqual(self.client.inspect_calls, 2)
+
+    def test_cleared(self):
+        img = DockerImage('golemfactory/new', tag='1.0')
+        self.assertFalse(img.is_available())
+
+        self.client.images['golemfactory/new:1.0'] = {
+            'Id': 'sha256:4567', 'RepoTags': ['golemfactory/new:1.0']}
+        self.assertFalse(img.is_available())
+
+        DockerImage.clear_availability_cache()
+        self.assertTrue(img.is_available())
+        self.assertEqual(self.client.inspect_calls, 2)
+
+    def test_connection_error_not_cached(self):
+        img = DockerImage('golemfactory/base', tag='1.4')
+        with mock.patch.object(
+                self.client, 'inspect_image',
+                side_effect=requests.exceptions.ConnectionError):
+            self.assertFalse(img.is_available())
+        self.assertTrue(img.is_available())
+        self.assertEqual(self.client.inspect_calls, 1)
+
 
 @ci_skip
 class TestDockerImage(DockerTestCase):
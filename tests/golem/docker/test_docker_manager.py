@@ -304,6 +304,21 @@ class TestDockerManager(TestCase):  # pylint: disable=too-many-public-methods
 
         assert pulls[0] == expected
 
+    @mock.patch('golem.docker.manager.DockerImage.clear_availability_cache')
+    def test_pull_images_clears_availability_cache(self, clear_cache):
+        with mock.patch.object(MockDockerManager, 'command', return_value=''):
+            dmm = MockDockerManager()
+            dmm.pull_images()
+        clear_cache.assert_called_once_with()
+
+    @mock.patch('os.chdir')
+    @mock.patch('golem.docker.manager.DockerImage.clear_availability_cache')
+    def test_build_images_clears_availability_cache(self, clear_cache, _):
+        with mock.patch.object(MockDockerManager, 'command', return_value=''):
+            dmm = MockDockerManager()
+            dmm.build_images()
+        clear_cache.assert_called_once_with()
+
     @mock.patch('os.chdir')
     def test_build_images(self, os_chdir):
 
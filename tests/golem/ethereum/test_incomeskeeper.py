@@ -199,6 +199,71 @@ class TestIncomesKeeper(TestWithDatabase):
         self.assertIncomeHash(sender_node1, subtask_id1, transaction_id1)
         self.assertIncomeHash(sender_node2, subtask_id2, transaction_id2)
 
+    def _expect_many(self, payer_address, count, value, accepted_ts=1337):
+        for i in range(count):
+            self.incomes_keeper.expect(
+                sender_node=64 * 'a',
+                my_address=random_eth_address(),
+                task_id=str(uuid.uuid4()),
+                subtask_id='subtask_id%d' % (i,),
+                payer_address=payer_address,
+                value=value,
+                accepted_ts=accepted_ts,
+            )
+
+    @mock.patch('golem.ethereum.incomeskeeper.BULK_UPDATE_CHUNK_SIZE', 3)
+    @mock.patch('golem.ethereum.incomeskeeper.dispatcher.send')
+    def test_received_batch_transfer_aggregated_event(self, send_mock):
+        payer_address = '0x' + 40 * '3'
+        value = MAX_INT + 10
+        self._expect_many(payer_address, 7, value)
+        send_mock.reset_mock()
+
+        transaction_id = '0x' + 64 * 'c'
+        # Enough for five incomes and a part of the sixth one
+        self.incomes_keeper.received_batch_transfer(
+            transaction_id,
+            payer_address,
+            value * 5 + 10,
+            1337,
+        )
+
+        incomes = model.TaskPayment.incomes() \
+            .order_by(model.TaskPayment.id)
+        amounts = [i.wallet_operation.amount for i in incomes]
+        self.assertEqual(amounts, [value] * 5 + [10, 0])
+        for income in incomes:
+            self.assertEqual(income.wallet_operation.tx_hash, transaction_id)
+            self.assertEqual(
+                income.wallet_operation.status,
+                model.WalletOperation.STATUS.confirmed,
+            )
+        send_mock.assert_called_once_with(
+            signal='golem.income',
+            event='confirmed_batch',
+            node_id=payer_address,
+            amount=value * 5,
+            count=5,
+        )
+
+    @mock.patch('golem.ethereum.incomeskeeper.dispatcher.send')
+    def test_received_batch_transfer_per_income_events(self, send_mock):
+        self.incomes_keeper = IncomesKeeper(per_income_events=True)
+        payer_address = '0x' + 40 * '4'
+        value = 100
+        self._expect_many(payer_address, 2, value)
+        send_mock.reset_mock()
+
+        self.incomes_keeper.received_batch_transfer(
+            '0x' + 64 * 'e',
+            payer_address,
+            value * 2,
+            1337,
+        )
+
+        events = [c[1]['event'] for c in send_mock.call_args_list]
+        self.assertEqual(events, ['confirmed', 'confirmed'])
+
     @staticmethod
     def _create_income(**kwargs):
         income = model_factories.TaskPayment(
@@ -293,6 +358,69 @@ class TestIncomesKeeper(TestWithDatabase):
             model.WalletOperation.STATUS.overdue,
         )
 
+    @freeze_time()
+    def test_update_overdue_incomes_marks_only_matching(self):
+        old_ts = int(time.time()) - 2*PAYMENT_DEADLINE
+        overdue = [
+            self._create_income(
+                accepted_ts=old_ts,
+                wallet_operation__status=model.WalletOperation.STATUS.awaiting,
+            )
+            for _ in range(5)
+        ]
+        recent = self._create_income(
+            accepted_ts=int(time.time()),
+            wallet_operation__status=model.WalletOperation.STATUS.awaiting,
+        )
+        outgoing = model_factories.TaskPayment(
+            accepted_ts=old_ts,
+            wallet_operation__operation_type=  # noqa
+            model.WalletOperation.TYPE.task_payment,
+            wallet_operation__direction=  # noqa
+            model.WalletOperation.DIRECTION.outgoing,
+            wallet_operation__status=model.WalletOperation.STATUS.awaiting,
+        )
+
+        with mock.patch('golem.ethereum.incomeskeeper.dispatcher') as disp:
+            self.incomes_keeper.update_overdue_incomes()
+
+        for income in overdue:
+            self.assertEqual(
+                income.wallet_operation.refresh().status,
+                model.WalletOperation.STATUS.overdue,
+            )
+        for payment in (recent, outgoing):
+            self.assertEqual(
+                payment.wallet_operation.refresh().status,
+                model.WalletOperation.STATUS.awaiting,
+            )
+
+        disp.send.assert_called_with(
+            signal='golem.income',
+            event='overdue',
+            incomes=mock.ANY,
+        )
+        notified = disp.send.call_args[1]['incomes']
+        self.assertCountEqual(
+            [income.subtask for income in notified],
+            [income.subtask for income in overdue],
+        )
+        for income in notified:
+            self.assertEqual(
+                income.wallet_operation.status,
+                model.WalletOperation.STATUS.overdue,
+            )
+
+    @freeze_time()
+    def test_update_overdue_incomes_nothing_to_mark(self):
+        self._create_income(
+            accepted_ts=int(time.time()),
+            wallet_operation__status=model.WalletOperation.STATUS.awaiting,
+        )
+        with mock.patch('golem.ethereum.incomeskeeper.dispatcher') as disp:
+            self.incomes_keeper.update_overdue_incomes()
+        disp.send.assert_not_called()
+
     def test_received_transfer(self):
         self.incomes_keeper.received_transfer(
             tx_hash=f"0x{'0'*64}",
@@ -14,11 +14,15 @@ from hexbytes import HexBytes
 
 from golem import model
 from golem.core import variables
+from golem.core.cache import MemCacheMixin
 from golem.core.common import (
     datetime_to_timestamp,
     timestamp_to_datetime,
 )
 from golem.ethereum.paymentprocessor import (
+    BULK_UPDATE_CHUNK_SIZE,
+    CacheKey,
+    CHAIN_READS_MAX_AGE,
     PaymentProcessor,
     PAYMENT_MAX_DELAY,
 )
@@ -475,6 +479,114 @@ class InteractionWithSmartContractInterfaceTest(PaymentProcessorBase):
             self.sci.batch_transfer.reset_mock()
 
 
+class ChainReadsCacheTest(PaymentProcessorBase):
+    def setUp(self):
+        super().setUp()
+        self.pp.CLOSURE_TIME_DELAY = 0
+        # Not enough GNTB, nothing will be sent
+        _add_payment(self.pp, value=1, ts=1)
+
+    def test_reads_cached(self):
+        with freeze_time(timestamp_to_datetime(10000)):
+            self.pp.sendout(0)
+            self.pp.sendout(0)
+        assert self.sci.get_gntb_balance.call_count == 1
+        assert self.sci.get_eth_balance.call_count == 1
+        assert self.sci.get_current_gas_price.call_count == 1
+        assert self.sci.get_latest_confirmed_block.call_count == 1
+
+    def test_reads_expire(self):
+        with freeze_time(timestamp_to_datetime(10000)):
+            self.pp.sendout(0)
+        with freeze_time(timestamp_to_datetime(
+                10000 + CHAIN_READS_MAX_AGE + 1)):
+            self.pp.sendout(0)
+        assert self.sci.get_gntb_balance.call_count == 2
+        assert self.sci.get_current_gas_price.call_count == 2
+
+    def test_shared_cache(self):
+        chain_cache = MemCacheMixin()
+        self.pp = PaymentProcessor(self.sci, chain_cache=chain_cache)
+        self.pp.CLOSURE_TIME_DELAY = 0
+        with freeze_time(timestamp_to_datetime(10000)):
+            chain_cache.cache_set(CacheKey.GNTB, denoms.ether)
+            chain_cache.cache_set(CacheKey.ETH, denoms.ether)
+            assert self.pp.sendout(0)
+        self.sci.get_gntb_balance.assert_not_called()
+        self.sci.get_eth_balance.assert_not_called()
+        # Balances are re-read after the batch transfer, but the old ones
+        # are still available meanwhile
+        assert chain_cache.cache_get(CacheKey.GNTB) == denoms.ether
+        assert chain_cache.cache_is_stale(CacheKey.GNTB)
+        assert chain_cache.cache_is_stale(CacheKey.ETH)
+        _add_payment(self.pp, value=1, ts=10001)
+        with freeze_time(timestamp_to_datetime(10001)):
+            self.pp.sendout(0)
+        self.sci.get_gntb_balance.assert_called_once_with(self.addr)
+
+
+class BulkStatusUpdateTest(PaymentProcessorBase):
+    def setUp(self):
+        super().setUp()
+        self.sci.get_eth_balance.return_value = denoms.ether
+        self.sci.get_gntb_balance.return_value = 1000 * denoms.ether
+        self.pp.CLOSURE_TIME_DELAY = 0
+        for _ in range(BULK_UPDATE_CHUNK_SIZE + 10):
+            _add_payment(self.pp, ts=1)
+
+    def _statuses(self):
+        return {
+            wo.status for wo in model.WalletOperation.select()
+        }
+
+    def test_sendout(self):
+        with freeze_time(timestamp_to_datetime(10000)):
+            assert self.pp.sendout(0)
+        assert self._statuses() == {model.WalletOperation.STATUS.sent}
+        assert {
+            wo.tx_hash for wo in model.WalletOperation.select()
+        } == {self.tx_hash}
+
+    def test_batch_confirmed(self):
+        self.sci.get_transaction_gas_price.return_value = 10
+        self.sci.get_block_by_number.return_value = mock.Mock(
+            timestamp=10000)
+        payments = list(self.pp._awaiting)
+        with freeze_time(timestamp_to_datetime(10000)):
+            assert self.pp.sendout(0)
+
+        receipt = TransactionReceipt({
+            'transactionHash': HexBytes(self.tx_hash),
+            'blockNumber': 1337,
+            'blockHash': HexBytes('0x' + 64 * 'f'),
+            'gasUsed': 10 * len(payments),
+            'status': 1,
+        })
+        self.pp._on_batch_confirmed(payments, receipt)
+        assert self._statuses() == {model.WalletOperation.STATUS.confirmed}
+        assert {
+            wo.gas_cost for wo in model.WalletOperation.select()
+        } == {100}
+        assert self.pp.reserved_gntb == 0
+
+    def test_batch_failed(self):
+        payments = list(self.pp._awaiting)
+        with freeze_time(timestamp_to_datetime(10000)):
+            assert self.pp.sendout(0)
+        assert not self.pp._awaiting
+
+        receipt = TransactionReceipt({
+            'transactionHash': HexBytes(self.tx_hash),
+            'blockNumber': 1337,
+            'blockHash': HexBytes('0x' + 64 * 'f'),
+            'gasUsed': 55001,
+            'status': 0,
+        })
+        self.pp._on_batch_confirmed(payments, receipt)
+        assert self._statuses() == {model.WalletOperation.STATUS.awaiting}
+        assert len(self.pp._awaiting) == len(payments)
+
+
 class UpdateOverdueTest(PaymentProcessorBase):
     def add_payment(self, processed_ts: int):
         payment = model_factory.TaskPayment(
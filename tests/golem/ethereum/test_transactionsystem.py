@@ -2,6 +2,7 @@
 import datetime
 from pathlib import Path
 import sys
+import threading
 import time
 from typing import Optional
 from unittest.mock import patch, Mock, ANY, PropertyMock
@@ -18,6 +19,8 @@ import golem_sci
 import golem_sci.contracts
 import golem_sci.structs
 import hexbytes
+from twisted.internet import defer
+from twisted.trial.unittest import TestCase as TwistedTestCase
 
 from golem import model
 from golem import testutils
@@ -25,6 +28,7 @@ from golem.core import deferred
 from golem.ethereum import exceptions
 from golem.ethereum.transactionsystem import (
     CacheKey,
+    CHAIN_READS_MAX_AGE,
     TransactionSystem,
 )
 from golem.ethereum.exceptions import NotEnoughFunds
@@ -322,10 +326,23 @@ class TestTransactionSystem(TransactionSystemBase):
     def test_check_payments(self, *_args):
         with patch.object(
             self.ets._incomes_keeper, 'update_overdue_incomes'
-        ) as incomes:
+        ) as incomes, patch.object(
+            self.ets, '_refresh_balances_async',
+            return_value=defer.succeed(False),
+        ):
             self.ets._run()
             incomes.assert_called_once()
 
+    def test_run_skips_conversion_without_refresh(self):
+        with patch.object(self.ets, '_try_convert_gnt') as convert, \
+                patch.object(self.ets._payment_processor, 'sendout') \
+                as sendout:
+            self.ets._run_after_refresh(refreshed=False)
+            convert.assert_not_called()
+            sendout.assert_called_once_with()
+            self.ets._run_after_refresh(refreshed=True)
+            convert.assert_called_once_with()
+
     def test_no_password(self):
         ets = self._make_ets(just_create=True)
         with self.assertRaisesRegex(Exception, 'Invalid private key'):
@@ -948,3 +965,133 @@ class DefaultBalancesTest(TransactionSystemBase):
 
     def test_gntb(self):
         self.assertEqual(self.ets._gntb_balance, 0)
+
+
+class BalanceRefreshTest(TransactionSystemBase, TwistedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sci.get_latest_confirmed_block_number.return_value = 1
+        self.sci.get_eth_balance.return_value = 1
+        self.sci.get_gnt_balance.return_value = 2
+        self.sci.get_gntb_balance.return_value = 3
+        del self.ets._cache_store
+        self.sci.get_eth_balance.reset_mock()
+
+    @defer.inlineCallbacks
+    def test_reads_are_serialised(self):
+        in_progress = []
+        threads = set()
+
+        def serialised(value):
+            def read(*_args, **_kwargs):
+                self.assertEqual(in_progress, [])
+                in_progress.append(value)
+                threads.add(threading.get_ident())
+                time.sleep(0.01)
+                in_progress.remove(value)
+                return value
+            return read
+
+        self.sci.get_eth_balance.side_effect = serialised(1)
+        self.sci.get_gnt_balance.side_effect = serialised(2)
+        self.sci.get_gntb_balance.side_effect = serialised(3)
+        self.sci.get_current_gas_price.side_effect = serialised(4)
+        self.sci.get_latest_confirmed_block.side_effect = \
+            serialised(Mock(gas_limit=5))
+
+        refreshed = yield self.ets._refresh_balances_async()
+
+        self.assertTrue(refreshed)
+        # All of them were read in a single thread, off the reactor
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertEqual(self.ets._eth_balance, 1)
+        self.assertEqual(self.ets._gnt_balance, 2)
+        self.assertEqual(self.ets._gntb_balance, 3)
+        self.assertEqual(self.ets.cache_get(CacheKey.GasPrice), 4)
+        self.assertEqual(self.ets.cache_get(CacheKey.BlockGasLimit), 5)
+
+    @defer.inlineCallbacks
+    def test_skipped_without_new_block(self):
+        yield self.ets._refresh_balances_async()
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertFalse(refreshed)
+        self.assertEqual(self.sci.get_eth_balance.call_count, 1)
+
+        self.sci.get_latest_confirmed_block_number.return_value = 2
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.sci.get_eth_balance.call_count, 2)
+
+    @defer.inlineCallbacks
+    def test_refreshed_before_reads_expire(self):
+        yield self.ets._refresh_balances_async()
+        self.ets._cache[CacheKey.GasPrice].timestamp -= \
+            CHAIN_READS_MAX_AGE - self.ets.LOOP_INTERVAL + 1
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.sci.get_eth_balance.call_count, 2)
+
+    @defer.inlineCallbacks
+    def test_refreshed_after_invalidation(self):
+        yield self.ets._refresh_balances_async()
+        self.ets.cache_invalidate(CacheKey.ETH, CacheKey.GNTB)
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.ets._eth_balance, 1)
+
+    @defer.inlineCallbacks
+    def test_balances_kept_after_sendout(self):
+        self.sci.get_eth_balance.return_value = denoms.ether
+        self.sci.get_eth_address.return_value = '0x' + 'ab' * 20
+        self.sci.get_latest_confirmed_block.return_value = \
+            Mock(gas_limit=10 ** 10)
+        self.sci.batch_transfer.return_value = '0x' + 'cd' * 32
+        yield self.ets._refresh_balances_async()
+        eth_update_time = self.ets.cache_lastmod(CacheKey.ETH)
+
+        payment_processor = self.ets._payment_processor
+        payment_processor.CLOSURE_TIME_DELAY = 0
+        payment_processor.add(
+            subtask_id=str(uuid.uuid4()),
+            eth_addr='0x' + 'ef' * 20,
+            value=1,
+            node_id='0xadbeef' + 'deadbeef' * 15,
+            task_id=str(uuid.uuid4()),
+        )
+        self.sci.get_current_gas_price.reset_mock()
+        self.sci.get_latest_confirmed_block.reset_mock()
+        self.assertTrue(payment_processor.sendout(0))
+        # Gas price and block gas limit were read by the refresh
+        self.sci.get_current_gas_price.assert_not_called()
+        self.sci.get_latest_confirmed_block.assert_not_called()
+
+        # Still the last read balances until they're refreshed
+        self.assertEqual(self.ets._eth_balance, denoms.ether)
+        self.assertEqual(self.ets._gntb_balance, 3)
+        self.assertEqual(
+            self.ets.get_available_eth(),
+            denoms.ether - self.ets.get_locked_eth(),
+        )
+        self.assertEqual(
+            self.ets.cache_lastmod(CacheKey.ETH),
+            eth_update_time,
+        )
+
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.sci.get_eth_balance.call_count, 2)
+
+    @defer.inlineCallbacks
+    def test_failed_read_retried_on_same_block(self):
+        self.sci.get_gnt_balance.side_effect = TypeError
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.ets._eth_balance, 1)
+        self.assertEqual(self.ets._gntb_balance, 3)
+
+        self.sci.get_gnt_balance.side_effect = None
+        self.sci.get_gnt_balance.return_value = 5
+        refreshed = yield self.ets._refresh_balances_async()
+        self.assertTrue(refreshed)
+        self.assertEqual(self.ets._gnt_balance, 5)
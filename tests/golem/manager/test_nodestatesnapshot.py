@@ -19,6 +19,10 @@ class TestComputingSubtaskStateSnapshot(TestCase):
             'frames': [1],
             'start_task': start_task,
             'total_tasks': 1,
+            'reserved_cores': 4,
+            'reserved_memory_mb': 1024,
+            'free_cores': 28,
+            'free_memory_mb': None,
             'some_unused_field': 1234,
         }
 
@@ -147,3 +147,21 @@ class TestRequestorBrassMarketStrategy(TestCase):
             RequestorBrassMarketStrategy.get_task_offer_count(self.TASK_A), 2)
         result = RequestorBrassMarketStrategy.resolve_task_offers(self.TASK_A)
         self.assertEqual(len(result), 2)
+
+    def test_add_during_resolution(self):
+        offer = self._mock_offer()
+        RequestorBrassMarketStrategy.add(self.TASK_A, offer)
+
+        def order_providers(offers):
+            RequestorBrassMarketStrategy.add(self.TASK_A, offer)
+            return list(range(len(offers)))
+
+        with patch('golem.marketplace.brass_marketplace.order_providers',
+                   side_effect=order_providers):
+            result = RequestorBrassMarketStrategy.resolve_task_offers(
+                self.TASK_A)
+        self.assertEqual(len(result), 1)
+        # Waits for the next resolution
+        self.assertEqual(
+            RequestorBrassMarketStrategy.get_task_offer_count(self.TASK_A), 1)
+        RequestorBrassMarketStrategy.resolve_task_offers(self.TASK_A)
@@ -17,7 +17,7 @@ from golem.task.taskrequestorstats import AggregateTaskStats
 class TestStatsSnapshotModel(MonitorTestBaseClass):
     maxDiff = None
 
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     @mock.patch('json.dumps')
     def test_channel(self, mock_dumps, *_):
         known_tasks = random.randint(0, 10000)
@@ -40,6 +40,7 @@ class TestStatsSnapshotModel(MonitorTestBaseClass):
                 stats=stats_mock,
             ),
         )
+        self.loop.run_until_complete(self.monitor.flush())
         expected = {
             'proto_ver': 1,
             'data': {
@@ -8,7 +8,7 @@ from golem.task.taskcomputer import TaskComputerAdapter
 class TestTaskComputerSnapshotModel(MonitorTestBaseClass):
     maxDiff = None
 
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     @mock.patch('json.dumps')
     def test_channel(self, mock_dumps, *_):
         compute_tasks = random.random() > 0.5
@@ -22,6 +22,7 @@ class TestTaskComputerSnapshotModel(MonitorTestBaseClass):
         self.loop.run_until_complete(self.monitor.on_task_computer_snapshot(
             task_computer=computer_mock,
         ))
+        self.loop.run_until_complete(self.monitor.flush())
         mock_dumps.assert_called_once()
         result = mock_dumps.call_args[0][0]
         self.maxDiff = None
@@ -1,6 +1,9 @@
 # pylint: disable=protected-access
 import asyncio
+import http.server
 import json
+import socketserver
+import threading
 from unittest import mock, TestCase
 from urllib.parse import urljoin
 
@@ -11,6 +14,7 @@ from pydispatch import dispatcher
 from golem import testutils
 from golem.clientconfigdescriptor import ClientConfigDescriptor
 from golem.core import variables
+from golem.monitor.model.modelbase import BasicModel
 from golem.monitor.model.nodemetadatamodel import NodeMetadataModel
 from golem.monitor.monitor import SystemMonitor
 from golem.monitorconfig import MONITOR_CONFIG
@@ -85,11 +89,12 @@ class TestSystemMonitor(TestCase, testutils.PEP8MixIn):
         """Test whether correct login and logout messages
             and protocol data were sent."""
 
-        @mock.patch('requests.post')
+        @mock.patch('requests.Session.post')
         @mock.patch('json.dumps')
         def check(f, msg_type, mock_dumps, *_):
             with mock.patch('apps.core.nvgpu.is_supported', return_value=True):
                 self.loop.run_until_complete(f())
+                self.loop.run_until_complete(self.monitor.flush())
             expected_d = {
                 'proto_ver': MONITOR_CONFIG['PROTO_VERSION'],
                 'data': {
@@ -117,7 +122,8 @@ class TestSystemMonitor(TestCase, testutils.PEP8MixIn):
                     },
                 }
             }
-            mock_dumps.assert_called_once_with(expected_d, indent=mock.ANY)
+            mock_dumps.assert_called_once_with(
+                expected_d, separators=mock.ANY)
 
         # pylint: disable=no-value-for-parameter
         check(self.monitor.on_login, "Login")
@@ -225,14 +231,163 @@ class TestSystemMonitor(TestCase, testutils.PEP8MixIn):
         )
 
     @mock.patch(
-        'requests.post',
+        'requests.Session.post',
         side_effect=requests.exceptions.RequestException("request failed"),
     )
     def test_requests_exception(self, *_):
         with self.assertLogs(logger='golem.monitor', level='WARNING') as logs:
             self.loop.run_until_complete(self.monitor.on_login())
+            self.loop.run_until_complete(self.monitor.flush())
 
         # make sure we're not spitting out stack traces
         assert len(logs.output) == 1
         output_lines = logs.output[0].split('\n')
         assert len(output_lines) == 1
+
+
+class _EndpointHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        length = int(self.headers['Content-Length'])
+        self.server.received.append(  # type: ignore
+            (self.client_address, self.rfile.read(length)))
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        pass
+
+
+class _Endpoint(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _EndpointHandler)
+        self.received = []
+
+
+class TestSystemMonitorDelivery(TestCase):
+
+    def setUp(self):
+        self.endpoint = _Endpoint()
+        thread = threading.Thread(target=self.endpoint.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.endpoint.server_close)
+        self.addCleanup(self.endpoint.shutdown)
+
+        client_mock = mock.MagicMock()
+        client_mock.get_key_id = mock.MagicMock(return_value='cliid')
+        client_mock.session_id = 'sessid'
+        client_mock.config_desc = ClientConfigDescriptor()
+        self.meta_data = NodeMetadataModel(
+            client_mock, OSInfo('linux', 'Linux', '1', '1.2.3'), 'ver')
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(self.loop.close)
+
+    def _monitor(self, **config):
+        monitor_config = MONITOR_CONFIG.copy()
+        monitor_config['HOST'] = 'http://127.0.0.1:%d/' % (
+            self.endpoint.server_address[1],)
+        monitor_config.update(config)
+        return SystemMonitor(self.meta_data, monitor_config)
+
+    @staticmethod
+    def _model(i):
+        model = BasicModel('Test', 'cliid', 'sessid')
+        model.index = i
+        return model
+
+    def _send(self, monitor, count):
+        for i in range(count):
+            self.loop.run_until_complete(monitor.send(self._model(i)))
+
+    def _received_indices(self):
+        return [json.loads(body.decode())['data']['index']
+                for _, body in self.endpoint.received]
+
+    def test_batch_sent_on_flush(self):
+        monitor = self._monitor()
+        self._send(monitor, 5)
+        self.assertEqual(self.endpoint.received, [])
+
+        self.loop.run_until_complete(monitor.flush())
+
+        self.assertEqual(self._received_indices(), list(range(5)))
+        # A single persistent connection
+        self.assertEqual(
+            len({address for address, _ in self.endpoint.received}), 1)
+        for _, body in self.endpoint.received:
+            payload = json.loads(body.decode())
+            self.assertEqual(payload['proto_ver'],
+                             MONITOR_CONFIG['PROTO_VERSION'])
+            # Compact JSON
+            self.assertNotIn(b'\n', body)
+            self.assertNotIn(b': ', body)
+
+    def test_flushed_after_interval(self):
+        monitor = self._monitor(FLUSH_INTERVAL=0.01)
+        self._send(monitor, 3)
+
+        async def wait_for_delivery():
+            for _ in range(100):
+                if len(self.endpoint.received) == 3:
+                    return
+                await asyncio.sleep(0.05)
+
+        self.loop.run_until_complete(wait_for_delivery())
+        self.assertEqual(self._received_indices(), [0, 1, 2])
+
+    def test_queue_drops_oldest(self):
+        monitor = self._monitor(QUEUE_SIZE=3)
+        self._send(monitor, 5)
+        self.loop.run_until_complete(monitor.flush())
+        self.assertEqual(self._received_indices(), [2, 3, 4])
+
+    def test_logout_flushes(self):
+        monitor = self._monitor()
+        self._send(monitor, 2)
+        self.loop.run_until_complete(monitor.on_logout())
+
+        self.assertEqual(len(self.endpoint.received), 3)
+        last = json.loads(self.endpoint.received[-1][1].decode())
+        self.assertEqual(last['data']['type'], 'Logout')
+
+    def test_unavailable_endpoint_drops_batch(self):
+        errors = []
+
+        async def log_throttled(_msg, d):
+            errors.append(d['e'])
+
+        monitor = self._monitor()
+        self._send(monitor, 4)
+        with mock.patch(
+            'requests.Session.post',
+            side_effect=[
+                mock.Mock(status_code=200),
+                requests.exceptions.ConnectionError('refused'),
+            ],
+        ) as post, \
+                mock.patch('golem.monitor.monitor.log_throttled',
+                           log_throttled):
+            self.loop.run_until_complete(monitor.flush())
+
+        # The first one was sent, the rest of the batch was given up on
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(monitor._dropped, 3)
+
+        self._send(monitor, 1)
+        self.loop.run_until_complete(monitor.flush())
+        self.assertEqual(self._received_indices(), [0])
+        self.assertEqual(monitor._dropped, 3)
+
+    def test_flush_empty_queue(self):
+        monitor = self._monitor()
+        self.loop.run_until_complete(monitor.flush())
+        self.assertEqual(self.endpoint.received, [])
@@ -1,7 +1,10 @@
 # pylint: disable=protected-access, no-self-use
 import datetime
 import gc
+import http.server
 import logging
+import socketserver
+import threading
 import time
 from unittest import mock, TestCase
 import urllib
@@ -303,6 +306,7 @@ class TestConcentClientService(testutils.TempDirFixture):
             self.msg,
             self.concent_service.keys_auth._private_key,
             concent_variant=self.concent_service.variant,
+            session=mock.ANY,
         )
 
         assert not self.concent_service._delayed
@@ -325,9 +329,53 @@ class TestConcentClientService(testutils.TempDirFixture):
             self.msg,
             self.concent_service.keys_auth._private_key,
             concent_variant=self.concent_service.variant,
+            session=mock.ANY,
         )
         react_mock.assert_called_once_with(data, response_to=self.msg)
 
+    def test_dequeue_closest_deadline_first(self, *_):
+        msgs = [message.concents.ForceReportComputedTask() for _ in range(3)]
+        self.concent_service._enqueue('a', msgs[0], deadline=30)
+        self.concent_service._enqueue('b', msgs[1], deadline=10)
+        self.concent_service._enqueue('c', msgs[2], deadline=10)
+
+        batch = self.concent_service._dequeue(limit=5)
+        self.assertEqual(batch, [msgs[1], msgs[2], msgs[0]])
+
+    @mock.patch(
+        'golem.network.concent.client.ConcentClientService._grace_sleep')
+    def test_loop_drains_queue(self, sleep_mock, send_mock, *_):
+        send_mock.return_value = None
+        count = self.concent_service.SENDERS * 2 + 1
+        for i in range(count):
+            self.concent_service.submit(
+                'key{}'.format(i),
+                message.concents.ForceReportComputedTask(),
+                delay=datetime.timedelta(),
+            )
+
+        self.concent_service._loop()
+        self.assertEqual(send_mock.call_count, count)
+        self.assertTrue(self.concent_service._queue.empty())
+        sleep_mock.assert_not_called()
+
+    @mock.patch(
+        'golem.network.concent.client.ConcentClientService._grace_sleep')
+    def test_loop_failure_stops_draining(self, sleep_mock, send_mock, *_):
+        send_mock.side_effect = exceptions.ConcentUnavailableError
+        count = self.concent_service.SENDERS + 1
+        for i in range(count):
+            self.concent_service.submit(
+                'key{}'.format(i),
+                message.concents.ForceReportComputedTask(),
+                delay=datetime.timedelta(),
+            )
+
+        self.concent_service._loop()
+        self.assertEqual(send_mock.call_count, self.concent_service.SENDERS)
+        self.assertEqual(self.concent_service._queue.qsize(), 1)
+        sleep_mock.assert_called_once_with()
+
     @mock.patch(
         'golem.network.concent.client.ConcentClientService'
         '.react_to_concent_message'
@@ -432,6 +480,77 @@ class TestConcentClientService(testutils.TempDirFixture):
         )
 
 
+class _ConcentStubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        length = int(self.headers['Content-Length'])
+        self.rfile.read(length)
+        self.server.requests.append(self.client_address)  # type: ignore
+        self.send_response(200)
+        self.send_header(
+            'Concent-Golem-Messages-Version', golem_messages.__version__)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        pass
+
+
+class _ConcentStub(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _ConcentStubHandler)
+        self.requests = []
+
+
+@mock.patch('golem.terms.ConcentTermsOfUse.are_accepted', return_value=True)
+class ConcentClientServiceStubTestCase(testutils.TempDirFixture):
+    def setUp(self):
+        super().setUp()
+        self.server = _ConcentStub()
+        threading.Thread(target=self.server.serve_forever, daemon=True)\
+            .start()
+        concent_keys = golem_messages.cryptography.ECCx(None)
+        self.concent_service = client.ConcentClientService(
+            keys_auth=keysauth.KeysAuth(
+                datadir=self.path,
+                private_key_name='priv_key',
+                password='password',
+            ),
+            variant={
+                'url': 'http://127.0.0.1:{}'.format(self.server.server_port),
+                'pubkey': concent_keys.raw_pubkey,
+            },
+        )
+
+    def tearDown(self):
+        self.concent_service.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    @mock.patch(
+        'golem.network.concent.client.ConcentClientService._grace_sleep')
+    def test_burst_sent_over_persistent_sessions(self, sleep_mock, *_):
+        count = 10
+        for i in range(count):
+            self.concent_service.submit(
+                'key{}'.format(i),
+                msg_factories.concents.ForceReportComputedTaskFactory(),
+                delay=datetime.timedelta(),
+            )
+
+        self.concent_service._loop()
+        self.assertEqual(len(self.server.requests), count)
+        self.assertLessEqual(
+            len(set(self.server.requests)),
+            self.concent_service.SENDERS,
+        )
+        sleep_mock.assert_not_called()
+
+
 class ConcentCallLaterTestCase(testutils.TempDirFixture):
     def setUp(self):
         super().setUp()
@@ -1,10 +1,17 @@
+import datetime
+from unittest import mock
+
 from golem_messages.factories.datastructures import p2p as dt_p2p_factory
+from golem import model
 from golem import testutils
 from golem.network import nodeskeeper
 
 class TestNodesKeeper(testutils.DatabaseFixture):
     def setUp(self):
         super().setUp()
+        # pylint: disable=protected-access
+        nodeskeeper._cache.clear()
+        nodeskeeper._pending.clear()
         self.node = dt_p2p_factory.Node()
 
     def test_get(self):
@@ -13,3 +20,89 @@ class TestNodesKeeper(testutils.DatabaseFixture):
             self.node,
             nodeskeeper.get(self.node.key),
         )
+
+    def test_get_missing(self):
+        self.assertIsNone(nodeskeeper.get(self.node.key))
+
+    def test_store_is_written_on_flush(self):
+        nodeskeeper.store(self.node)
+        self.assertEqual(model.CachedNode.select().count(), 0)
+        nodeskeeper.flush()
+        self.assertEqual(
+            model.CachedNode.get(node=self.node.key).node_field,
+            self.node,
+        )
+
+    def test_store_unchanged(self):
+        nodeskeeper.store(self.node)
+        nodeskeeper.flush()
+        with mock.patch('golem.network.nodeskeeper._store') as store:
+            nodeskeeper.store(self.node)
+            nodeskeeper.flush()
+        store.assert_not_called()
+
+    def test_store_changed(self):
+        nodeskeeper.store(self.node)
+        nodeskeeper.flush()
+        node = dt_p2p_factory.Node(key=self.node.key, node_name='changed')
+        nodeskeeper.store(node)
+        nodeskeeper.flush()
+        self.assertEqual(
+            model.CachedNode.get(node=self.node.key).node_field.node_name,
+            'changed',
+        )
+
+    def test_get_cached(self):
+        nodeskeeper.store(self.node)
+        nodeskeeper.flush()
+        with mock.patch('golem.network.nodeskeeper._select') as select:
+            self.assertEqual(nodeskeeper.get(self.node.key), self.node)
+        select.assert_not_called()
+
+    @mock.patch('golem.network.nodeskeeper.CACHE_SIZE', 2)
+    def test_lru_eviction(self):
+        nodes = [dt_p2p_factory.Node() for _ in range(3)]
+        for node in nodes:
+            nodeskeeper.store(node)
+        nodeskeeper.flush()
+        # pylint: disable=protected-access
+        self.assertEqual(
+            list(nodeskeeper._cache),
+            [node.key for node in nodes[1:]],
+        )
+        self.assertEqual(nodeskeeper.get(nodes[0].key), nodes[0])
+        self.assertEqual(
+            list(nodeskeeper._cache),
+            [nodes[2].key, nodes[0].key],
+        )
+
+    @mock.patch('golem.network.nodeskeeper.SWEEP_KEEP', 1)
+    def test_sweep_evicts_cache(self):
+        node = dt_p2p_factory.Node()
+        nodeskeeper.store(self.node)
+        nodeskeeper.store(node)
+        nodeskeeper.flush()
+        model.CachedNode.update(
+            modified_date=datetime.datetime(2000, 1, 1),
+        ).where(model.CachedNode.node == self.node.key).execute()
+
+        nodeskeeper.sweep()
+        self.assertIsNone(nodeskeeper.get(self.node.key))
+        self.assertEqual(nodeskeeper.get(node.key), node)
+        # pylint: disable=protected-access
+        self.assertEqual(list(nodeskeeper._cache), [node.key])
+
+    def test_flush_failure_requeues(self):
+        nodeskeeper.store(self.node)
+        with mock.patch('golem.network.nodeskeeper._store',
+                        side_effect=Exception('write failed')):
+            nodeskeeper.flush()
+        self.assertEqual(model.CachedNode.select().count(), 0)
+
+        # Unchanged, but not written yet
+        nodeskeeper.store(self.node)
+        nodeskeeper.flush()
+        self.assertEqual(
+            model.CachedNode.get(node=self.node.key).node_field,
+            self.node,
+        )
@@ -16,8 +16,11 @@ from golem.network.transport import msg_queue
 
 
 class TestMsqQueue(testutils.DatabaseFixture):
+    # pylint: disable=protected-access
     def setUp(self):
         super().setUp()
+        msg_queue._index.clear()
+        msg_queue._index_loaded = False
         self.node_id = str(uuid.uuid4())
         self.msg = tasks_factories.WantToComputeTaskFactory()
 
@@ -77,10 +80,26 @@ class TestMsqQueue(testutils.DatabaseFixture):
         side_effect=sqlite3.ProgrammingError,
     )
     def test_waiting_programming_error(self, *_args):
-        msg_queue.put(self.node_id, self.msg)
+        model.QueuedMessage.from_message(self.node_id, self.msg).save()
         # Error should be handled cleanly inside waiting()
         waiting = frozenset(msg_queue.waiting())
         self.assertEqual(waiting, set())
+        self.assertFalse(msg_queue._index_loaded)
+
+    def test_waiting_loads_index(self):
+        model.QueuedMessage.from_message(self.node_id, self.msg).save()
+        self.assertEqual(list(msg_queue.waiting()), [self.node_id])
+
+        with mock.patch.object(model.QueuedMessage, 'select') as select:
+            self.assertEqual(list(msg_queue.waiting()), [self.node_id])
+        select.assert_not_called()
+
+    def test_waiting_after_get(self):
+        node_id2 = str(uuid.uuid4())
+        msg_queue.put(self.node_id, self.msg)
+        msg_queue.put(node_id2, self.msg)
+        list(msg_queue.get(self.node_id))
+        self.assertEqual(list(msg_queue.waiting()), [node_id2])
 
     @freeze_time()
     def test_waiting_timeout(self):
@@ -102,6 +121,25 @@ class TestMsqQueue(testutils.DatabaseFixture):
             ]),
         )
 
+    def test_put_index_update_under_read_lock(self):
+        # Otherwise a get() finding the queue empty could drop the node
+        # from the index after the put
+        locked = []
+        with mock.patch(
+            'golem.network.transport.msg_queue._index_add',
+            side_effect=lambda *_: locked.append(msg_queue.READ_LOCK.locked()),
+        ):
+            msg_queue.put(self.node_id, self.msg)
+        self.assertEqual(locked, [True])
+
+    @freeze_time()
+    def test_sweep_prunes_index(self):
+        msg_queue.put(self.node_id, self.msg, datetime.timedelta(seconds=1))
+        list(msg_queue.waiting())
+        with freeze_time(default_now() + datetime.timedelta(minutes=1)):
+            msg_queue.sweep()
+        self.assertEqual(msg_queue._index, {})
+
     def test_sweep(self):
         def put_explicit_now():
             instance = model.QueuedMessage.from_message(self.node_id, self.msg)
@@ -1,11 +1,13 @@
 from unittest.mock import patch
 import os
+import random
 import shutil
 import time
+import unittest
 
 from golem.core.common import is_linux, is_osx
 from golem.resource.dirmanager import symlink_or_copy, DirManager, \
-    list_dir_recursive
+    list_dir_recursive, ClearedFiles
 from golem.testutils import TempDirFixture
 
 
@@ -262,6 +264,124 @@ class TestDirManager(TempDirFixture):
         self.assertFalse(os.path.isdir(dir1))
 
 
+def _legacy_clear_dir(d, older_than_seconds=0):
+    """ DirManager.clear_dir before it was rewritten with os.scandir """
+    if not os.path.isdir(d):
+        return
+    min_allowed_mtime = time.time() - older_than_seconds
+    for i in os.listdir(d):
+        path = os.path.join(d, i)
+        if older_than_seconds > 0:
+            if os.path.getmtime(path) > min_allowed_mtime:
+                continue
+        if os.path.isfile(path):
+            os.remove(path)
+        if os.path.isdir(path):
+            _legacy_clear_dir(path)
+            if not os.listdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class TestClearDirGeneratedTree(TempDirFixture):
+
+    def _generate_tree(self, root, seed):
+        rng = random.Random(seed)
+        old = time.time() - 2 * 60 * 60
+        dirs = [root]
+        for i in range(30):
+            parent = rng.choice(dirs)
+            path = os.path.join(parent, 'dir%d' % i)
+            os.mkdir(path)
+            dirs.append(path)
+        for i in range(200):
+            path = os.path.join(rng.choice(dirs), 'file%d' % i)
+            with open(path, 'wb') as f:
+                f.write(b'x' * rng.randint(0, 2048))
+        # Age some of the entries; directories last, since creating
+        # files in them updates their mtime
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            for name in filenames + dirnames:
+                if rng.random() < 0.5:
+                    os.utime(os.path.join(dirpath, name), times=(old, old))
+
+    def _snapshot(self, root):
+        result = set()
+        for dirpath, dirnames, filenames in os.walk(root):
+            rel = os.path.relpath(dirpath, root)
+            result.update(os.path.join(rel, name)
+                          for name in dirnames + filenames)
+        return result
+
+    def _size(self, root):
+        return sum(
+            os.path.getsize(os.path.join(dirpath, name))
+            for dirpath, _, filenames in os.walk(root)
+            for name in filenames)
+
+    def _compare(self, older_than_seconds, workers=0):
+        for seed in range(3):
+            expected_dir = os.path.join(self.path, 'expected%d' % seed)
+            actual_dir = os.path.join(self.path, 'actual%d' % seed)
+            os.mkdir(expected_dir)
+            os.mkdir(actual_dir)
+            self._generate_tree(expected_dir, seed)
+            self._generate_tree(actual_dir, seed)
+            files_before = sum(1 for _ in list_dir_recursive(actual_dir))
+            size_before = self._size(actual_dir)
+
+            _legacy_clear_dir(expected_dir, older_than_seconds)
+            cleared = DirManager(self.path).clear_dir(
+                actual_dir, older_than_seconds, workers=workers)
+
+            self.assertEqual(
+                self._snapshot(actual_dir), self._snapshot(expected_dir))
+            files_after = sum(1 for _ in list_dir_recursive(actual_dir))
+            self.assertEqual(cleared.files, files_before - files_after)
+            self.assertEqual(cleared.bytes,
+                             size_before - self._size(actual_dir))
+
+    def test_clear_all(self):
+        self._compare(older_than_seconds=0)
+
+    def test_clear_older_than(self):
+        self._compare(older_than_seconds=60 * 60)
+
+    def test_clear_older_than_with_workers(self):
+        self._compare(older_than_seconds=60 * 60, workers=3)
+
+    def test_clear_all_with_workers(self):
+        self._compare(older_than_seconds=0, workers=3)
+
+    def test_counts_removed_dirs(self):
+        os.makedirs(os.path.join(self.path, 'a', 'b', 'c'))
+        with open(os.path.join(self.path, 'a', 'b', 'file'), 'wb') as f:
+            f.write(b'12345')
+
+        cleared = DirManager(self.path).clear_dir(self.path)
+
+        self.assertEqual(cleared, ClearedFiles(files=1, dirs=3, bytes=5))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_missing_dir(self):
+        cleared = DirManager(self.path).clear_dir(
+            os.path.join(self.path, 'missing'))
+        self.assertEqual(cleared, ClearedFiles())
+
+    @unittest.skipIf(not hasattr(os, 'symlink'), 'symlinks not supported')
+    def test_symlinked_dir_not_followed(self):
+        outside = os.path.join(self.path, 'outside')
+        inside = os.path.join(self.path, 'inside')
+        os.mkdir(outside)
+        os.mkdir(inside)
+        open(os.path.join(outside, 'keep'), 'w').close()
+        os.symlink(outside, os.path.join(inside, 'link'))
+
+        DirManager(self.path).clear_dir(inside)
+
+        self.assertEqual(os.listdir(inside), [])
+        self.assertEqual(os.listdir(outside), ['keep'])
+
+
 class TestUtilityFunction(TempDirFixture):
     def test_ls_r(self):
         os.makedirs(os.path.join(self.tempdir, "aa", "bb", "cc"))
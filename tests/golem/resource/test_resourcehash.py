@@ -0,0 +1,113 @@
+import base64
+import hashlib
+import os
+from unittest.mock import patch
+
+from golem.resource.resourcehash import ResourceHash
+from golem.testutils import TempDirFixture
+
+
+def _reference_hash(data):
+    return base64.urlsafe_b64encode(hashlib.sha1(data).digest()).decode()
+
+
+class TestResourceHash(TempDirFixture):
+    CACHE_DIGESTS = False
+
+    def setUp(self):
+        super().setUp()
+        self.resource_dir = os.path.join(self.path, 'resources')
+        os.makedirs(self.resource_dir)
+        self.resource_hash = ResourceHash(
+            self.resource_dir, cache_digests=self.CACHE_DIGESTS)
+        # Not a multiple of the block size used below
+        self.data = os.urandom(3 * 1024 + 17)
+        self.file_path = os.path.join(self.path, 'file')
+        with open(self.file_path, 'wb') as f:
+            f.write(self.data)
+
+    def test_get_file_hash(self):
+        expected = _reference_hash(self.data)
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path), expected)
+        for block_size in (1, 1000, 1024, len(self.data), 2 ** 20):
+            self.assertEqual(
+                self.resource_hash.get_file_hash(self.file_path, block_size),
+                expected)
+
+    def test_get_file_hash_empty(self):
+        empty_path = os.path.join(self.path, 'empty')
+        open(empty_path, 'wb').close()
+        self.assertEqual(
+            self.resource_hash.get_file_hash(empty_path), _reference_hash(b''))
+
+    def test_split_and_connect(self):
+        parts = self.resource_hash.split_file(self.file_path, block_size=1024)
+        self.assertEqual(len(parts), 4)
+        for part in parts:
+            with open(part, 'rb') as f:
+                self.assertEqual(os.path.basename(part),
+                                 _reference_hash(f.read()))
+
+        result_path = os.path.join(self.path, 'result')
+        self.resource_hash.connect_files(parts, result_path, block_size=100)
+        with open(result_path, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_repeated_get_file_hash(self):
+        self.resource_hash.get_file_hash(self.file_path)
+        with patch.object(hashlib, 'sha1', wraps=hashlib.sha1) as sha1:
+            self.resource_hash.get_file_hash(self.file_path)
+        self.assertEqual(sha1.call_count, 0 if self.CACHE_DIGESTS else 1)
+
+
+class TestResourceHashDigestCache(TestResourceHash):
+    CACHE_DIGESTS = True
+
+    def _rewrite(self, data, keep_mtime):
+        stat = os.stat(self.file_path)
+        with open(self.file_path, 'wb') as f:
+            f.write(data)
+        if keep_mtime:
+            os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        else:
+            os.utime(self.file_path,
+                     ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def test_unchanged_file_not_rehashed(self):
+        expected = _reference_hash(self.data)
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path), expected)
+
+        # Same size and mtime: the cached digest is returned
+        self._rewrite(bytes(len(self.data)), keep_mtime=True)
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path), expected)
+
+    def test_modified_file_rehashed(self):
+        self.resource_hash.get_file_hash(self.file_path)
+
+        new_data = bytes(len(self.data))
+        self._rewrite(new_data, keep_mtime=False)
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path),
+            _reference_hash(new_data))
+
+    def test_resized_file_rehashed(self):
+        self.resource_hash.get_file_hash(self.file_path)
+
+        new_data = self.data + b'x'
+        self._rewrite(new_data, keep_mtime=True)
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path),
+            _reference_hash(new_data))
+
+    def test_clear_digest_cache(self):
+        self.resource_hash.get_file_hash(self.file_path)
+
+        new_data = bytes(len(self.data))
+        self._rewrite(new_data, keep_mtime=True)
+        self.resource_hash.clear_digest_cache()
+        self.assertEqual(
+            self.resource_hash.get_file_hash(self.file_path),
+            _reference_hash(new_data))
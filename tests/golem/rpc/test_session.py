@@ -1,13 +1,15 @@
 # pylint: disable=protected-access,no-self-use
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import call, Mock, patch
 
 import autobahn
 from twisted.internet.defer import Deferred
+from twisted.internet.task import Clock
 
 from golem.rpc import session as rpc_session
 from golem.rpc import utils as rpc_utils
 from golem.rpc.session import (
+    CoalescingPublisher,
     logger,
     Publisher,
     RPCAddress,
@@ -99,6 +101,88 @@ class TestPublisher(LogTestCase):
         session.publish.assert_called_with('alias', 1234, kw='arg')
 
 
+class TestCoalescingPublisher(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = Clock()
+        self.publisher = Mock(spec=Publisher)
+        self.coalescer = CoalescingPublisher(
+            self.publisher,
+            window=1.0,
+            reactor=self.clock,
+        )
+
+    def test_publish_passes_through(self):
+        self.coalescer.publish('alias', 1234, kw='arg')
+        self.publisher.publish.assert_called_once_with(
+            'alias', 1234, kw='arg')
+
+    def test_batch_within_window(self):
+        for i in range(100):
+            self.coalescer.publish_coalesced('topic', ('t', str(i)), 't', i)
+        self.publisher.publish.assert_not_called()
+
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_called_once_with(
+            'topic.batch', [('t', i) for i in range(100)])
+
+    def test_legacy_topics_not_coalesced(self):
+        self.coalescer.legacy_topics = True
+        self.coalescer.publish_coalesced('topic', 'key', 1)
+        self.coalescer.publish_coalesced('topic', 'key', 2)
+        # Published right away, every transition of the same key
+        self.assertEqual(
+            self.publisher.publish.call_args_list,
+            [call('topic', 1), call('topic', 2)],
+        )
+
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_called_with('topic.batch', [(2,)])
+        assert self.publisher.publish.call_count == 3
+
+    def test_deduplicate_by_key(self):
+        self.coalescer.publish_coalesced('topic', ('t', 's1'), 's1', 1)
+        self.coalescer.publish_coalesced('topic', ('t', 's2'), 's2', 1)
+        self.coalescer.publish_coalesced('topic', ('t', 's1'), 's1', 2)
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_any_call(
+            'topic.batch', [('s2', 1), ('s1', 2)])
+
+    def test_no_legacy_topics(self):
+        self.coalescer.publish_coalesced('topic', 'key', 'arg')
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_called_once_with(
+            'topic.batch', [('arg',)])
+
+    def test_topics_are_separate(self):
+        self.coalescer.publish_coalesced('topic1', 'key', 1)
+        self.coalescer.publish_coalesced('topic2', 'key', 2)
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_any_call('topic1.batch', [(1,)])
+        self.publisher.publish.assert_any_call('topic2.batch', [(2,)])
+
+    def test_window_per_topic(self):
+        self.coalescer.windows = {'slow': 5.0}
+        self.coalescer.publish_coalesced('slow', 'key', 1)
+        self.coalescer.publish_coalesced('topic', 'key', 2)
+        self.clock.advance(1.0)
+        self.publisher.publish.assert_called_once_with('topic.batch', [(2,)])
+
+        self.clock.advance(4.0)
+        self.publisher.publish.assert_called_with('slow.batch', [(1,)])
+        assert self.publisher.publish.call_count == 2
+
+    def test_flush(self):
+        self.coalescer.publish_coalesced('topic', 'key', 1)
+        self.coalescer.flush()
+        self.publisher.publish.assert_called_once_with(
+            'topic.batch', [(1,)])
+
+        self.clock.advance(1.0)
+        assert self.publisher.publish.call_count == 1
+        assert not self.clock.getDelayedCalls()
+
+
 def mock_report_calls(func):
     return func
 
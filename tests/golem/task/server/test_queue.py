@@ -64,3 +64,55 @@ class TestTaskQueueMixin(
             self.conn_id,
             node_id=self.node_id,
         )
+
+    @mock.patch('golem.network.transport.msg_queue.waiting')
+    def test_connect_to_nodes_backoff(self, waiting):
+        waiting.return_value = [self.node_id]
+        with mock.patch.object(self.server, 'initiate_session') as initiate, \
+                freeze_time('2019-04-15 11:15:00') as frozen:
+            self.server.msg_queue_connection_final_failure(
+                self.conn_id,
+                node_id=self.node_id,
+            )
+            self.server.connect_to_nodes()
+            initiate.assert_not_called()
+
+            frozen.tick(  # pylint: disable=no-member
+                srv_queue.RECONNECT_BACKOFF_MIN)
+            self.server.connect_to_nodes()
+            initiate.assert_called_once_with(self.node_id)
+
+    @freeze_time('2019-04-15 11:15:00')
+    def test_backoff_doubles(self, *_):
+        for _i in range(3):
+            self.server.msg_queue_connection_final_failure(
+                self.conn_id,
+                node_id=self.node_id,
+            )
+        self.assertEqual(
+            self.server._reconnect_backoff[self.node_id],
+            (1555326900.0 + 4 * srv_queue.RECONNECT_BACKOFF_MIN,
+             4 * srv_queue.RECONNECT_BACKOFF_MIN),
+        )
+
+    def test_backoff_reset_on_established(self, *_):
+        self.server.msg_queue_connection_final_failure(
+            self.conn_id,
+            node_id=self.node_id,
+        )
+        self.server.msg_queue_connection_established(
+            mock.MagicMock(session=self.session),
+            self.conn_id,
+            self.node_id,
+        )
+        self.assertNotIn(self.node_id, self.server._reconnect_backoff)
+
+    @mock.patch('golem.network.transport.msg_queue.waiting',
+                return_value=[])
+    def test_backoff_dropped_when_not_waiting(self, *_):
+        self.server.msg_queue_connection_final_failure(
+            self.conn_id,
+            node_id=self.node_id,
+        )
+        self.server.connect_to_nodes()
+        self.assertEqual(self.server._reconnect_backoff, {})
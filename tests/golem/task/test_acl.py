@@ -1,8 +1,10 @@
 # pylint: disable=protected-access
 
 import unittest
+from unittest import mock
 from freezegun import freeze_time
 
+from golem.task import acl as acl_module
 from golem.task.acl import get_acl, \
     DenyReason, AclRule, setup_acl, _DenyAcl, _AllowAcl
 from golem.model import ACLAllowedNodes, ACLDeniedNodes
@@ -96,6 +98,66 @@ class TestAcl(DatabaseFixture):
         assert acl.is_allowed("Node1") == (True, None)
         assert "Node1" not in acl._deny_deadlines
 
+    @mock.patch('golem.task.acl.MAX_TEMPORARY_BANS', 100)
+    def test_temporary_bans_bounded(self):
+        with freeze_time('2018-01-01 00:00:00'):
+            acl = get_acl(self.client)
+            node_ids = ['node%d' % i for i in range(1000)]
+            for i, node_id in enumerate(node_ids):
+                acl.disallow(node_id, timeout_seconds=i + 1)
+                # Ask about the node once, then never again
+                acl.is_allowed(node_id)
+                assert len(acl._expiry) <= acl_module.MAX_TEMPORARY_BANS
+                assert len(acl._deny_deadlines) <= \
+                    acl_module.MAX_TEMPORARY_BANS
+
+            # Bans expiring last are kept
+            self.assertEqual(set(acl._deny_deadlines), set(node_ids[-100:]))
+            assert acl.is_allowed(node_ids[-1]) == \
+                (False, DenyReason.temporarily_blocked)
+
+    def test_expired_bans_swept(self):
+        with freeze_time('2018-01-01 00:00:00') as frozen_time:
+            acl = get_acl(self.client)
+            acl.disallow('Node1')
+            for i in range(50):
+                acl.disallow('node%d' % i, timeout_seconds=10)
+            self.assertEqual(len(acl._deny_deadlines), 51)
+
+            frozen_time.tick(acl_module.SWEEP_INTERVAL)
+            assert acl.is_allowed('Node2') == (True, None)
+            self.assertEqual(acl._deny_deadlines, {'Node1': acl._always})
+            self.assertEqual(acl._expiry, [])
+
+    def test_disallow_persist_deferred(self):
+        acl = get_acl(self.client)
+        with mock.patch('golem.model.db_executor.write') as write:
+            assert acl.disallow('Node1')
+            assert not acl.disallow('Node1')
+        write.assert_called_once_with(acl._persist_deny, 'Node1', 'Node1')
+        assert acl.is_allowed('Node1') == (False, DenyReason.blacklisted)
+        self.assertEqual(ACLDeniedNodes.select().count(), 0)
+
+        acl._persist_deny('Node1', 'Node1')
+        acl._persist_deny('Node1', 'Node1')
+        self.assertEqual(
+            [node.node_id for node in ACLDeniedNodes.select()], ['Node1'])
+
+    def test_disallow_allow_persist_ordered(self):
+        acl = get_acl(self.client)
+        with mock.patch('golem.model.db_executor.write') as write:
+            assert acl.disallow('Node1')
+            assert acl.allow('Node1', persist=True)
+            assert not acl.allow('Node2', persist=True)
+        self.assertEqual(
+            [call[0][0] for call in write.call_args_list],
+            [acl._persist_deny, acl._persist_allow, acl._persist_allow],
+        )
+        for call in write.call_args_list:
+            call[0][0](*call[0][1:])
+        self.assertEqual(ACLDeniedNodes.select().count(), 0)
+        assert acl.is_allowed('Node1') == (True, None)
+
     def test_timeout_in_status(self):
         with freeze_time('2016-09-29 18:18:01') as frozen_time:
             acl = get_acl(self.client)
@@ -1,19 +1,24 @@
 from unittest.mock import MagicMock, Mock
 
-from twisted.internet import defer
+from twisted.internet import defer, task
 from twisted.trial.unittest import TestCase as TwistedTestCase
 
 from golem.envs import Environment, EnvMetadata
 from golem.model import Performance
 from golem.task.task_api import TaskApiPayloadBuilder
-from golem.task.envmanager import EnvironmentManager
+from golem.task.envmanager import (
+    EnvironmentManager,
+    ENV_IDLE_TIMEOUT,
+    ResourceSlots,
+)
 from golem.testutils import DatabaseFixture
 
 
 class EnvManagerBaseTest(DatabaseFixture):
     def setUp(self):
         super().setUp()
-        self.manager = EnvironmentManager(self.new_path)
+        self.clock = task.Clock()
+        self.manager = EnvironmentManager(self.new_path, reactor=self.clock)
 
     def register_env(self, env_id):
         env = MagicMock(spec=Environment)
@@ -115,14 +120,80 @@ class TestAutoSetup(  # pylint: disable=too-many-ancestors
         yield runtime1.prepare()
         env1.prepare.assert_called_once()
 
+        # Starting another environment does not clean up the first one
+        yield runtime2.prepare()
+        env2.prepare.assert_called_once()
+        env1.clean_up.assert_not_called()
+        self.assertCountEqual(self.manager.in_use(), [env1, env2])
+
         # Environment should *not* be cleaned up after runtime is...
         yield runtime1.clean_up()
         env1.clean_up.assert_not_called()
+        self.assertEqual(self.manager.in_use(), [env2])
 
-        # ...but only when another environment is started
-        yield runtime2.prepare()
+        # ...but only after being idle for long enough
+        self.clock.advance(ENV_IDLE_TIMEOUT)
         env1.clean_up.assert_called_once()
-        env2.prepare.assert_called_once()
+        env2.clean_up.assert_not_called()
+
+    @defer.inlineCallbacks
+    def test_reuse_before_idle_timeout(self):
+        env, *_ = self.register_env("env1")
+        wrapped_env = self.manager.environment("env1")
+
+        runtime = wrapped_env.runtime(Mock())
+        yield runtime.prepare()
+        yield runtime.clean_up()
+        self.clock.advance(ENV_IDLE_TIMEOUT - 1)
+
+        runtime = wrapped_env.runtime(Mock())
+        yield runtime.prepare()
+        self.clock.advance(ENV_IDLE_TIMEOUT)
+
+        # Still in use, prepared only once and never cleaned up
+        env.prepare.assert_called_once()
+        env.clean_up.assert_not_called()
+
+        yield runtime.clean_up()
+        self.clock.advance(ENV_IDLE_TIMEOUT)
+        env.clean_up.assert_called_once()
+
+        # Prepared again after having been cleaned up
+        runtime = wrapped_env.runtime(Mock())
+        yield runtime.prepare()
+        self.assertEqual(env.prepare.call_count, 2)
+
+
+class TestResourceSlots(EnvManagerBaseTest):
+
+    def test_unlimited(self):
+        self.assertIsNone(self.manager.free_resources())
+        self.assertTrue(self.manager.reserve("env1", ResourceSlots(64, 2**20)))
+        self.assertEqual(
+            self.manager.reserved("env1"), ResourceSlots(64, 2**20))
+
+    def test_reserve_per_env(self):
+        self.manager.set_capacity(ResourceSlots(cores=4, memory_mb=4096))
+
+        self.assertTrue(self.manager.reserve("env1", ResourceSlots(2, 1024)))
+        self.assertTrue(self.manager.reserve("env2", ResourceSlots(1, 2048)))
+        self.assertFalse(self.manager.reserve("env1", ResourceSlots(2, 512)))
+        self.assertTrue(self.manager.reserve("env1", ResourceSlots(1, 1024)))
+
+        self.assertEqual(self.manager.reserved("env1"), ResourceSlots(3, 2048))
+        self.assertEqual(self.manager.reserved("env2"), ResourceSlots(1, 2048))
+        self.assertEqual(self.manager.free_resources(), ResourceSlots(0, 0))
+
+        self.manager.release("env2", ResourceSlots(1, 2048))
+        self.assertEqual(self.manager.reserved("env2"), ResourceSlots())
+        self.assertEqual(
+            self.manager.free_resources(), ResourceSlots(1, 2048))
+
+    def test_release_too_much(self):
+        self.manager.reserve("env1", ResourceSlots(1, 1024))
+        with self.assertRaises(ValueError):
+            self.manager.release("env1", ResourceSlots(2, 1024))
+        self.assertEqual(self.manager.reserved("env1"), ResourceSlots(1, 1024))
 
 
 class TestRuntimeLogs(  # pylint: disable=too-many-ancestors
@@ -14,7 +14,7 @@ from golem.core.deferred import deferred_from_future
 from golem.core.statskeeper import IntStatsKeeper
 from golem.envs import Runtime
 from golem.envs.docker.cpu import DockerCPUConfig
-from golem.task.envmanager import EnvironmentManager
+from golem.task.envmanager import EnvironmentManager, ResourceSlots
 from golem.task.taskcomputer import NewTaskComputer
 from golem.testutils import TempDirFixture
 from tests.utils.asyncio import TwistedAsyncioTestCase
@@ -81,7 +81,8 @@ class NewTaskComputerTestBase(TwistedAsyncioTestCase, TempDirFixture):
                 kwargs.get('prereq_dict') or self.prereq_dict),
             subtask_timeout=(
                 kwargs.get('subtask_timeout') or self.subtask_timeout),
-            deadline=kwargs.get('task_deadline') or self.task_deadline
+            deadline=kwargs.get('task_deadline') or self.task_deadline,
+            estimated_memory=kwargs.get('estimated_memory', 0),
         )
 
     def _get_compute_task_def(self, **kwargs):
@@ -114,7 +115,8 @@ class TestTaskGiven(NewTaskComputerTestBase):
 
         task_header = self._get_task_header()
         compute_task_def = self._get_compute_task_def()
-        self.task_computer.task_given(task_header, compute_task_def)
+        self.assertTrue(
+            self.task_computer.task_given(task_header, compute_task_def))
 
         self.assertTrue(self.task_computer.has_assigned_task())
         self.assertEqual(self.task_computer.assigned_task_id, self.task_id)
@@ -126,6 +128,37 @@ class TestTaskGiven(NewTaskComputerTestBase):
             self.env_id)
         provider_timer.start.assert_called_once_with()
         self.assertTrue(self.task_computer.get_subtask_inputs_dir().exists())
+        self.env_manager.reserve.assert_called_once_with(
+            self.env_id, ResourceSlots())
+
+    def test_reserves_configured_resources(self, _):
+        config_desc = ClientConfigDescriptor()
+        config_desc.num_cores = 3
+        config_desc.max_memory_size = 1024 * 1024
+        self.task_computer.change_config(config_desc)
+
+        self._assign_task()
+        self.env_manager.reserve.assert_called_once_with(
+            self.env_id, ResourceSlots(cores=3, memory_mb=1024))
+
+    def test_reserves_estimated_memory(self, _):
+        config_desc = ClientConfigDescriptor()
+        config_desc.num_cores = 3
+        config_desc.max_memory_size = 1024 * 1024
+        self.task_computer.change_config(config_desc)
+
+        self._assign_task(estimated_memory=100 * 2 ** 20 + 1)
+        self.env_manager.reserve.assert_called_once_with(
+            self.env_id, ResourceSlots(cores=3, memory_mb=101))
+
+    def test_not_enough_resources(self, provider_timer):
+        self.env_manager.reserve.return_value = False
+        task_header = self._get_task_header()
+        compute_task_def = self._get_compute_task_def()
+        self.assertFalse(
+            self.task_computer.task_given(task_header, compute_task_def))
+        self.assertFalse(self.task_computer.has_assigned_task())
+        provider_timer.start.assert_not_called()
 
     def test_has_assigned_task(self, provider_timer):
         task_header = self._get_task_header()
@@ -186,6 +219,8 @@ class TestCompute(NewTaskComputerTestBase):
         ), any_order=True)
         self.provider_timer.finish.assert_called_once()
         self.assertFalse(self.task_computer.has_assigned_task())
+        self.env_manager.release.assert_called_once_with(
+            self.env_id, ResourceSlots())
 
     @defer.inlineCallbacks
     def test_task_interrupted(self):
@@ -196,6 +231,8 @@ class TestCompute(NewTaskComputerTestBase):
         result = yield deferred
 
         self.assertIsNone(result)
+        self.env_manager.release.assert_called_once_with(
+            self.env_id, ResourceSlots())
         self.logger.warning.assert_called_once()
         self.stats_keeper.increase_stat.assert_not_called()
         self.dispatcher.send.assert_has_calls((
@@ -250,6 +287,8 @@ class TestCompute(NewTaskComputerTestBase):
         with self.assertRaises(OSError):
             yield self.task_computer.compute()
 
+        self.env_manager.release.assert_called_once_with(
+            self.env_id, ResourceSlots())
         self.logger.exception.assert_called_once()
         self.stats_keeper.increase_stat.assert_called_once_with(
             'tasks_with_errors')
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from unittest import TestCase
+import os
+from unittest import TestCase, mock
 from uuid import uuid4
 
 from freezegun import freeze_time
@@ -7,9 +8,11 @@ from golem_messages.factories.datastructures import p2p as dt_p2p_factory
 from golem_messages.factories.datastructures import tasks as dt_tasks_factory
 import pytz
 
+from golem.appconfig import TASKARCHIVE_FILENAME
 from golem.task.taskarchiver import TaskArchiver
 from golem.environments.environment import SupportStatus, UnsupportReason
 from golem.core.common import timeout_to_deadline
+from golem.testutils import TempDirFixture
 
 
 class TestTaskArchiver(TestCase):
@@ -191,3 +194,66 @@ class TestTaskArchiver(TestCase):
         ta.do_maintenance()
         rep = ta.get_unsupport_reasons(5)
         self.assertEqual(self.get_row(rep, UnsupportReason.MAX_PRICE), (2, 4))
+
+
+@mock.patch('golem.task.taskarchiver.golem_async.async_run')
+class TestTaskArchiverDump(TempDirFixture):
+    def setUp(self):
+        super().setUp()
+        self.dump_file = os.path.join(self.tempdir, TASKARCHIVE_FILENAME)
+        self.ta = TaskArchiver(self.tempdir)
+
+    def add_task(self, max_price):
+        header = TestTaskArchiver.header(max_price)
+        self.ta.add_task(header)
+        self.ta.add_support_status(
+            header.task_id,
+            SupportStatus.err({UnsupportReason.MAX_PRICE: "0"}),
+        )
+
+    def test_no_changes(self, async_run):
+        self.ta.do_maintenance()
+        async_run.assert_not_called()
+
+        self.add_task(3)
+        self.ta.do_maintenance()
+        async_run.assert_called_once()
+        self.ta._dump_archive()
+
+        async_run.reset_mock()
+        self.ta.do_maintenance()
+        async_run.assert_not_called()
+
+    def test_dump_and_load(self, _):
+        self.add_task(3)
+        self.add_task(5)
+        self.ta.do_maintenance()
+        self.ta._dump_archive()
+
+        loaded = TaskArchiver(self.tempdir)
+        self.assertEqual(loaded.get_unsupport_reasons(5),
+                         self.ta.get_unsupport_reasons(5))
+        self.assertEqual(os.listdir(self.tempdir), [TASKARCHIVE_FILENAME])
+
+    def test_dump_crash_keeps_previous_archive(self, _):
+        self.add_task(3)
+        self.ta.do_maintenance()
+        self.ta._dump_archive()
+        expected = self.ta.get_unsupport_reasons(5)
+
+        self.add_task(5)
+        self.ta.do_maintenance()
+        with mock.patch('golem.task.taskarchiver.os.fsync',
+                        side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.ta._dump_archive()
+
+        self.assertEqual(os.listdir(self.tempdir), [TASKARCHIVE_FILENAME])
+        loaded = TaskArchiver(self.tempdir)
+        self.assertEqual(loaded.get_unsupport_reasons(5), expected)
+
+        # The archive is still dirty, so the next dump is not skipped
+        self.ta._dump_archive()
+        loaded = TaskArchiver(self.tempdir)
+        self.assertEqual(loaded.get_unsupport_reasons(5),
+                         self.ta.get_unsupport_reasons(5))
@@ -18,6 +18,7 @@ from golem.core.common import timeout_to_deadline
 from golem.core.deferred import sync_wait
 from golem.docker.manager import DockerManager
 from golem.envs.docker.cpu import DockerCPUEnvironment
+from golem.task.envmanager import ResourceSlots
 from golem.task.taskcomputer import TaskComputer, PyTaskThread, TaskComputation
 from golem.task.taskserver import TaskServer
 from golem.task.taskthread import JobException
@@ -523,7 +524,7 @@ class TestTaskComputerBase(TwistedTestCase):
         self.task_server = mock.Mock(
             spec=TaskServer,
             config_desc=ClientConfigDescriptor(),
-            task_keeper=mock.Mock())
+            task_keeper=mock.Mock(task_headers={}))
         self.docker_cpu_env = mock.Mock(spec=DockerCPUEnvironment)
         self.docker_manager = mock.Mock(spec=DockerManager, hypervisor=None)
         docker_manager.install.return_value = self.docker_manager
@@ -575,6 +576,151 @@ class TestTaskGiven(TestTaskComputerBase):
         provider_timer.start.assert_called_once_with()
 
 
+@mock.patch('golem.task.taskcomputer.ProviderTimer')
+class TestResourcePacking(TestTaskComputerBase):
+
+    def setUp(self):
+        super().setUp()
+        self.task_computer.max_num_cores = 32
+        self.task_computer.max_memory_mb = 16 * 1024
+        self.single_core_tasks = set()
+        self.task_server.is_task_single_core.side_effect = \
+            lambda header: header.task_id in self.single_core_tasks
+
+    def add_task(self, task_id, memory_mb, single_core=True):
+        if single_core:
+            self.single_core_tasks.add(task_id)
+        self.task_server.task_keeper.task_headers[task_id] = mock.Mock(
+            task_id=task_id,
+            estimated_memory=memory_mb * 1024 * 1024)
+
+    def give(self, task_id, subtask_id):
+        return self.task_computer.task_given(
+            ComputeTaskDef(task_id=task_id, subtask_id=subtask_id))
+
+    def assert_not_over_committed(self):
+        free = self.task_computer.free_resources()
+        self.assertGreaterEqual(free.cores, 0)
+        self.assertGreaterEqual(free.memory_mb, 0)
+
+    def test_requested_resources(self, _):
+        self.add_task('single', memory_mb=512)
+        self.add_task('multi', memory_mb=2048, single_core=False)
+
+        self.assertEqual(
+            self.task_computer.requested_resources('single'),
+            ResourceSlots(cores=1, memory_mb=512))
+        self.assertEqual(
+            self.task_computer.requested_resources('multi'),
+            ResourceSlots(cores=32, memory_mb=2048))
+        self.assertEqual(
+            self.task_computer.requested_resources('unknown'),
+            ResourceSlots(cores=32, memory_mb=0))
+
+    def test_packs_until_cores_are_used(self, _):
+        self.add_task('small', memory_mb=256)
+        self.assertEqual(self.task_computer.admissible_subtasks('small'), 32)
+
+        for i in range(32):
+            self.assertTrue(self.task_computer.can_take_work('small'))
+            self.give('small', str(i))
+            self.assert_not_over_committed()
+
+        self.assertFalse(self.task_computer.can_take_work('small'))
+        self.assertEqual(self.task_computer.free_cores, 0)
+        self.assertEqual(self.task_computer.admissible_subtasks('small'), 0)
+
+    def test_packs_until_memory_is_used(self, _):
+        self.add_task('big', memory_mb=6 * 1024)
+        self.assertEqual(self.task_computer.admissible_subtasks('big'), 2)
+
+        self.give('big', '1')
+        self.give('big', '2')
+        self.assert_not_over_committed()
+
+        self.assertFalse(self.task_computer.can_take_work('big'))
+        self.assertEqual(self.task_computer.free_cores, 30)
+        self.add_task('small', memory_mb=1024)
+        self.assertTrue(self.task_computer.can_take_work('small'))
+        self.assertEqual(
+            self.task_computer.compatible_tasks({'big', 'small'}), {'small'})
+
+    def test_multi_core_task_is_exclusive(self, _):
+        self.add_task('multi', memory_mb=1024, single_core=False)
+        self.add_task('single', memory_mb=1024)
+
+        self.assertTrue(self.task_computer.can_take_work('multi'))
+        self.give('multi', '1')
+        self.assertFalse(self.task_computer.can_take_work())
+        self.assertFalse(self.task_computer.can_take_work('single'))
+        self.assertEqual(
+            self.task_computer.compatible_tasks({'multi', 'single'}), set())
+
+    def test_over_commit_refused(self, _):
+        self.add_task('multi', memory_mb=1024, single_core=False)
+        self.add_task('big', memory_mb=10 * 1024)
+
+        self.assertTrue(self.give('big', '1'))
+        self.assertFalse(self.give('multi', '2'))
+        self.assertFalse(self.give('big', '3'))
+        self.assertEqual(
+            [c.assigned_subtask['subtask_id']
+             for c in self.task_computer.assigned_subtasks],
+            ['1'],
+        )
+        self.assert_not_over_committed()
+
+    def test_idle_computer_refuses_oversized_subtask(self, _):
+        self.add_task('huge', memory_mb=64 * 1024)
+        self.assertFalse(self.task_computer.can_take_work('huge'))
+        self.assertEqual(self.task_computer.admissible_subtasks('huge'), 0)
+        self.assertFalse(self.give('huge', '1'))
+        self.assertFalse(self.task_computer.has_assigned_task())
+
+    def test_idle_computer_admits_subtask_within_limits(self, _):
+        self.add_task('multi', memory_mb=16 * 1024, single_core=False)
+        self.assertEqual(self.task_computer.admissible_subtasks('multi'), 1)
+        self.assertTrue(self.give('multi', '1'))
+
+    def test_free_resources_released(self, _):
+        self.add_task('small', memory_mb=1024)
+        self.give('small', '1')
+        computation = self.task_computer.assigned_subtasks[0]
+        self.assertEqual(
+            self.task_computer.free_resources(),
+            ResourceSlots(cores=31, memory_mb=15 * 1024))
+
+        self.task_computer.assigned_subtasks.remove(computation)
+        self.assertEqual(
+            self.task_computer.free_resources(),
+            ResourceSlots(cores=32, memory_mb=16 * 1024))
+
+    def test_mixed_sizes(self, _):
+        sizes = [
+            ResourceSlots(cores=4, memory_mb=2048),
+            ResourceSlots(cores=1, memory_mb=512),
+            ResourceSlots(cores=8, memory_mb=1024),
+            ResourceSlots(cores=2, memory_mb=4096),
+        ]
+        requests = {str(i): sizes[i % len(sizes)] for i in range(40)}
+
+        with mock.patch.object(
+                self.task_computer, 'requested_resources',
+                side_effect=requests.__getitem__):
+            for task_id in requests:
+                if self.task_computer.can_take_work(task_id):
+                    self.give(task_id, task_id)
+                self.assert_not_over_committed()
+
+        free = self.task_computer.free_resources()
+        admitted = len(self.task_computer.assigned_subtasks)
+        self.assertGreater(admitted, 1)
+        # No remaining request size fits in what is left
+        self.assertFalse(any(size.fits_in(free) for size in sizes))
+        # Either cores or memory are (almost) fully utilised
+        self.assertTrue(free.cores < 8 or free.memory_mb < 4096)
+
+
 class TestTaskInterrupted(TestTaskComputerBase):
 
     def test_no_task_assigned(self):
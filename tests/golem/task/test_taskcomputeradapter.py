@@ -70,7 +70,8 @@ class TestTaskGiven(TaskComputerAdapterTestBase):
         self.task_server.task_keeper.task_headers = {
             'test': task_header
         }
-        self.adapter.task_given(ctd)
+        self.new_computer.task_given.return_value = False
+        self.assertFalse(self.adapter.task_given(ctd))
         self.new_computer.task_given.assert_called_once_with(task_header, ctd)
         self.old_computer.task_given.assert_not_called()
 
@@ -82,7 +83,8 @@ class TestTaskGiven(TaskComputerAdapterTestBase):
         self.task_server.task_keeper.task_headers = {
             'test': task_header
         }
-        self.adapter.task_given(ctd)
+        self.old_computer.task_given.return_value = True
+        self.assertTrue(self.adapter.task_given(ctd))
         self.new_computer.task_given.assert_not_called()
         self.old_computer.task_given.assert_called_once_with(ctd, None)
 
@@ -0,0 +1,220 @@
+import pickle
+
+from golem.task.taskjournal import TaskJournal
+from golem.task.taskstate import TaskState, TaskStatus, SubtaskStatus
+from golem.testutils import TempDirFixture
+
+from tests.factories.task import taskstate as taskstate_factory
+
+
+class Preview:
+
+    def __init__(self):
+        self.chunks = {}
+        self.placed = 0
+
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
+
+
+class JournalTask:
+    """ Minimal picklable stand-in for a Task """
+    JOURNAL_SUBTASK_ATTRS = ('subtasks_given', 'results')
+
+    def __init__(self):
+        self.listeners = []
+        self.subtasks_given = {}
+        self.results = {}
+        self.num_tasks_received = 0
+        self.frames = {'1': [], '2': []}
+        self.previews = [Preview(), Preview()]
+
+    def journal_paths(self, subtask_id):
+        paths = [('num_tasks_received',)]
+        subtask = self.subtasks_given.get(subtask_id)
+        if subtask and 'frame' in subtask:
+            frame = subtask['frame']
+            preview = ('previews', int(frame) - 1)
+            paths += [
+                ('frames', frame),
+                preview + ('chunks', subtask_id),
+                preview + ('placed',),
+            ]
+        return paths
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['listeners']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        self.listeners = []
+
+
+class TestTaskJournal(TempDirFixture):
+
+    def setUp(self):
+        super().setUp()
+        self.task_id = 'task-id'
+        self.journal = TaskJournal(self.new_path)
+        self.task = JournalTask()
+        self.state = TaskState()
+
+    def _add_subtask(self, subtask_id):
+        self.state.subtask_states[subtask_id] = \
+            taskstate_factory.SubtaskState(subtask_id=subtask_id)
+        self.task.subtasks_given[subtask_id] = {
+            'status': SubtaskStatus.starting,
+        }
+
+    def _finish_subtask(self, subtask_id, frame=None):
+        self.state.subtask_states[subtask_id].status = SubtaskStatus.finished
+        self.task.subtasks_given[subtask_id]['status'] = \
+            SubtaskStatus.finished
+        self.task.results[subtask_id] = ['result']
+        self.task.num_tasks_received += 1
+        if frame is not None:
+            self.task.subtasks_given[subtask_id]['frame'] = frame
+            self.task.frames[frame].append(subtask_id)
+            preview = self.task.previews[int(frame) - 1]
+            preview.chunks[subtask_id] = 'chunk.png'
+            preview.placed += 1
+
+    def _restore(self):
+        return TaskJournal(self.new_path).load(self.task_id)
+
+    def test_needs_snapshot(self):
+        self.journal.snapshot_every = 2
+        assert self.journal.needs_snapshot(self.task_id, self.task)
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        assert not self.journal.needs_snapshot(self.task_id, self.task)
+
+        for subtask_id in ('s1', 's2'):
+            self._add_subtask(subtask_id)
+            self.journal.append_delta(
+                self.task_id, subtask_id, self.task, self.state)
+        assert self.journal.needs_snapshot(self.task_id, self.task)
+
+    def test_needs_snapshot_without_subtask_attrs(self):
+        self.task.JOURNAL_SUBTASK_ATTRS = ()
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        assert self.journal.needs_snapshot(self.task_id, self.task)
+
+    def test_needs_snapshot_after_failed_journal_reset(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        path = self.journal.journal_path(self.task_id)
+        path.unlink()
+        path.mkdir()
+        with self.assertRaises(OSError):
+            self.journal.write_snapshot(self.task_id, self.task, self.state)
+        assert self.journal.needs_snapshot(self.task_id, self.task)
+
+    def test_replay_deltas(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        for subtask_id in ('s1', 's2', 's3'):
+            self._add_subtask(subtask_id)
+            self.journal.append_delta(
+                self.task_id, subtask_id, self.task, self.state)
+        self._finish_subtask('s2', frame='2')
+        self.state.progress = 0.5
+        self.journal.append_delta(self.task_id, 's2', self.task, self.state)
+
+        task, state = self._restore()
+        assert task.__getstate__() == self.task.__getstate__()
+        assert state.subtask_states == self.state.subtask_states
+        assert state.progress == 0.5
+        assert state.status == TaskStatus.creating
+
+    def test_delta_does_not_contain_other_subtasks(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        for i in range(100):
+            self._add_subtask('s%d' % i)
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+
+        for i in range(100):
+            if i != 50:
+                self._finish_subtask('s%d' % i, frame='1')
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+
+        self._finish_subtask('s50', frame='1')
+        self.journal.append_delta(self.task_id, 's50', self.task, self.state)
+
+        with self.journal.journal_path(self.task_id).open('rb') as f:
+            pickle.load(f)  # generation
+            record = pickle.load(f)
+        assert record['keyed']['subtasks_given'] == \
+            {'status': SubtaskStatus.finished, 'frame': '1'}
+        assert record['keyed']['results'] == ['result']
+        assert record['entries'] == [
+            (('num_tasks_received',), 100),
+            (('frames', '1'), self.task.frames['1']),
+            (('previews', 0, 'chunks', 's50'), 'chunk.png'),
+            (('previews', 0, 'placed'), 100),
+        ]
+
+        task, _ = self._restore()
+        assert task.__getstate__() == self.task.__getstate__()
+
+    def test_unresolvable_entry_stops_replay(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        self._add_subtask('s1')
+        self._finish_subtask('s1', frame='1')
+        self.journal.append_delta(self.task_id, 's1', self.task, self.state)
+        self._add_subtask('s2')
+        self.journal.append_delta(self.task_id, 's2', self.task, self.state)
+
+        # The snapshot doesn't have the preview the first record updates
+        path = self.journal.snapshot_path(self.task_id)
+        task, state, generation = pickle.loads(path.read_bytes())
+        task.previews = []
+        path.write_bytes(pickle.dumps((task, state, generation)))
+
+        _, state = self._restore()
+        assert 's2' not in state.subtask_states
+
+    def test_truncated_journal(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        self._add_subtask('s1')
+        self.journal.append_delta(self.task_id, 's1', self.task, self.state)
+        self._add_subtask('s2')
+        self.journal.append_delta(self.task_id, 's2', self.task, self.state)
+
+        path = self.journal.journal_path(self.task_id)
+        data = path.read_bytes()
+        path.write_bytes(data[:-5])
+
+        _, state = self._restore()
+        assert list(state.subtask_states) == ['s1']
+
+    def test_stale_journal_is_ignored(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        self._add_subtask('s1')
+        self.journal.append_delta(self.task_id, 's1', self.task, self.state)
+        stale = self.journal.journal_path(self.task_id).read_bytes()
+
+        self.state.subtask_states.clear()
+        self.task.subtasks_given.clear()
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        # Simulate a crash between the snapshot rename
+        # and the journal truncation
+        self.journal.journal_path(self.task_id).write_bytes(stale)
+
+        task, state = self._restore()
+        assert not state.subtask_states
+        assert not task.subtasks_given
+
+    def test_legacy_snapshot(self):
+        path = self.journal.snapshot_path(self.task_id)
+        with path.open('wb') as f:
+            pickle.dump((self.task, self.state), f, protocol=2)
+
+        task, state = self._restore()
+        assert task.__getstate__() == self.task.__getstate__()
+        assert state.status == self.state.status
+
+    def test_remove(self):
+        self.journal.write_snapshot(self.task_id, self.task, self.state)
+        self.journal.remove(self.task_id)
+        assert not self.journal.journal_path(self.task_id).exists()
+        assert self.journal.needs_snapshot(self.task_id, self.task)
@@ -443,6 +443,45 @@ class TestTaskHeaderKeeper(TaskHeaderKeeperBase):
                        'reason': 'environment_not_accepting_tasks',
                        'ntasks': 1}, reasons)
 
+    @freeze_time(as_arg=True)
+    # pylint: disable=no-self-argument
+    def test_find_newest_node(frozen_time, self):
+        def scan(owner_key_id):
+            headers = [
+                self.thk.task_headers[task_id]
+                for task_id in self.thk.tasks_by_owner.get(owner_key_id, ())
+                if task_id in self.thk.task_headers
+            ]
+            if not headers:
+                return None
+            return max(headers, key=lambda h: h.timestamp).task_owner
+
+        seeds = ("ta", "tb")
+        for i, timestamp in enumerate([5, 3, 9, 1, 7, 8, 2]):
+            for seed in seeds:
+                header_dict = get_dict_task_header(seed)
+                header_dict['timestamp'] = timestamp
+                header_dict['deadline'] = timeout_to_deadline(i + 1)
+                header_dict['task_owner']['pub_port'] = 10000 + timestamp
+                self.thk.add_task_header(dt_tasks.TaskHeader(**header_dict))
+
+        owner_key_ids = [encode_hex(str.encode(seed))[2:] for seed in seeds]
+        for owner_key_id in owner_key_ids:
+            self.assertEqual(
+                self.thk.find_newest_node(owner_key_id).pub_port, 10009)
+
+        # Headers expire one by one, in the order they were added
+        for _ in range(8):
+            for owner_key_id in owner_key_ids:
+                self.assertIs(self.thk.find_newest_node(owner_key_id),
+                              scan(owner_key_id))
+            frozen_time.tick(timedelta(seconds=1))  # pylint: disable=no-member
+            self.thk.remove_old_tasks()
+
+        for owner_key_id in owner_key_ids:
+            self.assertIsNone(self.thk.find_newest_node(owner_key_id))
+        self.assertIsNone(self.thk.find_newest_node("UNKNOWN"))
+
     def test_get_owner(self):
         header = get_task_header()
         owner = header.task_owner.key
@@ -264,13 +264,65 @@ class TestTaskManager(LogTestCase, TestDatabaseWithReactor,  # noqa # pylint: di
                 assert restored_task.header.task_id == task_id
                 assert original_state.__dict__ == restored_state.__dict__
 
+    def test_restore_journaled_subtask(self, *_):
+        task_id = "xyz"
+        subtask_id = "xxyyzz"
+        task = self._get_test_dummy_task(task_id)
+        self.tm.add_new_task(task)
+        self.tm.start_task(task_id)
+
+        self.tm.tasks_states[task_id].subtask_states[subtask_id] = \
+            taskstate_factory.SubtaskState(subtask_id=subtask_id)
+        with self.assertLogs(logger, level="DEBUG") as log:
+            self.tm.notice_task_updated(task_id, subtask_id=subtask_id,
+                                        op=SubtaskOp.ASSIGNED)
+        assert any("TASK %s JOURNALED" % task_id in log
+                   for log in log.output)
+
+        fresh_tm = TaskManager(
+            dt_p2p_factory.Node(),
+            keys_auth=Mock(),
+            root_path=self.path,
+            config_desc=ClientConfigDescriptor(),)
+        restored_state = fresh_tm.tasks_states[task_id]
+        assert subtask_id in restored_state.subtask_states
+        assert fresh_tm.subtask2task_mapping[subtask_id] == task_id
+
+    def test_failed_dump_keeps_previous_snapshot(self, *_):
+        task_id = "xyz"
+        subtask_id = "xxyyzz"
+        task = self._get_test_dummy_task(task_id)
+        self.tm.add_new_task(task)
+        self.tm.start_task(task_id)
+        self.tm.tasks_states[task_id].subtask_states[subtask_id] = \
+            taskstate_factory.SubtaskState(subtask_id=subtask_id)
+        self.tm.notice_task_updated(task_id, subtask_id=subtask_id,
+                                    op=SubtaskOp.ASSIGNED)
+
+        with patch('golem.task.taskjournal.pickle.dump',
+                   side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.tm.dump_task(task_id)
+
+        assert self.tm.task_journal.snapshot_path(task_id).exists()
+        assert self.tm.task_journal.journal_path(task_id).exists()
+        fresh_tm = TaskManager(
+            dt_p2p_factory.Node(),
+            keys_auth=Mock(),
+            root_path=self.path,
+            config_desc=ClientConfigDescriptor(),)
+        assert subtask_id in fresh_tm.tasks_states[task_id].subtask_states
+
     def test_remove_wrong_task_during_restore(self, *_):
         broken_pickle_file = self.tm.tasks_dir / "broken.pickle"
         with broken_pickle_file.open('w') as f:
             f.write("notapickle")
+        broken_journal_file = self.tm.tasks_dir / "broken.journal"
+        broken_journal_file.write_bytes(b"notajournal")
         assert broken_pickle_file.is_file()
         self.tm.restore_tasks()
         assert not broken_pickle_file.is_file()
+        assert not broken_journal_file.is_file()
 
     def test_got_wants_to_compute(self, *_):
         task_mock = self._get_task_mock()
@@ -39,6 +39,7 @@ from golem.environments.environment import (
 )
 from golem.envs import BenchmarkResult, EnvSupportStatus
 from golem.envs import Environment as NewEnv
+from golem.ethereum.incomeskeeper import IncomesKeeper
 from golem.network.hyperdrive.client import HyperdriveClientOptions, \
     HyperdriveClient, to_hyperg_peer
 from golem.resource import resourcemanager
@@ -1129,6 +1130,39 @@ class TestSubtask(TaskServerBase):
         mock_increase.assert_called_once_with(node_id, self.ts.max_trust)
         mock_update.assert_called_once_with(node_id, amt)
 
+    @patch('golem.task.taskserver.Trust.PAYMENT.increase')
+    @patch('golem.task.taskserver.update_requestor_paid_sum')
+    def test_income_listener_confirmed_batch(self, mock_update, mock_increase):
+        node_id = str(uuid.uuid4())
+        amt = 30
+        self.ts.income_listener(
+            event="confirmed_batch", node_id=node_id, amount=amt, count=3)
+        mock_increase.assert_called_once_with(node_id, self.ts.max_trust * 3)
+        mock_update.assert_called_once_with(node_id, amt)
+
+    def test_income_listener_per_income_events(self):
+        incomes_keeper = IncomesKeeper(per_income_events=True)
+        payer_address = '0x' + 40 * '4'
+        for _ in range(2):
+            incomes_keeper.expect(
+                sender_node=64 * 'a',
+                task_id=str(uuid.uuid4()),
+                subtask_id=str(uuid.uuid4()),
+                payer_address=payer_address,
+                my_address='0x' + 40 * '5',
+                value=10,
+                accepted_ts=1337,
+            )
+        with patch.object(self.ts, '_increase_trust_payment') as mock_increase:
+            incomes_keeper.received_batch_transfer(
+                '0x' + 64 * 'e',
+                payer_address,
+                20,
+                1337,
+            )
+        mock_increase.assert_has_calls([call(payer_address, 10)] * 2)
+        self.assertEqual(mock_increase.call_count, 2)
+
     @patch('golem.task.taskserver.Trust.PAYMENT.decrease')
     def test_income_listener_overdue(self, mock_decrease):
         node_id = str(uuid.uuid4())
@@ -2,7 +2,9 @@ import itertools
 
 from freezegun import freeze_time
 
-from golem.task.verification.queue.backend import DatabaseQueueBackend
+from golem.model import QueuedVerification
+from golem.task.verification.queue.backend import DatabaseQueueBackend, \
+    HeapQueueBackend
 from golem.testutils import DatabaseFixture
 
 
@@ -37,6 +39,16 @@ class TestDatabaseQueueBackend(DatabaseFixture):
         assert self.backend.get() == (f"{TASK_ID}1", f"{SUBTASK_ID}1")
         assert self.backend.get() is None
 
+    def test_get_exclude_tasks(self):
+        self.backend.put(f"{TASK_ID}0", f"{SUBTASK_ID}0", priority=0)
+        self.backend.put(f"{TASK_ID}1", f"{SUBTASK_ID}1", priority=1)
+        self.backend.put(f"{TASK_ID}0", f"{SUBTASK_ID}2", priority=2)
+
+        exclude = [f"{TASK_ID}0"]
+        assert self.backend.get(exclude) == (f"{TASK_ID}1", f"{SUBTASK_ID}1")
+        assert self.backend.get(exclude) is None
+        assert self.backend.get() == (f"{TASK_ID}0", f"{SUBTASK_ID}0")
+
     def test_put_duplicate(self):
         assert self.backend.put(TASK_ID, SUBTASK_ID, priority=None)
         assert not self.backend.put(TASK_ID, SUBTASK_ID, priority=None)
@@ -69,3 +81,32 @@ class TestDatabaseQueueBackend(DatabaseFixture):
         assert self.backend.get() == (f"{TASK_ID}2", f"{SUBTASK_ID}2")
         assert self.backend.get() == (f"{TASK_ID}1", f"{SUBTASK_ID}1")
         assert self.backend.get() is None
+
+
+class TestHeapQueueBackend(TestDatabaseQueueBackend):
+
+    def setUp(self):
+        super().setUp()
+        self.backend = HeapQueueBackend()
+
+    def test_restore(self):
+        self.backend.put(f"{TASK_ID}0", f"{SUBTASK_ID}0", priority=None)
+        self.backend.put(f"{TASK_ID}1", f"{SUBTASK_ID}1", priority=2)
+        self.backend.put(f"{TASK_ID}2", f"{SUBTASK_ID}2", priority=1)
+        assert self.backend.get() == (f"{TASK_ID}2", f"{SUBTASK_ID}2")
+
+        backend = HeapQueueBackend()
+        assert not backend.put(f"{TASK_ID}0", f"{SUBTASK_ID}0", priority=0)
+        assert backend.get() == (f"{TASK_ID}1", f"{SUBTASK_ID}1")
+        assert backend.get() is None
+
+        backend.update_not_prioritized(lambda: 0)
+        assert backend.get() == (f"{TASK_ID}0", f"{SUBTASK_ID}0")
+        assert QueuedVerification.select().count() == 0
+
+    def test_update_priorities_persisted(self):
+        self.backend.put(f"{TASK_ID}0", f"{SUBTASK_ID}0", priority=None)
+        self.backend.update_not_prioritized(lambda: 7)
+
+        queued = QueuedVerification.get()
+        assert queued.priority == 7
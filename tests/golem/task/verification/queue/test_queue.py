@@ -3,6 +3,7 @@
 # ^^ Pytest fixtures in the same file require the same name
 
 import asyncio
+from collections import Counter
 from unittest import mock
 
 import pytest
@@ -10,6 +11,7 @@ from golem_task_api.enums import VerifyResult
 
 from golem.task import SubtaskId, TaskId
 from golem.task.verification.queue import VerificationQueue
+from golem.task.verification.queue.backend import QueueBackend
 from golem.testutils import pytest_database_fixture  # noqa pylint: disable=unused-import
 from tests.utils.asyncio import AsyncMock
 
@@ -205,3 +207,102 @@ class TestPause:
 
         await self.queue.resume()
         assert not self.queue._paused
+
+
+class ListQueueBackend(QueueBackend):
+
+    def __init__(self):
+        self.items = []
+
+    def put(self, task_id, subtask_id, priority):
+        self.items.append((task_id, subtask_id))
+        return True
+
+    def get(self, exclude_tasks=()):
+        for item in self.items:
+            if item[0] not in exclude_tasks:
+                self.items.remove(item)
+                return item
+        return None
+
+    def update_not_prioritized(self, priority_fn):
+        pass
+
+
+class TestConcurrency:
+
+    @pytest.fixture(autouse=True)
+    def setup_method(self, event_loop):  # fixture: use the same event loop
+        self.running = Counter()
+        self.max_running = Counter()
+
+    async def verify_fn(
+            self,
+            task_id: TaskId,
+            _subtask_id: SubtaskId
+    ) -> VerifyResult:
+        self.running[task_id] += 1
+        self.running['all'] += 1
+        self.max_running[task_id] = max(
+            self.max_running[task_id], self.running[task_id])
+        self.max_running['all'] = max(
+            self.max_running['all'], self.running['all'])
+        await asyncio.sleep(0.01)
+        self.running[task_id] -= 1
+        self.running['all'] -= 1
+        return VerifyResult.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_workers(self):
+        queue = VerificationQueue(
+            self.verify_fn, backend=ListQueueBackend(), workers=3)
+        results = [queue.put(f"{TASK_ID}{i}", SUBTASK_ID) for i in range(7)]
+
+        await asyncio.gather(*results)
+        assert self.max_running['all'] == 3
+        assert not queue._active
+
+    @pytest.mark.asyncio
+    async def test_max_per_task(self):
+        queue = VerificationQueue(
+            self.verify_fn,
+            backend=ListQueueBackend(),
+            workers=4,
+            max_per_task=2)
+        results = [
+            queue.put(TASK_ID, f"{SUBTASK_ID}{i}") for i in range(5)
+        ] + [
+            queue.put(f"{TASK_ID}2", f"{SUBTASK_ID}{i}") for i in range(5)
+        ]
+
+        await asyncio.gather(*results)
+        assert self.max_running[TASK_ID] == 2
+        assert self.max_running[f"{TASK_ID}2"] == 2
+        assert self.max_running['all'] == 4
+
+    @pytest.mark.asyncio
+    async def test_deep_queue(self):
+        async def verify_now(_task_id, _subtask_id):
+            return VerifyResult.SUCCESS
+
+        backend = ListQueueBackend()
+        queue = VerificationQueue(verify_now, backend=backend)
+        for i in range(5000):
+            backend.put(TASK_ID, f"{SUBTASK_ID}{i}", priority=i)
+
+        await queue.process()
+        assert not backend.items
+
+    @pytest.mark.asyncio
+    async def test_pause_waits_for_all_workers(self):
+        queue = VerificationQueue(
+            self.verify_fn, backend=ListQueueBackend(), workers=2)
+        results = [queue.put(f"{TASK_ID}{i}", SUBTASK_ID) for i in range(4)]
+        await asyncio.sleep(0.001)
+
+        await queue.pause()
+        assert sum(future.done() for future in results) == 2
+        assert not queue._active
+
+        await queue.resume()
+        assert all(future.done() for future in results)
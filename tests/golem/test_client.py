@@ -1,4 +1,5 @@
 # pylint: disable=protected-access,too-many-lines,no-member
+import datetime
 import os
 import time
 import uuid
@@ -6,6 +7,7 @@ from random import Random
 from unittest import TestCase
 from unittest.mock import (
     ANY,
+    call,
     create_autospec,
     MagicMock,
     Mock,
@@ -27,9 +29,9 @@ from golem.appconfig import (
 )
 from golem.client import Client, ClientTaskComputerEventListener, \
     DoWorkService, MonitoringPublisherService, \
-    NetworkConnectionPublisherService, \
+    NetworkConnectionPublisherService, NodesKeeperService, \
     ResourceCleanerService, TaskArchiverService, \
-    TaskCleanerService
+    TaskCleanerService, TASK_DICT_CACHE_TTL
 from golem.clientconfigdescriptor import ClientConfigDescriptor
 from golem.config.active import EthereumConfig
 from golem.core.common import datetime_to_timestamp_utc, timeout_to_string, \
@@ -41,7 +43,7 @@ from golem.manager.nodestatesnapshot import ComputingSubtaskStateSnapshot
 from golem.network.p2p.peersession import PeerSessionInfo
 from golem.report import StatusPublisher
 from golem.resource.dirmanager import DirManager
-from golem.rpc.mapping.rpceventnames import UI, Environment, Golem
+from golem.rpc.mapping.rpceventnames import UI, Environment, Golem, Task
 from golem.task import taskstate
 from golem.task.acl import Acl
 from golem.task.requestedtaskmanager import RequestedTaskManager
@@ -484,6 +486,79 @@ class TestGetTasks(TestClientBase):
         assert isinstance(retrieved_tasks, list)
         assert not retrieved_tasks
 
+    def test_get_tasks_page(self):
+        self.client.get_task = lambda task_id: self.tasks[task_id]
+        all_tasks = self.client.get_tasks()
+        self.assertEqual(
+            self.client.get_tasks(offset=1, limit=2),
+            all_tasks[1:3],
+        )
+        self.assertEqual(self.client.get_tasks(offset=4), all_tasks[4:])
+        self.assertEqual(self.client.get_tasks(offset=10, limit=2), [])
+
+    def test_get_tasks_statuses(self):
+        self.client.get_task = lambda task_id: self.tasks[task_id]
+        statuses = [TaskStatus.aborted.value, TaskStatus.finished.value]
+        retrieved_tasks = self.client.get_tasks(statuses=statuses)
+        self.assertEqual(len(retrieved_tasks), 2)
+        for task in retrieved_tasks:
+            self.assertIn(task['status'], statuses)
+
+
+class TestGetTaskCache(TestClientBase):
+
+    def setUp(self):
+        super().setUp()
+        self.client._build_task_dict = Mock(
+            side_effect=lambda task_id: {
+                'id': task_id,
+                'status': self.status.value,
+            },
+        )
+        self.status = TaskStatus.finished
+
+    def test_completed_task_cached(self):
+        first = self.client.get_task('task_id')
+        second = self.client.get_task('task_id')
+        self.assertEqual(first, second)
+        self.client._build_task_dict.assert_called_once_with('task_id')
+
+    def test_active_task_not_cached(self):
+        self.status = TaskStatus.computing
+        self.client.get_task('task_id')
+        self.client.get_task('task_id')
+        self.assertEqual(self.client._build_task_dict.call_count, 2)
+
+    def test_cached_dict_not_shared(self):
+        self.client.get_task('task_id')['status'] = 'changed'
+        self.assertEqual(
+            self.client.get_task('task_id')['status'],
+            TaskStatus.finished.value,
+        )
+
+    def test_invalidated_on_task_update(self):
+        self.client.get_task('task_id')
+        self.status = TaskStatus.restarted
+        self.client.taskmanager_listener(
+            sender=None,
+            signal='golem.taskmanager',
+            event='task_status_updated',
+            task_id='task_id',
+            op=taskstate.TaskOp.RESTARTED,
+        )
+        self.assertEqual(
+            self.client.get_task('task_id')['status'],
+            TaskStatus.restarted.value,
+        )
+
+    def test_expires(self):
+        with freeze_time() as frozen_time:
+            self.client.get_task('task_id')
+            frozen_time.tick(delta=datetime.timedelta(
+                seconds=TASK_DICT_CACHE_TTL + 1))
+            self.client.get_task('task_id')
+        self.assertEqual(self.client._build_task_dict.call_count, 2)
+
 
 class TestClientRestartSubtasks(TestClientBase):
 
@@ -644,6 +719,22 @@ class TestTaskArchiverService(testwithreactor.TestWithReactor):
         self.task_archiver.do_maintenance.assert_called()
 
 
+@patch('golem.client.nodeskeeper.flush')
+class TestNodesKeeperService(testwithreactor.TestWithReactor):
+
+    def setUp(self):
+        self.service = NodesKeeperService()
+
+    def test_run(self, flush):
+        self.service._run()
+        flush.assert_called_once_with()
+
+    def test_stop(self, flush):
+        self.service.start(now=False)
+        self.service.stop()
+        flush.assert_called_once_with()
+
+
 class TestResourceCleanerService(testwithreactor.TestWithReactor):
 
     def setUp(self):
@@ -885,6 +976,81 @@ class TestClientRPCMethods(TestClientBase, LogTestCase):
         c.config_changed()
         rpc_session.publish.assert_called_with(Environment.evt_opts_changed)
 
+    def test_publish_coalesced(self, *_):
+        from golem.rpc.session import Publisher
+
+        c = self.client
+        # No publisher yet
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 1)
+
+        rpc_session = Mock()
+        c.set_rpc_publisher(Publisher(rpc_session))
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 1)
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 2)
+        rpc_session.publish.assert_not_called()
+
+        c._event_coalescer.flush()
+        rpc_session.publish.assert_called_once_with(
+            Task.evt_task_status_batch, [('t1', 'a', 2)])
+
+    def test_publish_coalesced_legacy_topics(self, *_):
+        from golem.rpc.session import Publisher
+
+        c = self.client
+        c.config_desc.legacy_event_topics = 1
+        rpc_session = Mock()
+        c.set_rpc_publisher(Publisher(rpc_session))
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 1)
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 2)
+        self.assertEqual(
+            rpc_session.publish.call_args_list,
+            [
+                call(Task.evt_task_status, 't1', 'a', 1),
+                call(Task.evt_task_status, 't1', 'a', 2),
+            ],
+        )
+
+        c._event_coalescer.flush()
+        rpc_session.publish.assert_called_with(
+            Task.evt_task_status_batch, [('t1', 'a', 2)])
+
+    def test_event_batch_windows_from_config(self, *_):
+        from golem.rpc.session import Publisher
+
+        c = self.client
+        c.config_desc.task_events_batch_window = 2.0
+        c.config_desc.subtask_events_batch_window = 0.1
+        c.set_rpc_publisher(Publisher(Mock()))
+        self.assertEqual(
+            c._event_coalescer.windows,
+            {Task.evt_task_status: 2.0, Task.evt_subtask_status: 0.1},
+        )
+
+        config_desc = ClientConfigDescriptor()
+        config_desc.legacy_event_topics = 1
+        config_desc.subtask_events_batch_window = 1.0
+        with patch.object(c, 'app_config'):
+            c.change_config(config_desc)
+        assert c._event_coalescer.legacy_topics
+        assert c._event_coalescer.windows[Task.evt_subtask_status] == 1.0
+
+    def test_stop_flushes_coalesced_events(self, *_):
+        from golem.rpc.session import Publisher
+
+        c = self.client
+        rpc_session = Mock()
+        c.set_rpc_publisher(Publisher(rpc_session))
+        c._publish_coalesced(Task.evt_task_status, ('t1', None), 't1', 'a', 1)
+
+        c._services = []
+        with patch.object(c, 'stop_network'), \
+                patch.object(c, 'concent_service'), \
+                patch.object(c, 'concent_filetransfers'), \
+                patch.object(c, 'task_server'):
+            c.stop()
+        rpc_session.publish.assert_called_once_with(
+            Task.evt_task_status_batch, [('t1', 'a', 1)])
+
     def test_test_status(self, *_):
         c = self.client
 
@@ -1141,6 +1307,10 @@ class TestClientRPCMethods(TestClientBase, LogTestCase):
             'frames': [1],
             'start_task': start_task,
             'total_tasks': 1,
+            'reserved_cores': 1,
+            'reserved_memory_mb': 0,
+            'free_cores': 0,
+            'free_memory_mb': None,
         }
         task_computer.get_progress.return_value = \
             ComputingSubtaskStateSnapshot(**state_snapshot_dict)